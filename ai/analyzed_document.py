@@ -0,0 +1,42 @@
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class AnalyzedDocument:
+
+    def __init__(self, text: str, sentences: list[str], words: list[str]):
+        """
+        Initialize a new AnalyzedDocument instance, the result of the single NLP analysis of a text shared by the
+        truthfulness and topic models (the text is segmented and tokenized once for both of them).
+        The instance is never modified afterwards and can be shared by concurrent threads.
+        :param text: analyzed text
+        :param sentences: sentences of the text worth scoring by the truthfulness model
+        :param words: word tokens of the whole text consumed by the topic model (same tokens as nltk.word_tokenize)
+        """
+        self.text = text
+        self.sentences = sentences
+        self.words = words
+
+    def get_text(self) -> str:
+        """
+        Return the analyzed text.
+        :return: the analyzed text
+        """
+        return self.text
+
+    def get_sentences(self) -> list[str]:
+        """
+        Return the sentences of the text worth scoring by the truthfulness model.
+        :return: the sentences of the text, in their original order
+        """
+        return self.sentences
+
+    def get_words(self) -> list[str]:
+        """
+        Return the word tokens of the whole text consumed by the topic model.
+        :return: the word tokens of the text, in their original order
+        """
+        return self.words
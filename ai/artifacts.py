@@ -0,0 +1,312 @@
+import hashlib
+import json
+import os
+import pickle
+from typing import Optional
+
+import numpy as np
+from gensim import models
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.pipeline import Pipeline
+
+from ai import linear_scorer as ls
+from ai.linear_scorer import LinearScorer
+from services import constants_service as ct
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class MappedVocabulary:
+
+    def __init__(self, hashes: np.ndarray, hash_indexes: np.ndarray, terms: np.ndarray, offsets: np.ndarray):
+        """
+        Initialize a new MappedVocabulary instance, a read-only term to index mapping stored in flat arrays
+        (usually memory-mapped, so that every process shares the same physical pages) instead of a Python dict.
+        :param hashes: sorted 64 bits hashes of the terms
+        :param hash_indexes: index of the term of each hash
+        :param terms: UTF-8 encoded terms, concatenated in index order
+        :param offsets: start offset of each term in the terms array, followed by the terms array length
+        """
+        self.hashes = hashes
+        self.hash_indexes = hash_indexes
+        self.terms = terms
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        """
+        Return the term of the provided index (like the id2word mapping of a gensim model).
+        :param index: term index
+        :return: the term
+        """
+        return self.get_encoded_term(index).decode('utf-8')
+
+    def get_encoded_term(self, index: int) -> bytes:
+        """
+        Return the UTF-8 encoded term of the provided index.
+        :param index: term index
+        :return: the encoded term
+        """
+        return self.terms[self.offsets[index]:self.offsets[index + 1]].tobytes()
+
+    def get_indexes(self, terms: list[str]) -> np.ndarray:
+        """
+        Return the index of each provided term belonging to the vocabulary (the unknown terms are skipped).
+        :param terms: provided terms
+        :return: the indexes of the known terms, in the same order as the provided terms
+        """
+        if len(terms) == 0 or len(self.hashes) == 0:
+            return np.empty(0, dtype=np.int64)
+        encoded_terms = [term.encode('utf-8') for term in terms]
+        hashes = get_terms_hashes(encoded_terms)
+        positions = np.minimum(np.searchsorted(self.hashes, hashes), len(self.hashes) - 1)
+        found = np.flatnonzero(self.hashes[positions] == hashes)
+        indexes = self.hash_indexes[positions[found]].astype(np.int64)
+        # A hash match is confirmed by comparing the terms themselves, so that a hash collision never adds a feature
+        matches = np.fromiter((self.get_encoded_term(index) == encoded_terms[position]
+                               for position, index in zip(found, indexes)), dtype=bool, count=len(found))
+        return indexes[matches]
+
+    def doc2bow(self, tokens: list[str]) -> list[tuple[int, int]]:
+        """
+        Return the bag of words of the provided tokens (same output as the doc2bow method of a gensim Dictionary).
+        :param tokens: provided tokens
+        :return: the (token index, token count) list of the known tokens, sorted by index
+        """
+        indexes, counts = np.unique(self.get_indexes(tokens), return_counts=True)
+        return list(zip(indexes.tolist(), counts.tolist()))
+
+
+def get_artifacts_directory() -> str:
+    """
+    Return the directory of the memory-mapped model artifacts, read from its environment variable if set,
+    otherwise its default value.
+    :return: the model artifacts directory
+    """
+    return os.getenv(ct.get_artifacts_directory_env_variable_label(), ct.get_default_artifacts_directory())
+
+
+def get_pipeline_directory(artifacts_directory: Optional[str] = None) -> str:
+    """
+    Return the directory of the truthfulness pipeline artifacts.
+    :param artifacts_directory: model artifacts directory (the configured one if None)
+    :return: the pipeline artifacts directory
+    """
+    return os.path.join(artifacts_directory or get_artifacts_directory(), 'pipeline')
+
+
+def get_topic_model_directory(artifacts_directory: Optional[str] = None) -> str:
+    """
+    Return the directory of the topic model artifacts.
+    :param artifacts_directory: model artifacts directory (the configured one if None)
+    :return: the topic model artifacts directory
+    """
+    return os.path.join(artifacts_directory or get_artifacts_directory(), 'topic')
+
+
+def get_pickle_version(pickle_bytes: bytes) -> str:
+    """
+    Return the version of a pickled model: the beginning of its content hash.
+    :param pickle_bytes: content of the pickle file
+    :return: the model version
+    """
+    return hashlib.sha256(pickle_bytes).hexdigest()[:12]
+
+
+def get_terms_hashes(encoded_terms: list[bytes]) -> np.ndarray:
+    """
+    Return the 64 bits hash of each provided UTF-8 encoded term.
+    :param encoded_terms: provided encoded terms
+    :return: the array of hashes, in the same order as the provided terms
+    """
+    digests = b''.join(hashlib.blake2b(term, digest_size=8).digest() for term in encoded_terms)
+    return np.frombuffer(digests, dtype='<u8')
+
+
+def save_vocabulary(vocabulary: dict[str, int], directory: str, name: str):
+    """
+    Save the provided term to index mapping as the flat arrays of a MappedVocabulary.
+    :param vocabulary: term to index mapping (the indexes must go from 0 to the number of terms - 1)
+    :param directory: directory in which the arrays are saved
+    :param name: prefix of the arrays file names
+    """
+    terms = [None] * len(vocabulary)
+    for term, index in vocabulary.items():
+        terms[index] = term.encode('utf-8')
+    if any(term is None for term in terms):
+        raise ValueError(f'The {name} indexes must go from 0 to {len(vocabulary) - 1}')
+    hashes = get_terms_hashes(terms)
+    hash_indexes = np.argsort(hashes, kind='stable')
+    sorted_hashes = hashes[hash_indexes]
+    if len(sorted_hashes) > 1 and (sorted_hashes[1:] == sorted_hashes[:-1]).any():
+        raise ValueError(f'The {name} contains terms having the same hash')
+    offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+    np.cumsum([len(term) for term in terms], out=offsets[1:])
+    np.save(os.path.join(directory, f'{name}_hashes.npy'), sorted_hashes)
+    np.save(os.path.join(directory, f'{name}_hash_indexes.npy'), hash_indexes.astype(np.int32))
+    np.save(os.path.join(directory, f'{name}_terms.npy'), np.frombuffer(b''.join(terms), dtype=np.uint8))
+    np.save(os.path.join(directory, f'{name}_offsets.npy'), offsets)
+
+
+def load_vocabulary(directory: str, name: str) -> MappedVocabulary:
+    """
+    Return the MappedVocabulary saved in the provided directory, its arrays being memory-mapped read-only.
+    :param directory: directory in which the arrays were saved
+    :param name: prefix of the arrays file names
+    :return: the memory-mapped vocabulary
+    """
+    return MappedVocabulary(
+        hashes=np.load(os.path.join(directory, f'{name}_hashes.npy'), mmap_mode='r'),
+        hash_indexes=np.load(os.path.join(directory, f'{name}_hash_indexes.npy'), mmap_mode='r'),
+        terms=np.load(os.path.join(directory, f'{name}_terms.npy'), mmap_mode='r'),
+        offsets=np.load(os.path.join(directory, f'{name}_offsets.npy'), mmap_mode='r')
+    )
+
+
+def has_pipeline(directory: str) -> bool:
+    """
+    Return True if the provided directory contains a converted truthfulness pipeline, otherwise return False.
+    :param directory: pipeline artifacts directory
+    :return: True if the pipeline artifacts exist
+    """
+    return os.path.isfile(os.path.join(directory, 'scorer.json'))
+
+
+def get_pipeline_version(directory: str) -> str:
+    """
+    Return the version of the pipeline the artifacts saved in the provided directory were converted from.
+    :param directory: pipeline artifacts directory
+    :return: the pipeline version
+    """
+    with open(os.path.join(directory, 'scorer.json')) as f:
+        return json.load(f)['version']
+
+
+def save_pipeline(pipeline: Pipeline, version: str, directory: str):
+    """
+    Save the provided linear truthfulness pipeline as memory-mappable artifacts: its vocabulary, idf and
+    coefficients as flat arrays, its analyzer settings as a small pickle and its scalar settings as JSON.
+    :param pipeline: the fitted pipeline
+    :param version: version of the pipeline (kept so that the cached predictions stay valid)
+    :param directory: directory in which the artifacts are saved
+    """
+    scorer = ls.compile_pipeline(pipeline)
+    if scorer is None:
+        raise ValueError('Only the pipelines made of a text vectorizer and of a linear binary classifier '
+                         'can be converted')
+    vectorizer = ls.get_linear_steps(pipeline)[0]
+    os.makedirs(directory, exist_ok=True)
+    save_vocabulary(scorer.vocabulary, directory, 'vocabulary')
+    np.save(os.path.join(directory, 'coef.npy'), scorer.coef)
+    if scorer.idf is not None:
+        np.save(os.path.join(directory, 'idf.npy'), scorer.idf)
+    np.save(os.path.join(directory, 'classes.npy'), scorer.classes)
+    with open(os.path.join(directory, 'vectorizer.pkl'), 'wb') as f:
+        pickle.dump(get_analyzer_vectorizer(vectorizer), f)
+    # Written last: the pipeline artifacts only exist once complete
+    with open(os.path.join(directory, 'scorer.json'), 'w') as f:
+        json.dump({
+            'version': version,
+            'intercept': scorer.intercept,
+            'sublinear_tf': scorer.sublinear_tf,
+            'binary': scorer.binary,
+            'norm': scorer.norm,
+            'use_idf': scorer.idf is not None
+        }, f)
+
+
+def load_pipeline(directory: str) -> tuple[LinearScorer, str]:
+    """
+    Return the linear scorer saved in the provided directory (its arrays being memory-mapped read-only)
+    and the version of the pipeline it was converted from.
+    :param directory: pipeline artifacts directory
+    :return: the linear scorer and the pipeline version
+    """
+    with open(os.path.join(directory, 'scorer.json')) as f:
+        settings = json.load(f)
+    with open(os.path.join(directory, 'vectorizer.pkl'), 'rb') as f:
+        vectorizer = pickle.load(f)
+    scorer = LinearScorer(
+        analyzer=vectorizer.build_analyzer(),
+        vocabulary=load_vocabulary(directory, 'vocabulary'),
+        idf=np.load(os.path.join(directory, 'idf.npy'), mmap_mode='r') if settings['use_idf'] else None,
+        sublinear_tf=settings['sublinear_tf'],
+        binary=settings['binary'],
+        norm=settings['norm'],
+        coef=np.load(os.path.join(directory, 'coef.npy'), mmap_mode='r'),
+        intercept=settings['intercept'],
+        classes=np.load(os.path.join(directory, 'classes.npy'))
+    )
+    return scorer, settings['version']
+
+
+def get_analyzer_vectorizer(vectorizer: CountVectorizer) -> CountVectorizer:
+    """
+    Return an unfitted CountVectorizer having the analyzer settings of the provided vectorizer, which builds
+    the same analyzer without holding the fitted vocabulary.
+    :param vectorizer: the fitted vectorizer (CountVectorizer or TfidfVectorizer)
+    :return: the unfitted CountVectorizer
+    """
+    count_vectorizer_parameters = CountVectorizer().get_params()
+    return CountVectorizer(**{name: value for name, value in vectorizer.get_params().items()
+                              if name in count_vectorizer_parameters and name != 'vocabulary'})
+
+
+def has_topic_model(directory: str) -> bool:
+    """
+    Return True if the provided directory contains a converted topic model, otherwise return False.
+    :param directory: topic model artifacts directory
+    :return: True if the topic model artifacts exist
+    """
+    return os.path.isfile(os.path.join(directory, 'topic.json'))
+
+
+def get_topic_model_version(directory: str) -> str:
+    """
+    Return the version of the topic model the artifacts saved in the provided directory were converted from.
+    :param directory: topic model artifacts directory
+    :return: the topic model version
+    """
+    with open(os.path.join(directory, 'topic.json')) as f:
+        return json.load(f)['version']
+
+
+def save_topic_model(lda_model: models.LdaModel, dictionary, version: str, directory: str):
+    """
+    Save the provided topic model as memory-mappable artifacts: the gensim model with its large arrays
+    (topic-word matrix included) in separate files, and its dictionary as the flat arrays of a MappedVocabulary.
+    :param lda_model: the trained LDA model
+    :param dictionary: the gensim Dictionary of the LDA model
+    :param version: version of the topic model (kept so that the cached predictions stay valid)
+    :param directory: directory in which the artifacts are saved
+    """
+    os.makedirs(directory, exist_ok=True)
+    save_vocabulary(dictionary.token2id, directory, 'dictionary')
+    # The dictionary replaces the pickled id2word mapping of the model, every array is saved in its own file
+    # (LdaModel.save ignores sep_limit: only the listed attributes are saved separately)
+    arrays = [name for name, value in vars(lda_model).items() if isinstance(value, np.ndarray)]
+    lda_model.save(os.path.join(directory, 'lda_model'), ignore=('id2word',), separately=arrays)
+    # Written last: the topic model artifacts only exist once complete
+    with open(os.path.join(directory, 'topic.json'), 'w') as f:
+        json.dump({'version': version, 'num_topics': lda_model.num_topics, 'num_terms': lda_model.num_terms}, f)
+
+
+def load_topic_model(directory: str) -> tuple[models.LdaModel, MappedVocabulary, str]:
+    """
+    Return the topic model saved in the provided directory and its dictionary, their large arrays being
+    memory-mapped read-only, and the version of the topic model they were converted from.
+    :param directory: topic model artifacts directory
+    :return: the LDA model, its dictionary (providing the doc2bow method of a gensim Dictionary) and the version
+    """
+    with open(os.path.join(directory, 'topic.json')) as f:
+        settings = json.load(f)
+    dictionary = load_vocabulary(directory, 'dictionary')
+    lda_model = models.LdaModel.load(os.path.join(directory, 'lda_model'), mmap='r')
+    lda_model.id2word = dictionary
+    return lda_model, dictionary, settings['version']
+
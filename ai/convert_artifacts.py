@@ -0,0 +1,93 @@
+import os
+import pickle
+import shutil
+import timeit
+from typing import Optional
+
+from ai import artifacts as ma
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+def convert_pipeline(pickle_path: str, directory: str) -> bool:
+    """
+    Convert the pickled truthfulness pipeline into memory-mappable artifacts.
+    :param pickle_path: path of the pickled pipeline
+    :param directory: directory in which the artifacts are saved (replaced if it already exists)
+    :return: True if the pipeline was converted, False if it is not linear (the pickle must then be kept)
+    """
+    with open(pickle_path, 'rb') as f:
+        pickle_bytes = f.read()
+    pipeline = pickle.loads(pickle_bytes)
+    try:
+        _replace_directory(directory, lambda temporary_directory: ma.save_pipeline(
+            pipeline, ma.get_pickle_version(pickle_bytes), temporary_directory))
+    except ValueError as ex:
+        print(f'=> Pipeline not converted: {ex}')
+        return False
+    return True
+
+
+def convert_topic_model(dictionary_path: str, lda_model_path: str, directory: str):
+    """
+    Convert the pickled topic model and its dictionary into memory-mappable artifacts.
+    :param dictionary_path: path of the pickled gensim Dictionary
+    :param lda_model_path: path of the pickled LDA model
+    :param directory: directory in which the artifacts are saved (replaced if it already exists)
+    """
+    with open(dictionary_path, 'rb') as f:
+        dictionary_bytes = f.read()
+    with open(lda_model_path, 'rb') as f:
+        lda_model_bytes = f.read()
+    version = ma.get_pickle_version(dictionary_bytes + lda_model_bytes)
+    _replace_directory(directory, lambda temporary_directory: ma.save_topic_model(
+        pickle.loads(lda_model_bytes), pickle.loads(dictionary_bytes), version, temporary_directory))
+
+
+def _replace_directory(directory: str, save):
+    """
+    Save artifacts in a temporary directory, then replace the provided directory with it, so that a process
+    starting meanwhile never loads partially written artifacts.
+    :param directory: directory in which the artifacts are saved
+    :param save: function saving the artifacts in the directory it is given
+    """
+    temporary_directory = directory + '.tmp'
+    shutil.rmtree(temporary_directory, ignore_errors=True)
+    try:
+        save(temporary_directory)
+    except Exception:
+        shutil.rmtree(temporary_directory, ignore_errors=True)
+        raise
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(temporary_directory, directory)
+
+
+def run(pickle_directory: str = 'ai/pickle', artifacts_directory: Optional[str] = None):
+    """
+    Convert the pickled models found in the provided directory into the memory-mapped artifacts loaded by
+    ai/prediction_model.py and ai/topic_model.py.
+    :param pickle_directory: directory containing pipeline.pkl, dictionary_LDA.pkl and model_topic.pkl
+    :param artifacts_directory: model artifacts directory (the configured one if None)
+    """
+    pipeline_path = os.path.join(pickle_directory, 'pipeline.pkl')
+    if os.path.isfile(pipeline_path):
+        start = timeit.default_timer()
+        if convert_pipeline(pipeline_path, ma.get_pipeline_directory(artifacts_directory)):
+            print(f'=> Pipeline converted in {timeit.default_timer() - start:.2f}s')
+    else:
+        print(f'=> Pipeline not converted: {pipeline_path} not found')
+    dictionary_path = os.path.join(pickle_directory, 'dictionary_LDA.pkl')
+    lda_model_path = os.path.join(pickle_directory, 'model_topic.pkl')
+    if os.path.isfile(dictionary_path) and os.path.isfile(lda_model_path):
+        start = timeit.default_timer()
+        convert_topic_model(dictionary_path, lda_model_path, ma.get_topic_model_directory(artifacts_directory))
+        print(f'=> Topic model converted in {timeit.default_timer() - start:.2f}s')
+    else:
+        print(f'=> Topic model not converted: {dictionary_path} or {lda_model_path} not found')
+
+
+if __name__ == '__main__':
+    run()
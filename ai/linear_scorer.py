@@ -0,0 +1,152 @@
+from typing import Callable, Optional
+
+import numpy as np
+from sklearn.base import ClassifierMixin
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.pipeline import Pipeline
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class LinearScorer:
+
+    def __init__(self, analyzer: Callable[[str], list[str]], vocabulary, idf: Optional[np.ndarray],
+                 sublinear_tf: bool, binary: bool, norm: Optional[str], coef: np.ndarray, intercept: float,
+                 classes: np.ndarray):
+        """
+        Initialize a new LinearScorer instance, a compact NumPy equivalent of a fitted text vectorizer,
+        TF-IDF and linear binary classifier pipeline: token lookup, TF-IDF weights and dot product with the
+        classifier coefficients, without building any sparse matrix.
+        :param analyzer: the fitted vectorizer analyzer (text to n-grams)
+        :param vocabulary: the fitted vectorizer vocabulary (n-gram to feature index dict, or MappedVocabulary)
+        :param idf: the inverse document frequency of each feature (None if the idf weighting is disabled)
+        :param sublinear_tf: whether the term frequencies are replaced by 1 + log(tf)
+        :param binary: whether the term frequencies are replaced by 1
+        :param norm: the row normalization ("l1", "l2" or None)
+        :param coef: the classifier coefficient of each feature
+        :param intercept: the classifier intercept
+        :param classes: the classifier classes (negative class first)
+        """
+        self.analyzer = analyzer
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.sublinear_tf = sublinear_tf
+        self.binary = binary
+        self.norm = norm
+        self.coef = coef
+        self.intercept = intercept
+        self.classes = classes
+
+    def predict(self, texts: list[str]) -> np.ndarray:
+        """
+        Return the predicted class of each provided text (same output as the compiled pipeline predict method).
+        :param texts: provided texts
+        :return: the array of predicted classes, in the same order as the provided texts
+        """
+        scores = np.fromiter((self.decision_function(text) for text in texts), dtype=np.float64, count=len(texts))
+        return self.classes[(scores > 0).astype(int)]
+
+    def decision_function(self, text: str) -> float:
+        """
+        Return the classifier score of the provided text (positive for the positive class).
+        :param text: provided text
+        :return: the classifier score
+        """
+        indexes = self.get_indexes(self.analyzer(text))
+        if len(indexes) == 0:
+            return self.intercept
+        indexes, counts = np.unique(indexes, return_counts=True)
+        return self.get_weighted_score(indexes, counts)
+
+    def get_indexes(self, terms: list[str]) -> np.ndarray:
+        """
+        Return the feature index of each provided n-gram belonging to the vocabulary (the unknown ones are skipped).
+        :param terms: n-grams of a text
+        :return: the feature indexes of the known n-grams
+        """
+        vocabulary = self.vocabulary
+        if isinstance(vocabulary, dict):
+            return np.array([vocabulary[term] for term in terms if term in vocabulary], dtype=np.int64)
+        return vocabulary.get_indexes(terms)
+
+    def get_weighted_score(self, indexes: np.ndarray, counts: np.ndarray) -> float:
+        """
+        Return the classifier score of a text from the feature indexes of its n-grams and their counts.
+        :param indexes: sorted unique feature indexes of the text
+        :param counts: number of occurrences of each feature in the text
+        :return: the classifier score
+        """
+        values = np.ones(len(counts)) if self.binary else counts.astype(np.float64)
+        if self.sublinear_tf:
+            values = np.log(values) + 1
+        if self.idf is not None:
+            values *= self.idf[indexes]
+        if self.norm == 'l2':
+            norm = np.sqrt(np.dot(values, values))
+        elif self.norm == 'l1':
+            norm = np.abs(values).sum()
+        else:
+            norm = 0
+        if norm > 0:
+            values /= norm
+        return float(np.dot(values, self.coef[indexes])) + self.intercept
+
+
+def compile_pipeline(pipeline: Pipeline) -> Optional[LinearScorer]:
+    """
+    Return the LinearScorer equivalent to the provided fitted pipeline if it is made of a CountVectorizer (optionally
+    followed by a TfidfTransformer) or a TfidfVectorizer and of a linear binary classifier, otherwise return None
+    (the pipeline must then be used as is).
+    :param pipeline: the fitted pipeline
+    :return: the equivalent LinearScorer or None
+    """
+    steps = get_linear_steps(pipeline)
+    if steps is None:
+        return None
+    vectorizer, tf_idf, classifier = steps
+    return LinearScorer(
+        analyzer=vectorizer.build_analyzer(),
+        vocabulary=vectorizer.vocabulary_,
+        idf=np.asarray(tf_idf.idf_, dtype=np.float64) if tf_idf is not None and tf_idf.use_idf else None,
+        sublinear_tf=tf_idf is not None and tf_idf.sublinear_tf,
+        binary=vectorizer.binary,
+        norm=tf_idf.norm if tf_idf is not None else None,
+        coef=np.ascontiguousarray(classifier.coef_[0], dtype=np.float64),
+        intercept=float(np.ravel(classifier.intercept_)[0]),
+        classes=np.asarray(classifier.classes_)
+    )
+
+
+def get_linear_steps(pipeline: Pipeline) \
+        -> Optional[tuple[CountVectorizer, Optional[TfidfTransformer], ClassifierMixin]]:
+    """
+    Return the vectorizer, the TF-IDF step and the classifier of the provided fitted pipeline if it can be compiled
+    into a LinearScorer, otherwise return None.
+    :param pipeline: the fitted pipeline
+    :return: the (vectorizer, TF-IDF step or None, classifier) tuple (the TF-IDF step is the vectorizer itself for a
+    TfidfVectorizer) or None
+    """
+    if not isinstance(pipeline, Pipeline):
+        return None
+    steps = [step for _, step in pipeline.steps if step is not None and step != 'passthrough']
+    if len(steps) == 3 and isinstance(steps[1], TfidfTransformer) and not isinstance(steps[0], TfidfVectorizer):
+        vectorizer, tf_idf, classifier = steps
+    elif len(steps) == 2:
+        vectorizer, classifier = steps
+        tf_idf = vectorizer if isinstance(vectorizer, TfidfVectorizer) else None
+    else:
+        return None
+    # A linear classifier scores with its decision function, an affine function of the features (coef_ and
+    # intercept_): a naive Bayes classifier has no decision function and a kernel SVM has no coef_
+    if not isinstance(vectorizer, CountVectorizer) or not isinstance(classifier, ClassifierMixin) \
+            or not hasattr(classifier, 'decision_function') \
+            or not isinstance(getattr(classifier, 'coef_', None), np.ndarray) \
+            or getattr(classifier, 'intercept_', None) is None \
+            or len(getattr(classifier, 'classes_', [])) != 2 or classifier.coef_.shape[0] != 1:
+        return None
+    if tf_idf is not None and tf_idf.norm not in ['l1', 'l2', None]:
+        return None
+    return vectorizer, tf_idf, classifier
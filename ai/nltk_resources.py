@@ -0,0 +1,118 @@
+import os
+from typing import Optional
+
+import nltk
+
+from services import constants_service as ct
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+# NLTK packages required by the models, with the resource path of each one in an NLTK data directory.
+REQUIRED_RESOURCES = {
+    'stopwords': 'corpora/stopwords',
+    'wordnet': 'corpora/wordnet',
+    'omw-1.4': 'corpora/omw-1.4',
+    'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger',
+    'punkt': 'tokenizers/punkt'
+}
+
+
+class MissingNltkResourcesError(LookupError):
+
+    def __init__(self, missing_packages: list[str], data_directories: list[str]):
+        """
+        Initialize a new MissingNltkResourcesError instance, raised when required NLTK packages are not installed
+        in any searched NLTK data directory.
+        :param missing_packages: names of the missing NLTK packages
+        :param data_directories: searched NLTK data directories
+        """
+        self.missing_packages = missing_packages
+        self.data_directories = data_directories
+        super().__init__(f'Missing NLTK resources: {", ".join(missing_packages)} (searched in: '
+                         f'{", ".join(data_directories)}). Install them with: python -m ai.nltk_resources')
+
+
+# Whether the required resources were already verified by the current process.
+_verified = False
+
+
+def get_data_directory() -> Optional[str]:
+    """
+    Return the local NLTK data directory searched first, read from its environment variable if set,
+    otherwise None (only the default NLTK data directories are searched).
+    :return: the local NLTK data directory or None
+    """
+    return os.getenv(ct.get_nltk_data_directory_env_variable_label())
+
+
+def _add_data_directory():
+    """
+    Add the local NLTK data directory, if any, in front of the searched NLTK data directories.
+    """
+    data_directory = get_data_directory()
+    if data_directory is not None and data_directory not in nltk.data.path:
+        nltk.data.path.insert(0, data_directory)
+
+
+def get_missing_packages() -> list[str]:
+    """
+    Return the name of each required NLTK package which cannot be found in the searched NLTK data directories
+    (only the local filesystem is searched, never the network).
+    :return: the names of the missing NLTK packages
+    """
+    _add_data_directory()
+    return [package for package, resource_path in REQUIRED_RESOURCES.items() if not _is_installed(resource_path)]
+
+
+def _is_installed(resource_path: str) -> bool:
+    """
+    Return True if the provided NLTK resource is found in a searched NLTK data directory, extracted or zipped,
+    otherwise return False.
+    :param resource_path: resource path in an NLTK data directory
+    :return: True if the resource is installed
+    """
+    for path in [resource_path, resource_path + '.zip']:
+        try:
+            nltk.data.find(path)
+            return True
+        except LookupError:
+            pass
+    return False
+
+
+def ensure_resources():
+    """
+    Verify once per process that every required NLTK package is installed locally, replacing the nltk.download
+    calls at import time (which access the network at every boot).
+    :raise MissingNltkResourcesError: if some required NLTK packages are missing
+    """
+    global _verified
+    if _verified:
+        return
+    missing_packages = get_missing_packages()
+    if len(missing_packages) > 0:
+        raise MissingNltkResourcesError(missing_packages, list(nltk.data.path))
+    _verified = True
+
+
+def download_missing_packages():
+    """
+    Download the missing required NLTK packages in the local NLTK data directory (or in the default NLTK one),
+    to run once when building the application, not when serving it.
+    """
+    missing_packages = get_missing_packages()
+    for package in missing_packages:
+        nltk.download(package, download_dir=get_data_directory(), quiet=True)
+    still_missing_packages = get_missing_packages()
+    if len(still_missing_packages) > 0:
+        raise MissingNltkResourcesError(still_missing_packages, list(nltk.data.path))
+    print(f'=> NLTK resources installed: {", ".join(REQUIRED_RESOURCES)} '
+          f'(downloaded: {", ".join(missing_packages) or "none"})')
+
+
+if __name__ == '__main__':
+    download_missing_packages()
@@ -0,0 +1,61 @@
+import os
+import threading
+from typing import Optional
+
+from nltk.tag.perceptron import PerceptronTagger
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+# Process-wide averaged perceptron tagger. nltk.pos_tag looks the tagger up on every call (and reads its weights
+# from disk on the first one), so a single instance is loaded once and reused by every inference path instead.
+_tagger: Optional[PerceptronTagger] = None
+
+_tagger_lock = threading.Lock()
+
+
+def _reset_lock():
+    """
+    Replace the tagger lock by a released one, in a process just forked from the one using it (a lock held by
+    another thread at fork time would never be released in the forked process).
+    """
+    global _tagger_lock
+    _tagger_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_lock)
+
+
+def get_tagger() -> PerceptronTagger:
+    """
+    Return the process-wide position tagger, loading its weights from disk the first time only.
+    :return: the process-wide averaged perceptron tagger
+    """
+    global _tagger
+    if _tagger is None:
+        with _tagger_lock:
+            if _tagger is None:  # Another thread may have loaded it while this one was waiting for the lock
+                _tagger = PerceptronTagger()
+    return _tagger
+
+
+def tag(tokens: list[str]) -> list[tuple[str, str]]:
+    """
+    Return the provided tokens along with their position tag (same output as nltk.pos_tag).
+    :param tokens: provided tokens to tag
+    :return: the list of (token, position tag) tuples
+    """
+    return get_tagger().tag(tokens)
+
+
+def tag_many(token_lists: list[list[str]]) -> list[list[tuple[str, str]]]:
+    """
+    Return each provided token list along with the position tag of each token, all lists being tagged in bulk
+    by the same tagger instance.
+    :param token_lists: provided token lists to tag (one list per sentence)
+    :return: the list of tagged token lists, in the same order as the provided token lists
+    """
+    return get_tagger().tag_sents(token_lists)
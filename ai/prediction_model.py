@@ -1,79 +1,205 @@
+import os
 import timeit
-from nltk.stem import WordNetLemmatizer
-from nltk import pos_tag
-from nltk.corpus import stopwords
-from nltk.corpus import wordnet
 import pickle
-import string
+from typing import Any, Optional
+from ai import artifacts as ma
+from ai.analyzed_document import AnalyzedDocument
+from ai import linear_scorer as ls
+from ai import nltk_resources
+from ai import pos_tagger
+from ai import text_preprocessor as tp
+from ai.text_preprocessor import TextPreprocessor
+from services import cache_service as cs
 from services import constants_service as ct
 import nltk
-nltk.download('stopwords')
-nltk.download('averaged_perceptron_tagger')
-nltk.download('wordnet')
-nltk.download('omw-1.4')
-nltk.download('punkt')
 import gc
 
 
 # Enable automatic garbage collection
 gc.enable()
 
-start = timeit.default_timer()
+# Verify the required NLTK resources are installed locally (never downloaded at import time).
+nltk_resources.ensure_resources()
 
-with open('ai/pickle/pipeline.pkl', 'rb') as f:
+
+def load_predictor(pickle_path: str = 'ai/pickle/pipeline.pkl', pipeline_directory: Optional[str] = None) \
+        -> tuple[Any, str]:
     """
-    Load the pickle-format serialized model.
+    Load the truthfulness pipeline from its converted artifacts if they exist and were converted from its pickle
+    (or if the pickle is not deployed), otherwise from its pickle.
+    :param pickle_path: path of the pickled pipeline
+    :param pipeline_directory: directory of the pipeline artifacts (the configured one if None)
+    :return: the predictor (the compiled linear scorer if possible, otherwise the sklearn pipeline) and the version
+    of the loaded model, used to key anything derived from its predictions
     """
-    pipeline = pickle.load(f)
+    start = timeit.default_timer()
+    pipeline_directory = pipeline_directory or ma.get_pipeline_directory()
+    pipeline_bytes = None
+    if os.path.isfile(pickle_path):
+        with open(pickle_path, 'rb') as f:
+            pipeline_bytes = f.read()
+    # Version of the pickled model: content hash of its pickle
+    version = ma.get_pickle_version(pipeline_bytes) if pipeline_bytes is not None else None
+    if ma.has_pipeline(pipeline_directory):
+        # Converted artifacts (see ai/convert_artifacts.py): the vocabulary, idf and coefficients are memory-mapped
+        # read-only, so every gunicorn worker shares the same physical pages instead of its own unpickled copy.
+        # They are only served if converted from the deployed pickle (a retrained one must be converted again).
+        if version is None or ma.get_pipeline_version(pipeline_directory) == version:
+            del pipeline_bytes
+            scorer, version = ma.load_pipeline(pipeline_directory)
+            stop = timeit.default_timer()
+            print('=> Artifacts Loaded in: ', stop - start)
+            return scorer, version
+        print('=> Artifacts outdated, pickle loaded instead: ', pickle_path)
+    if pipeline_bytes is None:
+        raise FileNotFoundError(f'Model pickle not found: {pickle_path}')
+    # Load the pickle-format serialized model.
+    pipeline = pickle.loads(pipeline_bytes)
+    del pipeline_bytes
     stop = timeit.default_timer()
     print('=> Pickle Loaded in: ', stop - start)
+    # Compact NumPy equivalent of the loaded pipeline, used to predict without the sklearn per-call overhead.
+    # The pipeline itself is used if it cannot be compiled (e.g. non-linear classifier).
+    scorer = ls.compile_pipeline(pipeline)
+    print('=> Prediction path: ', 'NumPy linear scorer' if scorer is not None else 'sklearn pipeline')
+    return (scorer if scorer is not None else pipeline), version
+
+
+# Predictor and version loaded at import time, used by default by every PredictionModel instance.
+loaded_predictor, loaded_pipeline_version = load_predictor()
+
+# Pre-processing engine, built once at load time and shared by every prediction.
+preprocessor = TextPreprocessor()
+cs.register_cache('lemma', preprocessor.lemmatizer.cache)
+
+
+def is_exact_pos_tagging_compatibility() -> bool:
+    """
+    Return True if the position tagged words are computed exactly like the training notebook did, as set by its
+    environment variable (enabled unless set to "0", "false" or "no"), otherwise return False.
+    :return: True if the exact position tagging compatibility is enabled
+    """
+    return os.getenv(ct.get_exact_pos_tagging_env_variable_label(),
+                     str(ct.get_default_exact_pos_tagging_compatibility())).lower() not in ['0', 'false', 'no']
 
 
 class PredictionModel:
+    """
+    Stateless truthfulness model: every method only depends on its arguments and on the read-only loaded
+    pipeline, so a single instance can safely be shared by concurrent requests (threads included).
+    """
 
-    def __init__(self):
+    def __init__(self, exact_compatibility: Optional[bool] = None, predictor: Any = None,
+                 pipeline_version: Optional[str] = None):
         """
         Initialize a new PredictionModel instance.
-        :param text: user text entry
+        :param exact_compatibility: whether the position tagged words are computed exactly like the training notebook
+        (second tokenization and tagging pass over the pre-processed text) or reuse the pre-processing tags (read from
+        its environment variable if None, see the is_exact_pos_tagging_compatibility function)
+        :param predictor: predictor returned by load_predictor (the one loaded at import time if None)
+        :param pipeline_version: version of the provided predictor (the one loaded at import time if None)
         """
-        self.text = None
-        self.output = None
+        self.exact_compatibility = exact_compatibility if exact_compatibility is not None \
+            else is_exact_pos_tagging_compatibility()
+        self.predictor = predictor if predictor is not None else loaded_predictor
+        self.pipeline_version = pipeline_version if pipeline_version is not None else loaded_pipeline_version
 
-    def predict(self) -> str:
+    def get_version(self) -> str:
         """
-        Return REAL if the user text entry was labeled as truthful, else return FAKE.
-        :return: REAL if the user text entry was labeled as truthful, else return FAKE.
+        Return the version of the model predictions: the loaded pipeline version and the features mode.
+        Anything derived from the predictions (e.g. cached labels) must be keyed by it.
+        :return: the model version
         """
-        self.output = {'original': self.text}
-        clean_and_pos_tagged_text = self.get_clean_and_pos_tagged_text()
-        self.output['prediction'] = \
-            ct.get_wrongness_label() if pipeline.predict([clean_and_pos_tagged_text])[0] == 0 \
-                else ct.get_truthfulness_label()
-        return self.output['prediction']
+        return self.pipeline_version + ('-exact' if self.exact_compatibility else '-single')
 
-    def get_clean_and_pos_tagged_text(self) -> str:
+    def predict(self, text: str) -> str:
         """
-        Return the pre-processed user text entry with stop word removal, lemmatization and position tags.
+        Return REAL if the provided text was labeled as truthful, else return FAKE.
+        :param text: provided text to analyze
+        :return: REAL if the provided text was labeled as truthful, else return FAKE.
         """
-        self.preprocess()
-        self.pos_tag_words()
-        clean_and_pos_tagged_text = self.output['preprocessed'] + ' ' + self.output['pos_tagged'] # Merge text
-        return clean_and_pos_tagged_text
+        return self.predict_many([text])[0]
 
-    def preprocess(self):
+    def predict_many(self, texts: list[str]) -> list[str]:
         """
-        Apply lower case, word filtering, tokenization, stop word removal and position tags to the user entry text.
+        Return the truthfulness label of each provided text. All the texts are pre-processed first and then
+        sent together to the predictor, which predicts them in one call.
+        :param texts: provided texts to analyze
+        :return: the list of REAL or FAKE labels, in the same order as the provided texts
         """
-        text = str(self.output['original']).lower() # lowercase the text
-        text = [t for t in text.split(' ') if len(t) > 1] # remove the words counting just one letter
-        text = [word for word in text if not any(c.isdigit() for c in word)] # remove the words that contain numbers
-        text = [word.strip(string.punctuation) for word in text] # tokenize the text and remove puncutation
-        stop = stopwords.words('english') # remove all stop words
-        text = [x for x in text if x not in stop]
-        text = [t for t in text if len(t) > 0] # remove tokens that are empty
-        pos_tags = pos_tag(text) # pos tag the text
-        text = [WordNetLemmatizer().lemmatize(t[0], self.get_wordnet_pos(t[1])) for t in pos_tags]
-        self.output['preprocessed'] = ' '.join(text) # join all
+        return self.predict_features(self.get_clean_and_pos_tagged_texts(texts))
+
+    def predict_features(self, clean_and_pos_tagged_texts: list[str]) -> list[str]:
+        """
+        Return the truthfulness label of each provided feature text (already pre-processed and position tagged),
+        all of them being predicted in a single call by the compiled linear scorer if available, otherwise by the
+        sklearn pipeline (both give the same predictions).
+        :param clean_and_pos_tagged_texts: texts returned by the get_clean_and_pos_tagged_texts method
+        :return: the list of REAL or FAKE labels, in the same order as the provided feature texts
+        """
+        if len(clean_and_pos_tagged_texts) == 0:
+            return []
+        predictions = self.predictor.predict(clean_and_pos_tagged_texts)
+        return [self.get_label(prediction) for prediction in predictions]
+
+    def get_sentences(self, text: str) -> list[str]:
+        """
+        Return the sentences of the provided text worth scoring (punkt segmentation without the fragments
+        having no token left once pre-processed).
+        :param text: provided text to segment
+        :return: the sentences of the provided text
+        """
+        return preprocessor.segment(text)
+
+    def analyze(self, text: str) -> AnalyzedDocument:
+        """
+        Return the analysis of the provided text shared by the truthfulness and topic models (sentences worth
+        scoring and word tokens, from a single sentence segmentation).
+        :param text: provided text to analyze
+        :return: the analyzed document
+        """
+        return preprocessor.analyze(text)
+
+    def get_label(self, prediction: int) -> str:
+        """
+        Return the truthfulness label associated with the provided pipeline prediction.
+        :param prediction: encoded pipeline prediction (0 for fake news, 1 for truthful news)
+        :return: FAKE if the prediction equals 0, else REAL
+        """
+        return ct.get_wrongness_label() if prediction == 0 else ct.get_truthfulness_label()
+
+    def get_clean_and_pos_tagged_text(self, text: str) -> str:
+        """
+        Return the pre-processed provided text with stop word removal, lemmatization and position tags.
+        :param text: provided text to analyze
+        :return: the pre-processed text followed by its position tagged words
+        """
+        return self.get_clean_and_pos_tagged_texts([text])[0]
+
+    def get_clean_and_pos_tagged_texts(self, texts: list[str]) -> list[str]:
+        """
+        Return each pre-processed provided text with stop word removal, lemmatization and position tags.
+        The texts are position tagged in bulk.
+        :param texts: provided texts to analyze
+        :return: the pre-processed texts followed by their position tagged words, in the same order as the texts
+        """
+        lemma_tags_list = preprocessor.tag_many(texts)
+        preprocessed_texts = [' '.join([lemma for lemma, _ in lemma_tags]) for lemma_tags in lemma_tags_list]
+        if self.exact_compatibility:
+            pos_tagged_texts = self.pos_tag_words_many(preprocessed_texts)
+        else:
+            pos_tagged_texts = [' '.join([pos + '-' + lemma for lemma, pos in lemma_tags])
+                                for lemma_tags in lemma_tags_list]
+        return [preprocessed_text + ' ' + pos_tagged_text  # Merge text
+                for preprocessed_text, pos_tagged_text in zip(preprocessed_texts, pos_tagged_texts)]
+
+    def preprocess(self, text: str) -> str:
+        """
+        Apply lower case, word filtering, tokenization, stop word removal and position tags to the provided text.
+        :param text: provided text to pre-process
+        :return: the pre-processed text
+        """
+        return preprocessor.preprocess(text)
 
     def get_wordnet_pos(self, pos_tag:str) -> str:
         """
@@ -81,28 +207,21 @@ class PredictionModel:
         :param pos_tag: provided word position tag.
         :return:
         """
-        if pos_tag.startswith('J'):
-            return wordnet.ADJ
-        elif pos_tag.startswith('V'):
-            return wordnet.VERB
-        elif pos_tag.startswith('N'):
-            return wordnet.NOUN
-        elif pos_tag.startswith('R'):
-            return wordnet.ADV
-        else:
-            return wordnet.NOUN
+        return tp.get_wordnet_pos(pos_tag)
 
-    def pos_tag_words(self):
+    def pos_tag_words(self, preprocessed_text: str) -> str:
         """
-        Apply position tags to each word of the user entry text.
+        Apply position tags to each word of the provided pre-processed text.
+        :param preprocessed_text: text returned by the preprocess method
+        :return: the text with each word prefixed by its position tag
         """
-        pos_text = nltk.pos_tag(nltk.word_tokenize(self.output['preprocessed']))
-        self.output['pos_tagged'] = ' '.join(
-            [pos + '-' + word for word, pos in pos_text])
+        return self.pos_tag_words_many([preprocessed_text])[0]
 
-    def set_text(self, text: str):
+    def pos_tag_words_many(self, preprocessed_texts: list[str]) -> list[str]:
         """
-        Set the model's text material from which to extract truthfulness label.
-        :param text: provided text to analyze
+        Apply position tags to each word of the provided pre-processed texts, all texts being tagged in bulk.
+        :param preprocessed_texts: texts returned by the preprocess method
+        :return: the texts with each word prefixed by its position tag
         """
-        self.text = text
\ No newline at end of file
+        pos_texts = pos_tagger.tag_many([nltk.word_tokenize(text) for text in preprocessed_texts])
+        return [' '.join([pos + '-' + word for word, pos in pos_text]) for pos_text in pos_texts]
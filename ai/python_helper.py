@@ -9,11 +9,9 @@ from sklearn.naive_bayes import MultinomialNB
 from sklearn.feature_extraction.text import TfidfTransformer
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.model_selection import ShuffleSplit
-import matplotlib.pyplot as plt
 from nltk.corpus import stopwords
 import os
 import warnings
-import seaborn as sns
 import re
 import string
 
@@ -27,18 +25,14 @@ from nltk.tokenize import WhitespaceTokenizer
 from nltk.stem import WordNetLemmatizer
 import nltk
 
-nltk.download('averaged_perceptron_tagger')
-nltk.download('stopwords')
-nltk.download('averaged_perceptron_tagger')
-nltk.download('wordnet')
-nltk.download('omw-1.4')
-nltk.download('punkt')
+from ai import nltk_resources
+
+nltk_resources.ensure_resources()
 
 from sklearn.model_selection import GridSearchCV
 from sklearn.model_selection import cross_val_score
 
 warnings.filterwarnings('ignore')
-from matplotlib.pyplot import *
 
 from sklearn.pipeline import Pipeline
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -58,9 +52,12 @@ from sklearn.metrics import confusion_matrix
 from nltk.corpus import wordnet
 from sklearn.feature_extraction.text import TfidfTransformer
 
+from ai.text_preprocessor import CachedLemmatizer
+
 seed = 12345
 cv = ShuffleSplit(n_splits=5, test_size=0.2, random_state=seed)
 encoder = preprocessing.LabelEncoder()
+lemmatizer = CachedLemmatizer()
 
 
 def get_wordnet_pos(pos_tag:str):
@@ -85,6 +82,15 @@ def preprocess(text: str) -> str:
     """
     Apply lower case, word filtering, tokenization, stop word removal and position tags to the provided text.
     """
+    return ' '.join([lemma for lemma, _ in _get_lemma_tags(text)])  # join all
+
+
+def _get_lemma_tags(text: str) -> list[tuple[str, str]]:
+    """
+    Return the lemmatized tokens of the provided text along with the position tag used to lemmatize them.
+    :param text: provided text
+    :return: the list of (lemma, position tag) tuples
+    """
     text = text.lower()  # lowercase the text
     text = [t for t in text.split(' ') if len(t) > 1]  # remove the words counting just one letter
     text = [word for word in text if not any(c.isdigit() for c in word)]  # remove the words that contain numbers
@@ -93,8 +99,7 @@ def preprocess(text: str) -> str:
     text = [x for x in text if x not in stop]
     text = [t for t in text if len(t) > 0]  # remove tokens that are empty
     pos_tags = pos_tag(text)  # pos tag the text
-    text = [WordNetLemmatizer().lemmatize(t[0], get_wordnet_pos(t[1])) for t in pos_tags]
-    return ' '.join(text)  # join all
+    return [(lemmatizer.lemmatize(t[0], get_wordnet_pos(t[1])), t[1]) for t in pos_tags]
 
 
 def split_train_holdout_test(encoder: LabelEncoder, df: DataFrame, verbose: bool = True) -> tuple:
@@ -175,6 +180,8 @@ def run_model(encoder: LabelEncoder, train_vector, train_label, holdout_vector,
     cm_df = pd.DataFrame(cm,
                          index=['FAKE', 'REAL'],
                          columns=['FAKE', 'REAL'])  # Transform to df for easier plotting
+    import matplotlib.pyplot as plt  # Plotting libraries are only imported when a confusion matrix is drawn
+    import seaborn as sns
     plt.figure(figsize=(5.5, 4))
     sns.heatmap(cm_df, annot=True, fmt='g')
     plt.ylabel('True label')
@@ -193,3 +200,17 @@ def pos_tag_words(text: str) -> str:
     """
     pos_text = nltk.pos_tag(nltk.word_tokenize(text))
     return ' '.join([pos + '-' + word for word, pos in pos_text])
+
+
+def preprocess_and_pos_tag(text: str) -> tuple[str, str]:
+    """
+    Return both the pre-processed text and its position tagged words from a single position tagging pass
+    (the tags computed for the lemmatization are reused instead of tagging the lemmatized text again).
+    Use it to build the training features of a pipeline served with the exact POS tagging compatibility disabled.
+    :param text: provided text
+    :return: the pre-processed text and the text with each lemma having a position tag
+    """
+    lemma_tags = _get_lemma_tags(text)
+    preprocessed_text = ' '.join([lemma for lemma, _ in lemma_tags])
+    pos_tagged_text = ' '.join([tag + '-' + lemma for lemma, tag in lemma_tags])
+    return preprocessed_text, pos_tagged_text
@@ -0,0 +1,167 @@
+import os
+import string
+from ai import pos_tagger
+from ai.analyzed_document import AnalyzedDocument
+from nltk.stem import WordNetLemmatizer
+from nltk.corpus import stopwords
+from nltk.corpus import wordnet
+from nltk.tokenize import NLTKWordTokenizer, sent_tokenize
+from services import constants_service as ct
+from services.cache_service import LruCache
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+def get_wordnet_pos(pos_tag: str) -> str:
+    """
+    Return the position label associated with the provided word position tag.
+    :param pos_tag: provided word position tag.
+    :return: the associated WordNet position label (noun by default)
+    """
+    if pos_tag.startswith('J'):
+        return wordnet.ADJ
+    elif pos_tag.startswith('V'):
+        return wordnet.VERB
+    elif pos_tag.startswith('N'):
+        return wordnet.NOUN
+    elif pos_tag.startswith('R'):
+        return wordnet.ADV
+    else:
+        return wordnet.NOUN
+
+
+def get_lemma_cache_size() -> int:
+    """
+    Return the lemma cache size, read from its environment variable if set, otherwise its default value.
+    :return: the maximum number of (token, WordNet position) entries kept by a lemma cache
+    """
+    return int(os.getenv(ct.get_lemma_cache_size_env_variable_label(), ct.get_default_lemma_cache_size()))
+
+
+class CachedLemmatizer:
+
+    def __init__(self, max_entries: int = None):
+        """
+        Initialize a new CachedLemmatizer instance. News texts reuse a small vocabulary heavily, so the lemmas
+        are kept in a bounded LRU cache keyed by (token, WordNet position) instead of querying WordNet every time.
+        :param max_entries: maximum number of cached lemmas (the lemma cache size setting if None)
+        """
+        self.lemmatizer = WordNetLemmatizer()
+        self.cache = LruCache(get_lemma_cache_size() if max_entries is None else max_entries)
+
+    def lemmatize(self, word: str, pos: str) -> str:
+        """
+        Return the lemma of the provided word (same output as WordNetLemmatizer.lemmatize).
+        :param word: provided word
+        :param pos: WordNet position of the word
+        :return: the lemma of the provided word
+        """
+        key = (word, pos)
+        lemma = self.cache.get(key)
+        if lemma is None:
+            lemma = self.lemmatizer.lemmatize(word, pos)
+            self.cache.put(key, lemma)
+        return lemma
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Return the lemma cache statistics (size, maximum size, hits, misses and evictions).
+        :return: the lemma cache statistics
+        """
+        return self.cache.get_stats()
+
+
+class TextPreprocessor:
+
+    def __init__(self):
+        """
+        Initialize a new TextPreprocessor instance. Everything the pre-processing needs (stop words set, lemmatizer,
+        WordNet corpus, position tagger) is built once here, so that each call only does the per-token work.
+        The instance is never modified afterwards and can be shared by concurrent requests.
+        """
+        self.stop_words = frozenset(stopwords.words('english'))
+        self.punctuation = string.punctuation
+        self.lemmatizer = CachedLemmatizer()
+        self.word_tokenizer = NLTKWordTokenizer()  # Tokenizer used by nltk.word_tokenize on each punkt sentence
+        wordnet.ensure_loaded()  # Load the lazy corpus now instead of during the first request
+        pos_tagger.get_tagger()  # Same for the position tagger weights
+
+    def preprocess(self, text: str) -> str:
+        """
+        Apply lower case, word filtering, tokenization, stop word removal and lemmatization to the provided text.
+        Produces exactly the same output as the training notebook pre-processing.
+        :param text: provided text to pre-process
+        :return: the pre-processed text
+        """
+        return ' '.join([lemma for lemma, _ in self.tag(text)])  # join all
+
+    def tag(self, text: str) -> list[tuple[str, str]]:
+        """
+        Return the lemmatized tokens of the provided text along with their position tag. The filtered tokens are
+        position tagged only once and the tags are used for the lemmatization, so that callers needing both
+        the lemmas and their tags do not have to tag the text a second time.
+        :param text: provided text to tag
+        :return: the list of (lemma, position tag) tuples, in the original token order
+        """
+        return self.tag_many([text])[0]
+
+    def tag_many(self, texts: list[str]) -> list[list[tuple[str, str]]]:
+        """
+        Return the lemmatized tokens of each provided text along with their position tag, all texts being
+        position tagged in bulk.
+        :param texts: provided texts to tag
+        :return: one list of (lemma, position tag) tuples per provided text, in the same order as the texts
+        """
+        tagged_texts = pos_tagger.tag_many([self.tokenize(text) for text in texts])  # pos tag the texts
+        lemmatize = self.lemmatizer.lemmatize
+        return [[(lemmatize(word, get_wordnet_pos(tag)), tag) for word, tag in pos_tags] for pos_tags in tagged_texts]
+
+    def analyze(self, text: str) -> AnalyzedDocument:
+        """
+        Return the analysis of the provided text shared by the truthfulness and topic models: the punkt sentence
+        segmentation runs once and gives both the sentences worth scoring (see the segment method) and the word
+        tokens of the whole text (same tokens as nltk.word_tokenize, which segments the text again otherwise).
+        :param text: provided text to analyze
+        :return: the analyzed document
+        """
+        sentences = sent_tokenize(str(text))
+        words = [word for sentence in sentences for word in self.word_tokenizer.tokenize(sentence)]
+        return AnalyzedDocument(text, self._get_scored_sentences(sentences), words)
+
+    def segment(self, text: str) -> list[str]:
+        """
+        Return the sentences of the provided text detected by the punkt sentence tokenizer (abbreviations and decimal
+        numbers are not split), without the fragments having no token left once pre-processed.
+        :param text: provided text to segment
+        :return: the sentences worth scoring, in their original order
+        """
+        return self._get_scored_sentences(sent_tokenize(str(text)))
+
+    def _get_scored_sentences(self, sentences: list[str]) -> list[str]:
+        """
+        Return the provided sentences having tokens left once pre-processed.
+        :param sentences: sentences detected by the punkt sentence tokenizer
+        :return: the sentences worth scoring, in their original order
+        """
+        return [sentence for sentence in sentences if len(self.tokenize(sentence)) > 0]
+
+    def tokenize(self, text: str) -> list[str]:
+        """
+        Return the lower-cased tokens of the provided text, without the one letter words, the words containing
+        numbers, the surrounding punctuation, the stop words and the empty tokens (all filters in a single pass).
+        :param text: provided text to tokenize
+        :return: the filtered tokens, in their original order
+        """
+        stop_words = self.stop_words
+        punctuation = self.punctuation
+        tokens = []
+        for word in str(text).lower().split(' '):
+            if len(word) < 2 or any(c.isdigit() for c in word):
+                continue
+            word = word.strip(punctuation)
+            if word and word not in stop_words:
+                tokens.append(word)
+        return tokens
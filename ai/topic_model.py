@@ -1,94 +1,154 @@
+import os
 import timeit
-import pandas as pd
-import nltk
-import numpy as np
+from typing import Any, Optional
 import re
 import pickle
-import string
-from itertools import chain
-from langdetect import detect
-from nltk.tokenize import sent_tokenize
 from nltk.tokenize import word_tokenize
-from nltk import pos_tag
-from nltk.stem.wordnet import WordNetLemmatizer
-from nltk.corpus import stopwords
-from nltk.corpus import wordnet
-from gensim.models import Phrases
-from gensim import corpora
-from gensim import models
+from ai import artifacts as ma
+from ai.analyzed_document import AnalyzedDocument
+from ai import nltk_resources
 from services import constants_service as ct
 
-nltk.download('punkt')
-nltk.download('averaged_perceptron_tagger')
-nltk.download('stopwords')
-nltk.download('wordnet')
-
 import gc
 
 
 # Enable automatic garbage collection
 gc.enable()
 
-start = timeit.default_timer()
-with open('ai/pickle/dictionary_LDA.pkl' , 'rb') as f:
-    """
-    Load the pickle-format serialized dictionary_LDA.
-    """
-    dictionary_LDA = pickle.load(f)
+# Verify the required NLTK resources are installed locally (never downloaded at import time).
+nltk_resources.ensure_resources()
 
-with open('ai/pickle/model_topic.pkl' , 'rb') as f:
+
+def load_topic_model(dictionary_path: str = 'ai/pickle/dictionary_LDA.pkl',
+                     lda_model_path: str = 'ai/pickle/model_topic.pkl',
+                     topic_model_directory: Optional[str] = None) -> tuple[Any, Any, str]:
     """
-    Load the pickle-format serialized lda_model (topic).
+    Load the topic model and its dictionary from their converted artifacts if they exist and were converted from
+    their pickles (or if the pickles are not deployed), otherwise from their pickles.
+    :param dictionary_path: path of the pickled gensim Dictionary
+    :param lda_model_path: path of the pickled LDA model
+    :param topic_model_directory: directory of the topic model artifacts (the configured one if None)
+    :return: the LDA model, its dictionary and the version of the loaded model
     """
-    lda_model = pickle.load(f)
+    start = timeit.default_timer()
+    topic_model_directory = topic_model_directory or ma.get_topic_model_directory()
+    dictionary_bytes, lda_model_bytes = None, None
+    if os.path.isfile(dictionary_path) and os.path.isfile(lda_model_path):
+        with open(dictionary_path, 'rb') as f:
+            dictionary_bytes = f.read()
+        with open(lda_model_path, 'rb') as f:
+            lda_model_bytes = f.read()
+    # Version of the pickled model: content hash of its pickles
+    version = ma.get_pickle_version(dictionary_bytes + lda_model_bytes) if dictionary_bytes is not None else None
+    if ma.has_topic_model(topic_model_directory):
+        # Converted artifacts (see ai/convert_artifacts.py): the dictionary and the LDA topic-word matrix are
+        # memory-mapped read-only, so every gunicorn worker shares the same physical pages.
+        # They are only served if converted from the deployed pickles (retrained ones must be converted again).
+        if version is None or ma.get_topic_model_version(topic_model_directory) == version:
+            del dictionary_bytes, lda_model_bytes
+            lda_model, dictionary, version = ma.load_topic_model(topic_model_directory)
+            stop = timeit.default_timer()
+            print('=> Artifacts Loaded in: ', stop - start)
+            return lda_model, dictionary, version
+        print('=> Artifacts outdated, pickles loaded instead: ', dictionary_path, lda_model_path)
+    if dictionary_bytes is None:
+        raise FileNotFoundError(f'Topic model pickles not found: {dictionary_path}, {lda_model_path}')
+    # Load the pickle-format serialized dictionary_LDA and lda_model (topic).
+    dictionary = pickle.loads(dictionary_bytes)
+    lda_model = pickle.loads(lda_model_bytes)
     stop = timeit.default_timer()
     print('=> Pickle Loaded in: ', stop - start)
+    return lda_model, dictionary, version
+
+
+# Topic model, dictionary and version loaded at import time, used by default by every TopicModel instance.
+loaded_lda_model, loaded_dictionary, loaded_topic_model_version = load_topic_model()
 
 
 class TopicModel:
 
-    def __init__(self):
+    def __init__(self, lda_model: Any = None, dictionary: Any = None, version: Optional[str] = None):
         """
-        Initialize a new TopicModel instance.
-        :param text: user text entry
+        Initialize a new TopicModel instance. The instance only holds read-only settings and models, so a single
+        instance can safely be shared by concurrent requests (threads included).
+        :param lda_model: LDA model returned by load_topic_model (the one loaded at import time if None)
+        :param dictionary: dictionary of the provided LDA model (the one loaded at import time if None)
+        :param version: version of the provided LDA model (the one loaded at import time if None)
         """
-        self.text = None
-        self.output = None
-        self.num_topics = 8
         self.num_words = 4
+        self.lda_model = lda_model if lda_model is not None else loaded_lda_model
+        # Read from the model itself, a reloaded model may not have the same number of topics.
+        self.num_topics = self.lda_model.num_topics
+        self.dictionary = dictionary if dictionary is not None else loaded_dictionary
+        self.version = version if version is not None else loaded_topic_model_version
+        # Computed once per loaded model (a reloaded model gets a new instance, hence new labels).
+        self.topic_labels = self.get_topic_labels()
 
-    def predict(self) -> str:
+    def get_version(self) -> str:
         """
-        Return REAL if the user text entry was labeled as truthful, else return FAKE.
-        :return: REAL if the user text entry was labeled as truthful, else return FAKE.
+        Return the version of the loaded topic model. Anything derived from its predictions must be keyed by it.
+        :return: the topic model version
         """
-        tokens = word_tokenize(self.text)
-        topics = lda_model.show_topics(formatted=True, num_topics=self.num_topics, num_words=self.num_words)
-        res = pd.DataFrame([(el[0], round(el[1],2), topics[el[0]][1]) for el in lda_model[dictionary_LDA.doc2bow(tokens)]], columns=['topic #', 'weight', 'words in topic'])
-        self.output = self.postprocessing_resultat(res)
-        return self.output
+        return self.version
 
-    def postprocessing_resultat(self, res):
+    def get_topic_labels(self) -> dict[int, str]:
         """
-        Return the clean list of topics.
-        :return: List of topics.
+        Return the label of each topic of the LDA model, its cleaned most relevant word.
+        :return: the topic label by topic id
         """
-        res = res.sort_values(by=['weight'],ascending=False)
-        res_first = res.head(1)
-        #if(res_first['weight'].iloc[0]) > 0.4:
-        topic = res_first['words in topic'].iloc[0]
-
-        character_banned = "'*.\""
-        for char in character_banned:
-            topic = topic.strip().replace(char, "")
-        res = topic.split("+")
-        pattern = '[0-9]'
-        list_word = [re.sub(pattern, '', i).strip().capitalize() for i in res]
-        return list_word[0:1]
-
-    def set_text(self, text: str):
+        topics = self.lda_model.show_topics(formatted=True, num_topics=self.num_topics, num_words=self.num_words)
+        return {topic_id: get_topic_label(words_in_topic) for topic_id, words_in_topic in topics}
+
+    def predict(self, text: str) -> list[str]:
         """
-        Set the model's text material.
+        Return the list of topics extracted from the provided text.
         :param text: provided text to analyze
+        :return: the list of topics extracted (only the main one is kept)
+        """
+        return self.predict_words(word_tokenize(text))
+
+    def predict_document(self, document: AnalyzedDocument) -> list[str]:
         """
-        self.text = text
+        Return the list of topics extracted from the provided analyzed document, reusing its word tokens.
+        :param document: provided document to analyze
+        :return: the list of topics extracted (only the main one is kept)
+        """
+        return self.predict_words(document.get_words())
+
+    def predict_words(self, words: list[str]) -> list[str]:
+        """
+        Return the list of topics extracted from the provided word tokens.
+        :param words: word tokens of the text to analyze (as returned by nltk.word_tokenize)
+        :return: the list of topics extracted (only the main one is kept)
+        """
+        topic_weights = self.lda_model[self.dictionary.doc2bow(words)]
+        return [self.topic_labels[get_main_topic(topic_weights)]]
+
+
+def get_main_topic(topic_weights: list[tuple[int, float]]) -> int:
+    """
+    Return the main topic of a document, the one with the highest weight rounded to 2 decimals (the first one
+    in the provided order in case of a tie).
+    :param topic_weights: (topic id, weight) tuples of the document topic distribution
+    :return: the main topic id
+    """
+    main_topic, main_weight = topic_weights[0][0], round(topic_weights[0][1], 2)
+    for topic, weight in topic_weights[1:]:
+        weight = round(weight, 2)
+        if weight > main_weight:
+            main_topic, main_weight = topic, weight
+    return main_topic
+
+
+def get_topic_label(words_in_topic: str) -> str:
+    """
+    Return the clean label of a topic formatted by the LDA model show_topics method, its most relevant word.
+    :param words_in_topic: formatted topic words, e.g. '0.022*"us" + 0.011*"government"'
+    :return: the topic label, e.g. 'Us'
+    """
+    character_banned = "'*.\""
+    for char in character_banned:
+        words_in_topic = words_in_topic.strip().replace(char, "")
+    res = words_in_topic.split("+")
+    pattern = '[0-9]'
+    return re.sub(pattern, '', res[0]).strip().capitalize()
@@ -6,6 +6,8 @@ from services import constants_service as ct
 from routes.checker_route import app_checker
 from routes.entries_route import app_entries
 from routes.topics_route import app_topics
+from routes.readiness_route import app_readiness
+from services import warm_up_service as ws
 import gc
 
 
@@ -29,6 +31,10 @@ app.debug = True
 app.register_blueprint(app_checker, url_prefix=f'/{ct.get_checker_endpoint_url_prefix()}')
 app.register_blueprint(app_entries, url_prefix=f'/{ct.get_entries_endpoint_url_prefix()}')
 app.register_blueprint(app_topics, url_prefix=f'/{ct.get_topics_endpoint_url_prefix()}')
+app.register_blueprint(app_readiness, url_prefix=f'/{ct.get_readiness_endpoint_url_prefix()}')
+
+# Warm the models up before serving any request (once in the gunicorn master process with --preload)
+ws.warm_up()
 
 
 @app.after_request
@@ -0,0 +1,94 @@
+import glob
+import os
+import timeit
+import tracemalloc
+
+import pandas as pd
+
+from services import crawler_service as cwl
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+# Image host of the generated pages: connections are refused at once, so the full profile image downloads fail fast
+# (real publishers make them much slower).
+IMAGE_HOST = 'http://127.0.0.1:9'
+
+
+def get_corpus(html_directory: str = None, articles_path: str = 'ai/dataset/articles.csv', limit: int = 100) \
+        -> list[str]:
+    """
+    Return the HTML pages of the benchmark corpus: the .html files of the provided directory if any, otherwise
+    pages generated from the dataset articles (navigation, meta tags, images and article paragraphs, half of them
+    without a meta image so that the full profile downloads their first image to check its size).
+    :param html_directory: directory of saved article pages (generated pages if None)
+    :param articles_path: path of the CSV file containing the articles
+    :param limit: maximum number of pages
+    :return: the HTML pages
+    """
+    if html_directory is not None:
+        pages = []
+        for path in sorted(glob.glob(os.path.join(html_directory, '*.html')))[:limit]:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                pages.append(f.read())
+        return pages
+    articles = pd.read_csv(articles_path)['articles'].dropna().astype(str).tolist()[:limit]
+    navigation = ''.join([f'<li><a href="/section/{index}">Section {index}</a></li>' for index in range(40)])
+    return [f'<html><head><title>Article {index}</title>'
+            + (f'<meta property="og:image" content="{IMAGE_HOST}/og/{index}.jpg">' if index % 2 == 0 else '')
+            + f'<meta name="description" content="{article[:150]}"></head>'
+            f'<body><nav><ul>{navigation}</ul></nav><article><h1>Article {index}</h1>'
+            f'<img src="{IMAGE_HOST}/photo/{index}.jpg">'
+            + ''.join([f'<p>{paragraph}</p>' for paragraph in article.split('. ')])
+            + '</article><footer>' + ''.join([f'<img src="{IMAGE_HOST}/ad/{ad}.png">' for ad in range(10)])
+            + '</footer></body></html>'
+            for index, article in enumerate(articles)]
+
+
+def parse(html: str, profile: str):
+    """
+    Return the article parsed from the provided page with the provided extraction profile.
+    :param html: article page
+    :param profile: extraction profile ("text" or "full")
+    :return: the parsed article
+    """
+    article = cwl.create_article('https://news.com/article', profile)
+    article.download(input_html=html)
+    article.parse()
+    return article
+
+
+def run(html_directory: str = None, number: int = 3):
+    """
+    Print the per-article parse time, the tracemalloc peak of a parse and the memory kept by the parsed articles
+    of the full newspaper extraction and of the text only extraction profile.
+    :param html_directory: directory of saved article pages (generated pages if None)
+    :param number: number of passes over the corpus for the timing
+    """
+    pages = get_corpus(html_directory)
+    print(f'=> Corpus: {len(pages)} pages')
+    for profile in ['full', 'text']:
+        duration = timeit.timeit(lambda: [parse(html, profile) for html in pages], number=number)
+        peaks = []
+        for html in pages:
+            tracemalloc.start()
+            parse(html, profile)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        tracemalloc.start()
+        articles = [parse(html, profile) for html in pages]
+        retained_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        # The lxml trees are allocated by libxml2, outside of tracemalloc: the kept ones are counted instead
+        kept_trees = sum([tree is not None for article in articles for tree in [article.doc, article.clean_doc]])
+        del articles
+        print(f'=> {profile} profile: {duration / (number * len(pages)) * 1000:.2f}ms per article, '
+              f'peak {sum(peaks) / len(peaks) / 1024:.0f}KiB per parse (max {max(peaks) / 1024:.0f}KiB), '
+              f'{retained_bytes / len(pages) / 1024:.0f}KiB kept per parsed article, {kept_trees} DOM trees kept')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,178 @@
+import multiprocessing
+import os
+import pickle
+import tempfile
+import timeit
+from typing import Any, Callable
+
+import pandas as pd
+
+from ai import artifacts as ma
+from ai import convert_artifacts as ca
+from ai import linear_scorer as ls
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+def load_pickle_models(pickle_directory: str) -> dict[str, Callable[[list[str]], Any]]:
+    """
+    Return the prediction function of each pickled model found in the provided directory (loaded like
+    ai/prediction_model.py and ai/topic_model.py do without the artifacts).
+    :param pickle_directory: directory containing the pickled models
+    :return: the prediction function (from a list of texts) by model name
+    """
+    models = {}
+    pipeline_path = os.path.join(pickle_directory, 'pipeline.pkl')
+    if os.path.isfile(pipeline_path):
+        with open(pipeline_path, 'rb') as f:
+            pipeline = pickle.load(f)
+        scorer = ls.compile_pipeline(pipeline)
+        models['pipeline'] = (scorer if scorer is not None else pipeline).predict
+    dictionary_path = os.path.join(pickle_directory, 'dictionary_LDA.pkl')
+    lda_model_path = os.path.join(pickle_directory, 'model_topic.pkl')
+    if os.path.isfile(dictionary_path) and os.path.isfile(lda_model_path):
+        with open(dictionary_path, 'rb') as f:
+            dictionary = pickle.load(f)
+        with open(lda_model_path, 'rb') as f:
+            lda_model = pickle.load(f)
+        models['topic'] = lambda texts: [lda_model[dictionary.doc2bow(text.split())] for text in texts]
+    return models
+
+
+def load_mapped_models(artifacts_directory: str) -> dict[str, Callable[[list[str]], Any]]:
+    """
+    Return the prediction function of each converted model found in the provided directory.
+    :param artifacts_directory: model artifacts directory
+    :return: the prediction function (from a list of texts) by model name
+    """
+    models = {}
+    if ma.has_pipeline(ma.get_pipeline_directory(artifacts_directory)):
+        scorer, _ = ma.load_pipeline(ma.get_pipeline_directory(artifacts_directory))
+        models['pipeline'] = scorer.predict
+    if ma.has_topic_model(ma.get_topic_model_directory(artifacts_directory)):
+        lda_model, dictionary, _ = ma.load_topic_model(ma.get_topic_model_directory(artifacts_directory))
+        models['topic'] = lambda texts: [lda_model[dictionary.doc2bow(text.split())] for text in texts]
+    return models
+
+
+def get_memory_usage() -> dict[str, int]:
+    """
+    Return the memory usage of the current process in kB (Linux only): resident, proportional (shared pages
+    divided between the processes sharing them) and private sizes.
+    :return: the Rss, Pss and Private sizes in kB
+    """
+    with open('/proc/self/smaps_rollup') as f:
+        fields = {line.split(':')[0]: int(line.split()[1]) for line in f if line.split()[-1] == 'kB'}
+    return {'Rss': fields['Rss'], 'Pss': fields['Pss'],
+            'Private': fields['Private_Clean'] + fields['Private_Dirty']}
+
+
+def get_scoring_times(models: dict[str, Callable[[list[str]], Any]], sentences: list[str], number: int = 3) \
+        -> dict[str, float]:
+    """
+    Return the mean time taken by each provided model to score a single sentence (like a request scoring the
+    sentences missing from the verdict cache).
+    :param models: prediction function (from a list of texts) by model name
+    :param sentences: sentences scored one at a time
+    :param number: number of passes over the sentences
+    :return: the mean scoring time of a sentence in microseconds, by model name
+    """
+    return {name: timeit.timeit(lambda: [predict([sentence]) for sentence in sentences], number=number)
+            / (number * len(sentences)) * 1e6 for name, predict in models.items()}
+
+
+def get_lookup_times(pickle_directory: str, artifacts_directory: str, sentences: list[str], number: int = 3) \
+        -> dict[str, float]:
+    """
+    Return the mean time taken to look the terms of a sentence up in the topic model dictionary: in the pickled
+    gensim Dictionary (a dict lookup per term) and in the MappedVocabulary (blake2b hashes, a binary search and a
+    byte comparison of each matched term).
+    :param pickle_directory: directory containing the pickled models
+    :param artifacts_directory: model artifacts directory converted from them
+    :param sentences: sentences whose terms are looked up one sentence at a time
+    :param number: number of passes over the sentences
+    :return: the mean lookup time of a sentence in microseconds, by layout
+    """
+    with open(os.path.join(pickle_directory, 'dictionary_LDA.pkl'), 'rb') as f:
+        token2id = pickle.load(f).token2id
+    vocabulary = ma.load_vocabulary(ma.get_topic_model_directory(artifacts_directory), 'dictionary')
+    terms = [sentence.split() for sentence in sentences]
+    lookups = {'pickle': lambda: [[token2id[term] for term in sentence_terms if term in token2id]
+                                  for sentence_terms in terms],
+               'mapped': lambda: [vocabulary.get_indexes(sentence_terms) for sentence_terms in terms]}
+    return {layout: timeit.timeit(lookup, number=number) / (number * len(terms)) * 1e6
+            for layout, lookup in lookups.items()}
+
+
+def _work(models: dict[str, Callable[[list[str]], Any]], texts: list[str], results, done):
+    """
+    Serve the provided texts like a gunicorn worker (predictions and garbage collections touching every
+    loaded object), report the worker memory usage and stay alive until every worker has reported.
+    """
+    for predict in models.values():
+        predict(texts)
+    gc.collect()
+    results.put(get_memory_usage())
+    done.wait()
+
+
+def _measure(layout: str, directory: str, texts: list[str], sentences: list[str], workers_count: int, report):
+    """
+    Load the models of the provided layout once, time the scoring of single sentences, fork the workers (like
+    gunicorn --preload) and report the loading time, the sentence scoring times and the memory usage of every worker.
+    """
+    context = multiprocessing.get_context('fork')
+    start = timeit.default_timer()
+    models = load_pickle_models(directory) if layout == 'pickle' else load_mapped_models(directory)
+    load_time = timeit.default_timer() - start
+    scoring_times = get_scoring_times(models, sentences)
+    results = context.Queue()
+    done = context.Event()
+    workers = [context.Process(target=_work, args=(models, texts, results, done)) for _ in range(workers_count)]
+    for worker in workers:
+        worker.start()
+    usages = [results.get() for _ in workers]
+    done.set()
+    for worker in workers:
+        worker.join()
+    report.put((sorted(models), load_time, scoring_times, usages))
+
+
+def run(workers_count: int = 4, pickle_directory: str = 'ai/pickle', dataset_path: str = 'ai/dataset/articles.csv'):
+    """
+    Print the memory used by the provided number of forked workers and the time taken to score a sentence with the
+    pickled models and with the memory-mapped artifacts converted from them (Linux only).
+    :param workers_count: number of forked workers
+    :param pickle_directory: directory containing the pickled models
+    :param dataset_path: path of the CSV dataset containing the articles (in its "articles" column)
+    """
+    texts = pd.read_csv(dataset_path)['articles'].dropna().astype(str).tolist()[:200]
+    sentences = [sentence for text in texts[:20] for sentence in text.split('. ') if sentence.strip()]
+    context = multiprocessing.get_context('fork')
+    with tempfile.TemporaryDirectory() as artifacts_directory:
+        ca.run(pickle_directory, artifacts_directory)
+        for layout, directory in [('pickle', pickle_directory), ('mapped', artifacts_directory)]:
+            report = context.Queue()
+            process = context.Process(target=_measure,
+                                      args=(layout, directory, texts, sentences, workers_count, report))
+            process.start()
+            model_names, load_time, scoring_times, usages = report.get()
+            process.join()
+            print(f'=> {layout} layout ({", ".join(model_names)}) loaded in {load_time:.2f}s')
+            print(f'   {workers_count} workers: total Pss {sum(usage["Pss"] for usage in usages) / 1024:.1f}MiB, '
+                  f'mean Rss {sum(usage["Rss"] for usage in usages) / len(usages) / 1024:.1f}MiB, '
+                  f'mean private {sum(usage["Private"] for usage in usages) / len(usages) / 1024:.1f}MiB')
+            print('   per sentence scoring: ' + ', '.join(f'{name} {scoring_time:.1f}µs'
+                                                          for name, scoring_time in scoring_times.items()))
+        if os.path.isfile(os.path.join(pickle_directory, 'dictionary_LDA.pkl')) \
+                and ma.has_topic_model(ma.get_topic_model_directory(artifacts_directory)):
+            lookup_times = get_lookup_times(pickle_directory, artifacts_directory, sentences)
+            print(f'=> topic dictionary lookup per sentence: dict {lookup_times["pickle"]:.1f}µs, '
+                  f'MappedVocabulary {lookup_times["mapped"]:.1f}µs')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,103 @@
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from services import constants_service as ct
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+# Modules imported by the web process (app.py registers their blueprints).
+SERVING_MODULES = ['routes.checker_route', 'routes.entries_route', 'routes.topics_route', 'routes.readiness_route']
+
+# Top-level packages of the application (their own import time includes the model loading, not counted as a
+# dependency import cost).
+APPLICATION_PACKAGES = {'ai', 'app', 'benchmarks', 'entities', 'repositories', 'routes', 'services', 'tests'}
+
+
+def get_import_times(modules: list[str]) -> list[tuple[str, int, float, float]]:
+    """
+    Return the import time of every module imported by a fresh interpreter importing the provided modules
+    (python -X importtime), in the order the imports completed.
+    :param modules: names of the imported modules
+    :return: the (module name, nesting depth, self milliseconds, cumulative milliseconds) tuples
+    """
+    code = f'import {", ".join(modules)}'
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True,
+                             cwd=os.getcwd())
+    if process.returncode != 0:
+        raise RuntimeError(f'Could not import {", ".join(modules)}: {process.stderr[-2000:]}')
+    import_times = []
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        import_times.append(_parse_import_time_line(line))
+    return import_times
+
+
+def _parse_import_time_line(line: str) -> tuple[str, int, float, float]:
+    """
+    Return the module name, nesting depth, self and cumulative import times of a python -X importtime line.
+    :param line: line such as "import time:       120 |        450 |   encodings.aliases"
+    :return: the (module name, nesting depth, self milliseconds, cumulative milliseconds) tuple
+    """
+    header, cumulative_us, name_column = line.split('|')
+    self_us = header.split(':')[1]
+    depth = (len(name_column) - len(name_column.lstrip()) - 1) // 2
+    return name_column.strip(), depth, int(self_us) / 1000, int(cumulative_us) / 1000
+
+
+def get_dependency_import_times(import_times: list[tuple[str, int, float, float]]) -> dict[str, float]:
+    """
+    Return the cumulative import time of each top-level dependency (standard library included) imported directly
+    by the application, the dependencies imported by other dependencies being counted in their importer.
+    :param import_times: import times returned by get_import_times
+    :return: the cumulative milliseconds by top-level dependency name
+    """
+    dependency_times = defaultdict(float)
+    ancestors = []  # (depth, whether inside a dependency) of the ancestors of the current module
+    for name, depth, _, cumulative_ms in reversed(import_times):  # Parents are printed after their children
+        while len(ancestors) > 0 and ancestors[-1][0] >= depth:
+            ancestors.pop()
+        inside_dependency = len(ancestors) > 0 and ancestors[-1][1]
+        is_dependency = name.split('.')[0] not in APPLICATION_PACKAGES
+        if is_dependency and not inside_dependency:
+            dependency_times[name.split('.')[0]] += cumulative_ms
+        ancestors.append((depth, inside_dependency or is_dependency))
+    return dict(dependency_times)
+
+
+def get_import_time_budget_ms() -> float:
+    """
+    Return the cumulative import time budget of the serving path dependencies, read from its environment variable
+    if set, otherwise its default value.
+    :return: the import time budget in milliseconds
+    """
+    return float(os.getenv(ct.get_import_time_budget_env_variable_label(), ct.get_default_import_time_budget_ms()))
+
+
+def run(modules: list[str] = None, top: int = 25):
+    """
+    Print the slowest modules to import (cumulative import time) in the serving path, the import time of each
+    top-level dependency and their total compared to the import time budget.
+    :param modules: names of the imported modules (the serving path modules if None)
+    :param top: number of slowest modules printed
+    """
+    import_times = get_import_times(modules or SERVING_MODULES)
+    print(f'=> Slowest imports (cumulative, {top} first):')
+    for name, _, self_ms, cumulative_ms in sorted(import_times, key=lambda import_time: -import_time[3])[:top]:
+        print(f'   {cumulative_ms:10.1f}ms (self {self_ms:8.1f}ms)  {name}')
+    dependency_times = get_dependency_import_times(import_times)
+    print('=> Dependencies (cumulative):')
+    for name, cumulative_ms in sorted(dependency_times.items(), key=lambda item: -item[1]):
+        print(f'   {cumulative_ms:10.1f}ms  {name}')
+    print(f'=> Dependencies total: {sum(dependency_times.values()):.1f}ms '
+          f'(budget: {get_import_time_budget_ms():.1f}ms)')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,57 @@
+import pickle
+import statistics
+import timeit
+
+import pandas as pd
+
+from ai.linear_scorer import compile_pipeline
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+def get_call_durations(predict, texts: list[str]) -> list[float]:
+    """
+    Return the duration in seconds of each single text prediction call.
+    :param predict: function predicting the classes of a list of texts
+    :param texts: provided texts, predicted one per call
+    :return: the duration of each call
+    """
+    durations = []
+    for text in texts:
+        start = timeit.default_timer()
+        predict([text])
+        durations.append(timeit.default_timer() - start)
+    return durations
+
+
+def run(pipeline_path: str = 'ai/pickle/pipeline.pkl', dataset_path: str = 'ai/dataset/articles.csv',
+        sentences_count: int = 2000):
+    """
+    Print the per-call latency of the sklearn pipeline and of its compiled NumPy linear scorer, and check that
+    both give the same predictions.
+    :param pipeline_path: path of the pickled pipeline
+    :param dataset_path: path of the CSV dataset containing the articles (in its "articles" column)
+    :param sentences_count: number of dataset sentences predicted
+    """
+    with open(pipeline_path, 'rb') as f:
+        pipeline = pickle.load(f)
+    scorer = compile_pipeline(pipeline)
+    if scorer is None:
+        print('=> The pipeline is not linear, it cannot be compiled')
+        return
+    articles = pd.read_csv(dataset_path)['articles'].dropna().astype(str).tolist()
+    sentences = [sentence for article in articles for sentence in article.split('.')][:sentences_count]
+    mismatches = sum(expected != actual for expected, actual
+                     in zip(pipeline.predict(sentences), scorer.predict(sentences)))
+    print(f'=> Sentences: {len(sentences)} (prediction mismatches: {mismatches})')
+    for name, predict in [('sklearn pipeline', pipeline.predict), ('NumPy linear scorer', scorer.predict)]:
+        durations = get_call_durations(predict, sentences)
+        print(f'=> {name}: mean {statistics.mean(durations) * 1000:.3f}ms, '
+              f'median {statistics.median(durations) * 1000:.3f}ms per call')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,40 @@
+import timeit
+
+import nltk
+
+from ai import nltk_resources as nr
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+# nltk.download calls previously run at import time by ai/prediction_model.py, ai/topic_model.py
+# and ai/python_helper.py, in this order.
+LEGACY_DOWNLOADS = ['stopwords', 'averaged_perceptron_tagger', 'wordnet', 'omw-1.4', 'punkt',
+                    'punkt', 'averaged_perceptron_tagger', 'stopwords', 'wordnet',
+                    'averaged_perceptron_tagger', 'stopwords', 'averaged_perceptron_tagger', 'wordnet', 'omw-1.4',
+                    'punkt']
+
+
+def run():
+    """
+    Print the boot time spent on the NLTK resources with the legacy nltk.download calls (network round-trips,
+    even when the packages are up to date) and with the local resource verification.
+    """
+    nr.download_missing_packages()
+    start = timeit.default_timer()
+    for package in LEGACY_DOWNLOADS:
+        nltk.download(package, quiet=True)
+    legacy_duration = timeit.default_timer() - start
+    start = timeit.default_timer()
+    missing_packages = nr.get_missing_packages()
+    verification_duration = timeit.default_timer() - start
+    print(f'=> Legacy nltk.download calls ({len(LEGACY_DOWNLOADS)}): {legacy_duration * 1000:.1f}ms')
+    print(f'=> Local resource verification ({len(nr.REQUIRED_RESOURCES)} packages, '
+          f'{len(missing_packages)} missing): {verification_duration * 1000:.1f}ms')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,49 @@
+import statistics
+import timeit
+
+import pandas as pd
+
+from ai.text_preprocessor import TextPreprocessor
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+def get_sentence_counts(preprocessor: TextPreprocessor, article: str) -> tuple[int, int]:
+    """
+    Return the number of sentences sent to inference for the provided article with the legacy split by "."
+    and with the punkt segmentation (fragments without tokens removed).
+    :param preprocessor: pre-processing engine used to segment the article
+    :param article: provided article text
+    :return: the legacy sentence count and the punkt sentence count
+    """
+    return len(article.split('.')), len(preprocessor.segment(article))
+
+
+def run(dataset_path: str = 'ai/dataset/articles.csv'):
+    """
+    Print how many inference calls (sentences scored) the punkt segmentation saves per article of the dataset
+    compared to the legacy split by ".".
+    :param dataset_path: path of the CSV dataset containing the articles (in its "articles" column)
+    """
+    articles = pd.read_csv(dataset_path)['articles'].dropna().astype(str).tolist()
+    preprocessor = TextPreprocessor()
+    start = timeit.default_timer()
+    counts = [get_sentence_counts(preprocessor, article) for article in articles]
+    stop = timeit.default_timer()
+    legacy_total = sum(legacy_count for legacy_count, _ in counts)
+    punkt_total = sum(punkt_count for _, punkt_count in counts)
+    saved_counts = [legacy_count - punkt_count for legacy_count, punkt_count in counts]
+    print(f'=> Articles: {len(articles)} (segmented in {stop - start:.2f}s)')
+    print(f'=> Inference calls with the legacy split: {legacy_total}')
+    print(f'=> Inference calls with the punkt segmentation: {punkt_total}')
+    print(f'=> Saved inference calls per article: mean {statistics.mean(saved_counts):.1f}, '
+          f'median {statistics.median(saved_counts)}, max {max(saved_counts)}')
+    print(f'=> Saved inference calls overall: {legacy_total - punkt_total} '
+          f'({(legacy_total - punkt_total) / legacy_total:.1%})')
+
+
+if __name__ == '__main__':
+    run()
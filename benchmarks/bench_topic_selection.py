@@ -0,0 +1,49 @@
+import timeit
+
+import pandas as pd
+
+from ai.topic_model import TopicModel, get_main_topic
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+def get_main_topic_with_pandas(topic_weights: list[tuple[int, float]]) -> int:
+    """
+    Return the main topic of a document as selected before by TopicModel.predict (DataFrame sorted by weight).
+    :param topic_weights: (topic id, weight) tuples of the document topic distribution
+    :return: the main topic id
+    """
+    res = pd.DataFrame([(topic, round(weight, 2)) for topic, weight in topic_weights], columns=['topic #', 'weight'])
+    res = res.sort_values(by=['weight'], ascending=False)
+    return res['topic #'].iloc[0]
+
+
+def run(number: int = 20, articles_path: str = 'ai/dataset/articles.csv', limit: int = 500):
+    """
+    Print the main topic selection latency with the pandas DataFrame and with the direct argmax, on the topic
+    distributions of the dataset articles, and the latency of a whole topic prediction for reference.
+    :param number: number of passes over the articles
+    :param articles_path: path of the CSV file containing the articles
+    :param limit: maximum number of articles used
+    """
+    model_topic = TopicModel()
+    articles = pd.read_csv(articles_path)['articles'].dropna().astype(str).tolist()[:limit]
+    topic_weights = [model_topic.lda_model[model_topic.dictionary.doc2bow(article.split())] for article in articles]
+    assert [get_main_topic_with_pandas(weights) for weights in topic_weights] == \
+           [get_main_topic(weights) for weights in topic_weights]
+    pandas_duration = timeit.timeit(lambda: [get_main_topic_with_pandas(weights) for weights in topic_weights],
+                                    number=number)
+    argmax_duration = timeit.timeit(lambda: [get_main_topic(weights) for weights in topic_weights], number=number)
+    predict_duration = timeit.timeit(lambda: [model_topic.predict(article) for article in articles], number=1)
+    calls = number * len(topic_weights)
+    print(f'=> pandas DataFrame selection: {pandas_duration / calls * 1e6:.1f}us per document')
+    print(f'=> Direct argmax selection: {argmax_duration / calls * 1e6:.2f}us per document '
+          f'(x{pandas_duration / argmax_duration:.0f} faster)')
+    print(f'=> Whole topic prediction (reference): {predict_duration / len(articles) * 1e6:.1f}us per document')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,40 @@
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class CheckerResultData:
+
+    def __init__(self, title: str = None, truthfulness_percentage: float = None, topics: list[str] = None):
+        """
+        Initialize a new instance of CheckerResultData.
+        :param title: checked article title
+        :param truthfulness_percentage: percentage of the article sentences labeled as truthful
+        :param topics: topics extracted from the article
+        """
+        self.title = title
+        self.truthfulness_percentage = truthfulness_percentage
+        self.topics = topics
+
+    def get_title(self) -> str:
+        """
+        Return the checked article title.
+        :return: the checked article title
+        """
+        return self.title
+
+    def get_truthfulness_percentage(self) -> float:
+        """
+        Return the percentage of the article sentences labeled as truthful.
+        :return: the percentage of the article sentences labeled as truthful
+        """
+        return self.truthfulness_percentage
+
+    def get_topics(self) -> list[str]:
+        """
+        Return the topics extracted from the article.
+        :return: the topics extracted from the article
+        """
+        return self.topics
@@ -0,0 +1,32 @@
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class CrawledArticleData:
+
+    def __init__(self, title: str = None, text: str = None):
+        """
+        Initialize a new instance of CrawledArticleData, the only parts of a parsed article the checker consumes
+        (small enough to be sent back by a crawler worker process).
+        :param title: parsed article title
+        :param text: parsed article text
+        """
+        self.title = title
+        self.text = text
+
+    def get_title(self) -> str:
+        """
+        Return the parsed article title.
+        :return: the parsed article title
+        """
+        return self.title
+
+    def get_text(self) -> str:
+        """
+        Return the parsed article text.
+        :return: the parsed article text
+        """
+        return self.text
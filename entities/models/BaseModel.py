@@ -55,4 +55,16 @@ def close_db():
     """
     Close existing connection to the database (is supposed to never crash).
     """
-    db_connection.close()
\ No newline at end of file
+    db_connection.close()
+
+
+def ping_db():
+    """
+    Open a connection to the database, run a trivial query and close it (raise an exception if the database
+    cannot be reached).
+    """
+    connect_to_db()
+    try:
+        db_connection.execute_sql('SELECT 1')
+    finally:
+        close_db()
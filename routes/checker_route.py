@@ -1,13 +1,16 @@
+import time
 from typing import Optional
 
 from flask import Blueprint, request, Response
 from services import constants_service as ct
 from services import checker_service as chk
-from services import crawler_service as cwl
+from services import crawler_pool as cwp
 from services import request_service as req
 from services import response_service as res
+from services import result_cache_service as rc
 from services.request_service import CheckerRequestValidity
-from newspaper import Article
+from entities.data.CheckerResultData import CheckerResultData
+from entities.data.CrawledArticleData import CrawledArticleData
 import gc
 
 
@@ -31,17 +34,29 @@ def check() -> Response:
     if req.is_invalid_request_json(request_validity):
         return _send_400_response(request_validity)
     url = request.json[ct.get_checker_endpoint_key()]
-    article = cwl.get_article_by_url(url)
+    models = chk.get_models()  # Used until the end of the request, even if a new model version is swapped in meanwhile
+    model_version = models.get_version()
+    cached_result = rc.get_result(model_version, url)
+    if cached_result is not None:
+        cached_fiability = cached_result.get_truthfulness_percentage() >= ct.get_truthfulness_percentage_threshold()
+        # A cached result still counts as a new search of the entry
+        _save_entry_data(url, cached_result.get_title(), cached_fiability, cached_result.get_topics())
+        return res.get_200_response(cached_result.get_truthfulness_percentage())
+    article = cwp.crawl(url)  # None once the crawler deadline is exceeded, if crawled by worker processes
     if _is_valid_article(article):
-        checker_response = chk.check(article.text)
-        topic_response = chk.check_topic(article.text)
+        start = time.perf_counter()
+        document = chk.analyze(article.text, models)  # Segmented and tokenized once for both models
+        analysis_duration = round((time.perf_counter() - start) * 1000, 3)
+        # Truthfulness scoring and topic extraction run at the same time
+        checker_response, topic_response, durations = chk.check_document_and_topic(document, models)
         _save_user_input_data(url, article, checker_response >= ct.get_truthfulness_percentage_threshold(), topic_response)
-        return res.get_200_response(checker_response)
+        rc.put_result(model_version, url, CheckerResultData(article.title, checker_response, topic_response))
+        return res.add_server_timing(res.get_200_response(checker_response), {'analysis': analysis_duration, **durations})
     else:
         return _send_400_response(CheckerRequestValidity.BAD_URL_PARSING)
 
 
-def _is_valid_article(article: Optional[Article]) -> bool:
+def _is_valid_article(article: Optional[CrawledArticleData]) -> bool:
     """
     Return True if the given article is valid, otherwise return False.
     :param article: parsed article
@@ -67,13 +82,25 @@ def _send_400_response(request_validity: CheckerRequestValidity) -> Response:
     return res.get_400_response(error_message)
 
 
-def _save_user_input_data(url: str, article: Article, fiability: bool, topic_response):
+def _save_user_input_data(url: str, article: CrawledArticleData, fiability: bool, topic_response):
     """
     Save source, trend and entry from the provided user input.
     :param url: article URL
     :param article: parsed article from given URL
     :param fiability: entry extracted truthfulness
     """
+    _save_entry_data(url, article.title, fiability, topic_response)
+
+
+def _save_entry_data(url: str, title: str, fiability: bool, topic_response):
+    """
+    Save source, trend and entry from the provided article URL, title, truthfulness and topics
+    (if the entry already exists, its search count is incremented).
+    :param url: article URL
+    :param title: article title
+    :param fiability: entry extracted truthfulness
+    :param topic_response: topics extracted from the article
+    """
     source_id = chk.add_source_by_url(url)
-    entry_id = chk.add_entry(source_id, article.title, fiability)
+    entry_id = chk.add_entry(source_id, title, fiability)
     chk.add_trend(topic_response, entry_id)
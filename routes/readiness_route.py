@@ -0,0 +1,27 @@
+from flask import Blueprint, Response
+from services import constants_service as ct
+from services import response_service as res
+from services import warm_up_service as ws
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+# Create the readiness route
+app_readiness = Blueprint('readiness', __name__)
+
+
+@app_readiness.route('', methods=['GET'])
+def get_readiness() -> Response:
+    """
+    Return a 200 OK Flask Response containing the warm-up report if the models are warmed up and the database
+    can be reached, otherwise return a 503 Service Unavailable containing the same report, so that the load
+    balancers only send traffic to warm workers.
+    :return: the warm-up report (readiness, duration of each warm-up stage, errors and active model version)
+    """
+    ready = ws.is_ready()
+    report = ws.get_report()
+    if ready:
+        return res.get_200_response(report)
+    return res.get_503_response(ct.get_not_ready_response_message(), report)
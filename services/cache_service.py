@@ -0,0 +1,176 @@
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+def get_entry_size(key: Hashable, value: Any) -> int:
+    """
+    Return the estimated memory size of a cache entry (shallow size of its key and of its value).
+    :param key: entry key
+    :param value: entry value
+    :return: the estimated entry size in bytes
+    """
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class LruCache:
+
+    def __init__(self, max_entries: int, max_bytes: Optional[int] = None,
+                 sizeof: Callable[[Hashable, Any], int] = get_entry_size, ttl: Optional[float] = None):
+        """
+        Initialize a new LruCache instance, a bounded thread-safe cache evicting its least recently used entries.
+        :param max_entries: maximum number of entries kept in the cache (0 disables the cache)
+        :param max_bytes: maximum estimated memory size of the cached entries (no memory cap if None)
+        :param sizeof: function returning the estimated memory size of an entry from its key and value
+        :param ttl: number of seconds after which a cached entry expires (entries never expire if None)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.expiration_times = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.lock = threading.Lock()
+        _instances.add(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value cached for the provided key and mark it as the most recently used one,
+        otherwise return the provided default value.
+        :param key: searched key
+        :param default: value returned when the key is not cached
+        :return: the cached value or the default value
+        """
+        with self.lock:
+            if key in self.entries and self.ttl is not None and self.expiration_times[key] <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Cache the provided value for the provided key, evicting the least recently used entries if the cache is full.
+        :param key: cached value key
+        :param value: value to cache
+        """
+        if self.max_entries <= 0:
+            return
+        size = self.sizeof(key, value) if self.max_bytes is not None else 0
+        with self.lock:
+            if key in self.entries:
+                self.bytes -= self.sizes[key]
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            self.sizes[key] = size
+            self.bytes += size
+            if self.ttl is not None:
+                self.expiration_times[key] = time.monotonic() + self.ttl
+            while len(self.entries) > self.max_entries \
+                    or (self.max_bytes is not None and self.bytes > self.max_bytes and len(self.entries) > 0):
+                self._remove(next(iter(self.entries)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        """
+        Remove the provided key from the cache (the lock must already be held by the caller).
+        :param key: cached key to remove
+        """
+        del self.entries[key]
+        self.bytes -= self.sizes.pop(key)
+        self.expiration_times.pop(key, None)
+
+    def clear(self):
+        """
+        Remove every entry from the cache (the statistics are kept).
+        """
+        with self.lock:
+            self.entries.clear()
+            self.sizes.clear()
+            self.expiration_times.clear()
+            self.bytes = 0
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Return the cache statistics, used to size the cache from the production traffic.
+        :return: a dictionary containing the current size (entries and estimated bytes), the maximum sizes, the hits,
+        the misses, the evictions and the expirations
+        """
+        with self.lock:
+            return {
+                'size': len(self.entries),
+                'max_entries': self.max_entries,
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
+
+
+# Caches of the process whose statistics are reported by the readiness endpoint, by name.
+_caches: dict[str, LruCache] = {}
+
+_caches_lock = threading.Lock()
+
+
+def register_cache(name: str, cache: LruCache) -> LruCache:
+    """
+    Register the provided cache under the provided name, so that its statistics are reported by the readiness
+    endpoint (a cache registered under the same name before is replaced).
+    :param name: name of the cache in the report
+    :param cache: cache to report
+    :return: the provided cache
+    """
+    with _caches_lock:
+        _caches[name] = cache
+    return cache
+
+
+def get_caches_stats() -> dict[str, dict[str, int]]:
+    """
+    Return the statistics of every registered cache (see the LruCache get_stats method).
+    :return: the statistics of each registered cache, by name
+    """
+    with _caches_lock:
+        caches = dict(_caches)
+    return {name: cache.get_stats() for name, cache in caches.items()}
+
+
+# Every cache of the process, whose lock is replaced in the forked processes (see the _reset_locks function).
+_instances = weakref.WeakSet()
+
+
+def _reset_locks():
+    """
+    Replace the locks of every cache by released ones, in a process just forked from the one using them: a lock
+    held by another thread at fork time (a request looking a lemma up) would never be released in the forked
+    process, hanging the inference worker processes on their first lookup.
+    """
+    global _caches_lock
+    _caches_lock = threading.Lock()
+    for cache in list(_instances):
+        cache.lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_locks)
@@ -1,5 +1,5 @@
+from ai.analyzed_document import AnalyzedDocument
 from ai.prediction_model import PredictionModel
-from ai.topic_model import TopicModel
 from repositories import source_repository as sr
 from repositories import trend_repository as tr
 from repositories import entry_repository as er
@@ -7,9 +7,22 @@ from entities.data.SourceData import SourceData
 from entities.data.TrendData import TrendData
 from entities.data.EntryData import EntryData
 from services import constants_service as ct
+from services import inference_executor as ie
+from services import inference_scheduler as sch
+from services import model_registry as mr
+from services import stage_executor as se
+from services.model_registry import ModelBundle
+from services import cache_service as cs
+from services.cache_service import LruCache
 
 from urllib.parse import urlparse
 from datetime import date
+from typing import Optional
+import hashlib
+import os
+import re
+import sys
+import time
 import gc
 
 
@@ -17,53 +30,198 @@ import gc
 gc.enable()
 
 
-# Model used to get truthfulness label from a provided text.
-# Declared here to avoid using too much RAM by reallocating memory each time it will be instantiated
-# because here it is called multiple times successively in a loop.
-model = PredictionModel()
+# Sentence verdicts (REAL / FAKE labels) shared across articles, since syndicated and templated news repeat the same
+# sentences (bylines, captions, footers). Keyed by the model version and by a hash of the normalized sentence.
+verdict_cache = cs.register_cache('verdict', LruCache(
+    max_entries=int(os.getenv(ct.get_verdict_cache_size_env_variable_label(), ct.get_default_verdict_cache_size())),
+    max_bytes=int(os.getenv(ct.get_verdict_cache_max_bytes_env_variable_label(),
+                            ct.get_default_verdict_cache_max_bytes())),
+    sizeof=lambda key, label: _get_verdict_cache_entry_size(key)
+))
 
-model_topic = TopicModel()
+# The verdicts of a previous model version can no longer be hit once a new version is swapped in.
+mr.registry.add_swap_listener(lambda models: verdict_cache.clear())
 
-def check(text: str) -> float:
+
+def get_models() -> ModelBundle:
+    """
+    Return the active models used to get the truthfulness label and the topics from a provided text.
+    Both are stateless and shared by every request (and every thread) of the process. A request must get them
+    once and use them until it ends, as a new model version may be swapped in meanwhile.
+    :return: the active model bundle
+    """
+    return mr.get_models()
+
+
+def analyze(text: str, models: Optional[ModelBundle] = None) -> AnalyzedDocument:
+    """
+    Return the analysis of the provided text shared by the truthfulness and topic models, so that the text is
+    segmented and tokenized once per request (by "." if the legacy sentence split is enabled).
+    :param text: provided text to analyze
+    :param models: models used to analyze the text (the active ones if None)
+    :return: the analyzed document
+    """
+    document = (models or get_models()).model.analyze(text)
+    if _is_legacy_sentence_split():
+        return AnalyzedDocument(text, text.split('.'), document.get_words())
+    return document
+
+
+def check(text: str, models: Optional[ModelBundle] = None) -> float:
     """
     Return the extracted truthfulness percentage from the provided text
     :param text: provided text to check
-    :return: the percentage of sentences labeled as truthful (sentences are here detected by splitting by ".").
+    :param models: models used to check the text (the active ones if None)
+    :return: the percentage of sentences labeled as truthful (0 if the text has no sentence worth scoring).
     """
-    sentences = text.split('.')
-    labels = [_get_truthfulness_label(sentence) for sentence in sentences]
+    models = models or get_models()
+    return check_document(analyze(text, models), models)
+
+
+def check_document(document: AnalyzedDocument, models: Optional[ModelBundle] = None) -> float:
+    """
+    Return the extracted truthfulness percentage from the provided analyzed document
+    :param document: provided document to check (returned by the analyze function)
+    :param models: models used to check the document (the active ones if None)
+    :return: the percentage of sentences labeled as truthful (0 if the document has no sentence worth scoring).
+    """
+    model = (models or get_models()).model
+    sentences = document.get_sentences()
+    if len(sentences) == 0:
+        return 0.0
+    labels = _get_truthfulness_labels(sentences, model)
     truthfulness_percentage = labels.count(ct.get_truthfulness_label()) / len(labels)
     return truthfulness_percentage.__round__(2)  # 2 decimals
 
 
+def check_document_and_topic(document: AnalyzedDocument, models: Optional[ModelBundle] = None) \
+        -> tuple[float, list[str], dict[str, float]]:
+    """
+    Return the extracted truthfulness percentage and topics from the provided analyzed document. If the inference
+    process pool is enabled, the topics are extracted by a worker process (another core) while the truthfulness is
+    scored, otherwise both stages run through the stage executor (one after the other by default: threads sharing
+    the GIL would not overlap them).
+    :param document: provided document to check (returned by the analyze function)
+    :param models: models used to check the document (the active ones if None)
+    :return: the truthfulness percentage, the list of topics extracted and the duration in milliseconds of each stage
+    """
+    models = models or get_models()
+    if ie.is_enabled():
+        pending_topics = ie.submit_topics(models.model_topic, document.get_words())
+        start = time.perf_counter()
+        truthfulness = check_document(document, models)
+        durations = {'truthfulness': round((time.perf_counter() - start) * 1000, 3)}
+        topics_and_duration = pending_topics.get()
+        if topics_and_duration is None:  # Worker forked with another topic model version (swapped in meanwhile)
+            start = time.perf_counter()
+            topics_and_duration = check_document_topic(document, models), \
+                round((time.perf_counter() - start) * 1000, 3)
+        durations['topics'] = topics_and_duration[1]
+        return truthfulness, topics_and_duration[0], durations
+    results, durations = se.run_stages({
+        'truthfulness': lambda: check_document(document, models),
+        'topics': lambda: check_document_topic(document, models)
+    })
+    return results['truthfulness'], results['topics'], durations
+
+
+def _is_legacy_sentence_split() -> bool:
+    """
+    Return True if the legacy sentence split (by ".", empty fragments included) is enabled by its environment
+    variable, otherwise return False.
+    :return: True if the legacy sentence split is enabled
+    """
+    return os.getenv(ct.get_legacy_sentence_split_env_variable_label(), '').lower() in ['1', 'true', 'yes']
+
+
 def _get_truthfulness_label(text: str) -> str:
     """
-    Return the extracted truthfulness from the provided text
+    Return the extracted truthfulness from the provided text, scored as a single sentence like the sentences of a
+    checked document
     :param text: provided text to check
     :return: REAL if the extracted article was labeled as truthful, FAKE on the contrary or None if the URL could not
     be parsed.
     """
-    model.set_text(text)
-    return model.predict()
+    return _get_truthfulness_labels([text])[0]
 
-def check_topic(text: str):
+
+def _get_truthfulness_labels(sentences: list[str], model: Optional[PredictionModel] = None) -> list[str]:
+    """
+    Return the extracted truthfulness of each provided sentence, all sentences being scored in a single batch.
+    :param sentences: provided sentences to check
+    :param model: model used to score the sentences (the active one if None)
+    :return: the list of REAL or FAKE labels, in the same order as the provided sentences
+    """
+    model = model or get_models().model
+    model_version = model.get_version()
+    keys = [_get_verdict_cache_key(model_version, sentence) for sentence in sentences]
+    labels = [verdict_cache.get(key) for key in keys]
+    missing_sentences = {}  # Unique sentences to predict, by cache key (the same sentence is predicted once only)
+    for key, sentence, label in zip(keys, sentences, labels):
+        if label is None and key not in missing_sentences:
+            missing_sentences[key] = sentence
+    predicted_labels = dict(zip(missing_sentences.keys(), _predict_many(list(missing_sentences.values()), model)))
+    for key, label in predicted_labels.items():
+        verdict_cache.put(key, label)
+    return [label if label is not None else predicted_labels[key] for key, label in zip(keys, labels)]
+
+
+def _predict_many(sentences: list[str], model: PredictionModel) -> list[str]:
+    """
+    Return the truthfulness label of each provided sentence, predicted by the inference worker processes if enabled,
+    otherwise micro-batched with the sentences of the concurrent requests if enabled, otherwise in the calling thread.
+    :param sentences: provided sentences to check
+    :param model: model used to score the sentences
+    :return: the list of REAL or FAKE labels, in the same order as the provided sentences
+    """
+    if ie.is_enabled():
+        return ie.predict_many(model, sentences)
+    return sch.predict_many(model, sentences)
+
+
+def _get_verdict_cache_key(model_version: str, sentence: str) -> tuple[str, bytes]:
+    """
+    Return the sentence verdict cache key of the provided sentence: the model version and the hash of the
+    normalized sentence. The normalization (lower case, repeated and surrounding spaces removal) never changes
+    the pre-processed text, hence never changes the predicted label.
+    :param model_version: version of the model predicting the sentence label
+    :param sentence: provided sentence
+    :return: the (model version, normalized sentence hash) tuple
+    """
+    normalized_sentence = re.sub(' +', ' ', str(sentence).lower()).strip(' ')
+    return model_version, hashlib.sha1(normalized_sentence.encode('utf-8')).digest()
+
+
+def _get_verdict_cache_entry_size(key: tuple[str, bytes]) -> int:
+    """
+    Return the estimated memory size of a sentence verdict cache entry (the labels are shared string constants,
+    so only the key is counted).
+    :param key: sentence verdict cache key
+    :return: the estimated entry size in bytes
+    """
+    return sys.getsizeof(key) + sys.getsizeof(key[0]) + sys.getsizeof(key[1])
+
+
+def check_topic(text: str, models: Optional[ModelBundle] = None):
     """
     Extracted topics from the provided text
     :param text: provided text to check to extract topics
+    :param models: models used to check the text (the active ones if None)
     :return: the list of topics extracted
     """
-    topic_list = _get_topic_label(text)
-    return topic_list
+    models = models or get_models()
+    return check_document_topic(analyze(text, models), models)
+
 
-def _get_topic_label(text: str):
+def check_document_topic(document: AnalyzedDocument, models: Optional[ModelBundle] = None) -> list[str]:
     """
-    Return the extracted list of topics from the provided text
-    :param text: provided text to check
+    Extracted topics from the provided analyzed document, reusing its word tokens
+    :param document: provided document to check (returned by the analyze function)
+    :param models: models used to check the document (the active ones if None)
     :return: the list of topics extracted
-    be parsed.
     """
-    model_topic.set_text(text)
-    return model_topic.predict()
+    return (models or get_models()).model_topic.predict_document(document)
+
 
 def add_source_by_url(url: str) -> int:
     """
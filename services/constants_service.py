@@ -37,6 +37,14 @@ def get_topics_endpoint_url_prefix() -> str:
     return 'topics'
 
 
+def get_readiness_endpoint_url_prefix() -> str:
+    """
+    Return the readiness endpoint url prefix
+    :return: the readiness endpoint url prefix
+    """
+    return 'ready'
+
+
 def get_truthfulness_label() -> str:
     """
     Return the label corresponding to some news checked as real.
@@ -137,6 +145,15 @@ def get_ok_response_message() -> str:
     return 'ok'
 
 
+def get_not_ready_response_message() -> str:
+    """
+    Return the value of the message associated with a 503 Service Unavailable Flask Response sent while the
+    application is warming up (or cannot reach its database).
+    :return: the value of the message
+    """
+    return 'Service en cours de démarrage, pas encore prêt'
+
+
 def get_title_key() -> str:
     """
     Return the title key used in a data dictionary.
@@ -222,4 +239,480 @@ def get_truthfulness_percentage_threshold() -> float:
     Return the percentage threshold from which a text can be labeled as truthful.
     :return: the threshold percentage (here a text will be considered truthful if it's at least 70% truthful)
     """
-    return 0.7
\ No newline at end of file
+    return 0.7
+
+
+def get_exact_pos_tagging_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting whether the position tagged words fed to the truthfulness
+    pipeline are computed exactly like the training notebook did ("false" enables the single tagging pass).
+    :return: the label of the exact position tagging compatibility environment variable
+    """
+    return 'FIABILITY_EXACT_POS_TAGGING'
+
+
+def get_default_exact_pos_tagging_compatibility() -> bool:
+    """
+    Return whether the position tagged words fed to the truthfulness pipeline are computed exactly like
+    the training notebook did by default (the pre-processed text is tokenized and position tagged a second time).
+    The current pickled pipeline was trained this way, so the single tagging pass (reusing the pre-processing tags)
+    must only be enabled with a pipeline retrained on features built with that same single pass
+    (see python_helper.preprocess_and_pos_tag).
+    :return: True to keep the training notebook features, False to use the single tagging pass
+    """
+    return True
+
+
+def get_lemma_cache_size_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the maximum number of lemmas kept by a lemma cache.
+    :return: the label of the lemma cache size environment variable
+    """
+    return 'FIABILITY_LEMMA_CACHE_SIZE'
+
+
+def get_default_lemma_cache_size() -> int:
+    """
+    Return the default maximum number of (token, WordNet position) lemmas kept by a lemma cache.
+    :return: an int containing the value 100000
+    """
+    return 100000
+
+
+def get_verdict_cache_size_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the maximum number of sentence verdicts kept in cache.
+    :return: the label of the sentence verdict cache size environment variable
+    """
+    return 'FIABILITY_VERDICT_CACHE_SIZE'
+
+
+def get_default_verdict_cache_size() -> int:
+    """
+    Return the default maximum number of sentence verdicts kept in cache.
+    :return: an int containing the value 200000
+    """
+    return 200000
+
+
+def get_verdict_cache_max_bytes_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the memory cap (in bytes) of the sentence verdict cache.
+    :return: the label of the sentence verdict cache memory cap environment variable
+    """
+    return 'FIABILITY_VERDICT_CACHE_MAX_BYTES'
+
+
+def get_default_verdict_cache_max_bytes() -> int:
+    """
+    Return the default memory cap (in bytes) of the sentence verdict cache.
+    :return: an int containing the value 33554432 (32 MiB)
+    """
+    return 32 * 1024 * 1024
+
+
+def get_result_cache_size_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the maximum number of checker results kept in cache.
+    :return: the label of the checker result cache size environment variable
+    """
+    return 'FIABILITY_RESULT_CACHE_SIZE'
+
+
+def get_default_result_cache_size() -> int:
+    """
+    Return the default maximum number of checker results (one per canonicalized URL) kept in cache.
+    :return: an int containing the value 1000
+    """
+    return 1000
+
+
+def get_result_cache_ttl_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the number of seconds a checker result stays cached.
+    :return: the label of the checker result cache TTL environment variable
+    """
+    return 'FIABILITY_RESULT_CACHE_TTL'
+
+
+def get_default_result_cache_ttl() -> int:
+    """
+    Return the default number of seconds a checker result stays cached.
+    :return: an int containing the value 3600 (1 hour)
+    """
+    return 3600
+
+
+def get_tracking_query_parameters() -> frozenset[str]:
+    """
+    Return the tracking query parameters removed from the URLs before using them as checker result cache keys
+    (besides every "utm_" prefixed parameter).
+    :return: the lower case names of the tracking query parameters
+    """
+    return frozenset(['fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'igshid', 'yclid', '_ga', '_hsenc',
+                      '_hsmi', 'ref_src', 'cmpid', 'ocid', 'at_medium', 'at_campaign', 'ns_source', 'ns_mchannel',
+                      'ns_campaign', 'ns_linkname', 'ns_fee'])
+
+
+def get_inference_workers_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the number of inference worker processes.
+    :return: the label of the inference workers environment variable
+    """
+    return 'FIABILITY_INFERENCE_WORKERS'
+
+
+def get_default_inference_workers() -> int:
+    """
+    Return the default number of inference worker processes (0 scores the sentences in the request thread).
+    :return: an int containing the value 0
+    """
+    return 0
+
+
+def get_min_inference_chunk_size() -> int:
+    """
+    Return the minimum number of sentences sent at once to an inference worker process, below which
+    the inter-process communication costs more than it saves.
+    :return: an int containing the value 16
+    """
+    return 16
+
+
+def get_legacy_sentence_split_env_variable_label() -> str:
+    """
+    Return the label of the environment variable enabling the legacy sentence split of the checked texts
+    (splitting by ".", so that percentages stay comparable with the ones computed before the punkt segmentation).
+    :return: the label of the legacy sentence split environment variable
+    """
+    return 'FIABILITY_LEGACY_SENTENCE_SPLIT'
+
+
+def get_inference_max_batch_size_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the maximum number of sentences per inference micro-batch.
+    :return: the label of the inference micro-batch size environment variable
+    """
+    return 'FIABILITY_INFERENCE_MAX_BATCH_SIZE'
+
+
+def get_default_inference_max_batch_size() -> int:
+    """
+    Return the default maximum number of sentences per inference micro-batch (0 disables the micro-batching).
+    :return: an int containing the value 0
+    """
+    return 0
+
+
+def get_inference_max_wait_ms_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the maximum number of milliseconds an inference
+    micro-batch waits for other requests.
+    :return: the label of the inference micro-batch waiting time environment variable
+    """
+    return 'FIABILITY_INFERENCE_MAX_WAIT_MS'
+
+
+def get_default_inference_max_wait_ms() -> float:
+    """
+    Return the default maximum number of milliseconds an inference micro-batch waits for other requests.
+    :return: a float containing the value 5
+    """
+    return 5.0
+
+
+def get_artifacts_directory_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the directory of the memory-mapped model artifacts.
+    :return: the label of the model artifacts directory environment variable
+    """
+    return 'FIABILITY_ARTIFACTS_DIR'
+
+
+def get_default_artifacts_directory() -> str:
+    """
+    Return the default directory of the memory-mapped model artifacts (built from the pickles by the
+    ai.convert_artifacts tool). The pickles are loaded instead when the artifacts are missing.
+    :return: a string containing the value ai/artifacts
+    """
+    return 'ai/artifacts'
+
+
+def get_model_watch_interval_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the number of seconds between two checks of the model
+    files by the model registry (a new model version is then loaded and swapped in without restarting).
+    :return: the label of the model watch interval environment variable
+    """
+    return 'FIABILITY_MODEL_WATCH_INTERVAL'
+
+
+def get_default_model_watch_interval() -> float:
+    """
+    Return the default number of seconds between two checks of the model files (0 disables the watching).
+    :return: a float containing the value 30
+    """
+    return 30.0
+
+
+def get_warm_up_text() -> str:
+    """
+    Return the representative article text run through the models to warm them up before they serve requests.
+    :return: the warm-up article text
+    """
+    return 'The government announced on Monday a new plan to reduce the public deficit by 2 percent. ' \
+           'According to officials, the measures will mostly target health and education spending. ' \
+           'Opposition leaders said the plan would hurt families and called for protests across the country.'
+
+
+def get_nltk_data_directory_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the local NLTK data directory (also read by NLTK itself
+    and by the Heroku NLTK buildpack, which installs the packages listed in nltk.txt there).
+    :return: the label of the NLTK data directory environment variable
+    """
+    return 'NLTK_DATA'
+
+
+def get_import_time_budget_env_variable_label() -> str:
+    """
+    Return the label of the environment variable overriding the import time budget of the serving path
+    dependencies (checked by the import time budget test).
+    :return: the label of the import time budget environment variable
+    """
+    return 'FIABILITY_IMPORT_TIME_BUDGET_MS'
+
+
+def get_default_import_time_budget_ms() -> float:
+    """
+    Return the default cumulative import time budget of the serving path dependencies, in milliseconds (about
+    2300 to 2550 measured, scikit-learn and SciPy taking two thirds of it, with a small margin).
+    :return: a float containing the value 2800
+    """
+    return 2800.0
+
+
+def get_stage_workers_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the number of threads running the checker stages
+    (truthfulness scoring and topic extraction) at the same time.
+    :return: the label of the stage workers environment variable
+    """
+    return 'FIABILITY_STAGE_WORKERS'
+
+
+def get_default_stage_workers() -> int:
+    """
+    Return the default number of threads running the checker stages at the same time (0 runs them one after the
+    other in the request thread). The stages hold the GIL most of the time, so threads do not overlap them: they
+    only overlap in separate processes, through the inference process pool.
+    :return: an int containing the value 0
+    """
+    return 0
+
+
+def get_server_timing_header() -> str:
+    """
+    Return the name of the response header exposing the duration of each stage of a request.
+    :return: a string containing the value "Server-Timing"
+    """
+    return 'Server-Timing'
+
+
+def get_fetch_connect_timeout_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the number of seconds allowed to connect to a publisher.
+    :return: the label of the fetch connect timeout environment variable
+    """
+    return 'FIABILITY_FETCH_CONNECT_TIMEOUT'
+
+
+def get_default_fetch_connect_timeout() -> float:
+    """
+    Return the default number of seconds allowed to connect to a publisher.
+    :return: a float containing the value 3.05
+    """
+    return 3.05
+
+
+def get_fetch_read_timeout_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the maximum number of seconds between two received bytes
+    of a publisher response.
+    :return: the label of the fetch read timeout environment variable
+    """
+    return 'FIABILITY_FETCH_READ_TIMEOUT'
+
+
+def get_default_fetch_read_timeout() -> float:
+    """
+    Return the default maximum number of seconds between two received bytes of a publisher response.
+    :return: a float containing the value 7.0
+    """
+    return 7.0
+
+
+def get_fetch_total_timeout_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the maximum number of seconds spent to fetch an article
+    (connection, response headers, redirections and body download included).
+    :return: the label of the fetch total timeout environment variable
+    """
+    return 'FIABILITY_FETCH_TOTAL_TIMEOUT'
+
+
+def get_default_fetch_total_timeout() -> float:
+    """
+    Return the default maximum number of seconds spent to fetch an article.
+    :return: a float containing the value 15.0
+    """
+    return 15.0
+
+
+def get_fetch_max_body_bytes_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the maximum size of a fetched article body.
+    :return: the label of the fetch maximum body size environment variable
+    """
+    return 'FIABILITY_FETCH_MAX_BODY_BYTES'
+
+
+def get_default_fetch_max_body_bytes() -> int:
+    """
+    Return the default maximum size of a fetched article body, in bytes.
+    :return: an int containing the value 5 MiB
+    """
+    return 5 * 1024 * 1024
+
+
+def get_fetch_pool_hosts_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the number of publisher hosts whose connections are kept
+    alive by the fetch connection pool.
+    :return: the label of the fetch pool hosts environment variable
+    """
+    return 'FIABILITY_FETCH_POOL_HOSTS'
+
+
+def get_default_fetch_pool_hosts() -> int:
+    """
+    Return the default number of publisher hosts whose connections are kept alive.
+    :return: an int containing the value 32
+    """
+    return 32
+
+
+def get_fetch_pool_size_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the number of connections kept alive per publisher host.
+    :return: the label of the fetch pool size environment variable
+    """
+    return 'FIABILITY_FETCH_POOL_SIZE'
+
+
+def get_default_fetch_pool_size() -> int:
+    """
+    Return the default number of connections kept alive per publisher host.
+    :return: an int containing the value 4
+    """
+    return 4
+
+
+def get_http_cache_directory_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the directory of the HTTP cache of the fetched articles.
+    :return: the label of the HTTP cache directory environment variable
+    """
+    return 'FIABILITY_HTTP_CACHE_DIR'
+
+
+def get_default_http_cache_directory() -> str:
+    """
+    Return the default directory of the HTTP cache of the fetched articles.
+    :return: a string containing the value ".cache/http"
+    """
+    return '.cache/http'
+
+
+def get_http_cache_max_bytes_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the disk quota of the HTTP cache of the fetched articles.
+    :return: the label of the HTTP cache disk quota environment variable
+    """
+    return 'FIABILITY_HTTP_CACHE_MAX_BYTES'
+
+
+def get_default_http_cache_max_bytes() -> int:
+    """
+    Return the default disk quota of the HTTP cache of the fetched articles, in bytes (0 disables the HTTP cache).
+    :return: an int containing the value 256 MiB
+    """
+    return 256 * 1024 * 1024
+
+
+def get_extraction_profile_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the newspaper extraction profile of the checked articles.
+    :return: the label of the extraction profile environment variable
+    """
+    return 'FIABILITY_EXTRACTION_PROFILE'
+
+
+def get_default_extraction_profile() -> str:
+    """
+    Return the default newspaper extraction profile ("text" only extracts the title and the text, "full" runs the
+    whole default newspaper extraction).
+    :return: a string containing the value "text"
+    """
+    return 'text'
+
+
+def get_crawler_workers_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the number of crawler worker processes.
+    :return: the label of the crawler workers environment variable
+    """
+    return 'FIABILITY_CRAWLER_WORKERS'
+
+
+def get_default_crawler_workers() -> int:
+    """
+    Return the default number of crawler worker processes (0 crawls the articles in the request thread).
+    :return: an int containing the value 0
+    """
+    return 0
+
+
+def get_crawler_deadline_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the maximum number of seconds a crawler worker process may
+    spend on an article before being killed.
+    :return: the label of the crawler deadline environment variable
+    """
+    return 'FIABILITY_CRAWLER_DEADLINE'
+
+
+def get_default_crawler_deadline() -> float:
+    """
+    Return the default maximum number of seconds a crawler worker process may spend on an article (above the total
+    fetch timeout, so that it mostly bounds the parsing).
+    :return: a float containing the value 20.0
+    """
+    return 20.0
+
+
+def get_crawler_max_jobs_per_worker_env_variable_label() -> str:
+    """
+    Return the label of the environment variable setting the number of articles after which a crawler worker process
+    is replaced.
+    :return: the label of the crawler maximum jobs per worker environment variable
+    """
+    return 'FIABILITY_CRAWLER_MAX_JOBS_PER_WORKER'
+
+
+def get_default_crawler_max_jobs_per_worker() -> int:
+    """
+    Return the default number of articles after which a crawler worker process is replaced.
+    :return: an int containing the value 100
+    """
+    return 100
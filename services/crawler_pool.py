@@ -0,0 +1,236 @@
+import atexit
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from multiprocessing import forkserver
+from multiprocessing.connection import Connection
+from typing import Callable, Optional
+
+from entities.data.CrawledArticleData import CrawledArticleData
+from services import constants_service as ct
+from services import crawler_service as cwl
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class CrawlerWorker:
+
+    def __init__(self, context, crawl_article: Callable[[str], Optional[CrawledArticleData]]):
+        """
+        Initialize a new CrawlerWorker instance, an isolated process fetching and parsing the articles sent to it one
+        at a time. Unlike a thread, the process can be killed when a pathological page makes it spin or hang.
+        :param context: multiprocessing context used to start the process
+        :param crawl_article: module-level function run by the process to crawl an article URL
+        """
+        self.connection, worker_connection = context.Pipe()
+        self.process = context.Process(target=_serve, args=(worker_connection, crawl_article), name='crawler-worker',
+                                       daemon=True)
+        self.process.start()
+        worker_connection.close()
+        self.jobs_count = 0
+
+    def crawl(self, url: str, timeout: float) -> Optional[CrawledArticleData]:
+        """
+        Return the article of the provided URL fetched and parsed by the worker process.
+        :param url: article URL
+        :param timeout: maximum number of seconds to wait for the article
+        :return: the crawled article or None if it could not be fetched or parsed
+        :raise TimeoutError: if the article was not returned in time (the worker must then be stopped)
+        :raise EOFError: if the worker process died
+        """
+        self.jobs_count += 1
+        self.connection.send(url)
+        if not self.connection.poll(max(timeout, 0)):
+            raise TimeoutError(f'Crawling {url} exceeded its deadline')
+        return self.connection.recv()
+
+    def is_alive(self) -> bool:
+        """
+        Return True if the worker process is running, otherwise return False.
+        :return: True if the worker process is running
+        """
+        return self.process.is_alive()
+
+    def stop(self):
+        """
+        Kill the worker process, whatever it is doing.
+        """
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+def _serve(connection: Connection, crawl_article: Callable[[str], Optional[CrawledArticleData]]):
+    """
+    Crawl the article of each URL received from the provided connection and send it back, until the connection
+    is closed.
+    :param connection: worker side of the pipe
+    :param crawl_article: function crawling an article URL
+    """
+    while True:
+        try:
+            url = connection.recv()
+        except EOFError:
+            return
+        connection.send(crawl_article(url))
+
+
+class CrawlerPool:
+
+    def __init__(self, workers_count: int, deadline: float, max_jobs_per_worker: int,
+                 crawl_article: Callable[[str], Optional[CrawledArticleData]] = cwl.get_crawled_article_by_url):
+        """
+        Initialize a new CrawlerPool instance, a pool of crawler worker processes started on demand. Each crawl has
+        a wall-clock deadline (waiting for an idle worker included): a worker exceeding it is killed and replaced,
+        and a worker is also replaced after a number of crawls, releasing whatever memory its parses leaked.
+        The workers are forked by a fork server started from a fresh interpreter, never from the calling process:
+        a fork of a process running other threads would inherit the locks they hold (fetcher, cache, logging
+        locks) and could hang on them forever.
+        :param workers_count: number of crawler worker processes
+        :param deadline: maximum number of seconds a crawl may take
+        :param max_jobs_per_worker: number of crawls after which a worker process is replaced
+        :param crawl_article: module-level function run by the worker processes to crawl an article URL
+        """
+        self.deadline = deadline
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.crawl_article = crawl_article
+        self.context = multiprocessing.get_context('forkserver')
+        # The fork server imports the crawler once, so that each worker is forked with newspaper already loaded
+        self.context.set_forkserver_preload(['services.crawler_service'])
+        forkserver.ensure_running()  # Started now rather than within the deadline of the first crawl
+        self.workers = queue.Queue()  # Idle workers (None for a worker slot whose process is not started yet)
+        for _ in range(workers_count):
+            self.workers.put(None)
+
+    def crawl(self, url: str) -> Optional[CrawledArticleData]:
+        """
+        Return the article of the provided URL fetched and parsed by a worker process.
+        :param url: article URL
+        :return: the crawled article or None if it could not be fetched or parsed before the deadline
+        """
+        deadline = time.monotonic() + self.deadline
+        try:
+            worker = self.workers.get(timeout=max(deadline - time.monotonic(), 0))
+        except queue.Empty:
+            logging.error('No crawler worker available before the deadline of {}'.format(url))
+            return None
+        if time.monotonic() >= deadline:  # The job is not sent to a worker which could not return it in time
+            self.workers.put(worker)
+            logging.error('No crawler worker available before the deadline of {}'.format(url))
+            return None
+        try:
+            if worker is None or not worker.is_alive():
+                worker = self._replace(worker)
+            return worker.crawl(url, deadline - time.monotonic())
+        except (TimeoutError, EOFError, OSError) as ex:
+            logging.error('Crawler worker stopped while crawling {}: {}'.format(url, repr(ex)))
+            worker = self._replace(worker, start=False)
+            return None
+        finally:
+            if worker is not None and worker.jobs_count >= self.max_jobs_per_worker:
+                worker = self._replace(worker, start=False)
+            self.workers.put(worker)
+
+    def _replace(self, worker: Optional[CrawlerWorker], start: bool = True) -> Optional[CrawlerWorker]:
+        """
+        Stop the provided worker if any and return a new one.
+        :param worker: worker to replace (None for a worker slot whose process is not started yet)
+        :param start: whether the new worker process is started now or by the next crawl of its slot
+        :return: the new worker (None if not started)
+        """
+        if worker is not None:
+            worker.stop()
+        return CrawlerWorker(self.context, self.crawl_article) if start else None
+
+    def shutdown(self):
+        """
+        Kill the idle worker processes (the busy ones are killed by the crawl they run once it ends).
+        """
+        while True:
+            try:
+                worker = self.workers.get_nowait()
+            except queue.Empty:
+                return
+            if worker is not None:
+                worker.stop()
+
+
+# Crawler pool of the current process, created on its first crawl (processes must not be shared with the forked
+# gunicorn workers).
+_pool: Optional[CrawlerPool] = None
+
+# Id of the process which created the crawler pool.
+_pool_pid: Optional[int] = None
+
+_pool_lock = threading.Lock()
+
+
+def get_workers_count() -> int:
+    """
+    Return the number of crawler worker processes, read from its environment variable if set, otherwise its default
+    value (0 crawls the articles in the calling thread).
+    :return: the number of crawler worker processes
+    """
+    return int(os.getenv(ct.get_crawler_workers_env_variable_label(), ct.get_default_crawler_workers()))
+
+
+def is_enabled() -> bool:
+    """
+    Return True if the articles are crawled by the crawler worker processes, otherwise return False.
+    :return: True if the crawler pool is enabled
+    """
+    return get_workers_count() > 0
+
+
+def crawl(url: str) -> Optional[CrawledArticleData]:
+    """
+    Return the article of the provided URL, crawled by the crawler worker processes if enabled, otherwise in the
+    calling thread.
+    :param url: article URL
+    :return: the crawled article or None if it could not be fetched or parsed (before the deadline if the crawler
+    pool is enabled)
+    """
+    if not is_enabled():
+        return cwl.get_crawled_article_by_url(url)
+    return _get_pool().crawl(url)
+
+
+def _get_pool() -> CrawlerPool:
+    """
+    Return the crawler pool of the current process, creating it from the crawler settings if needed.
+    :return: the crawler pool of the current process
+    """
+    global _pool, _pool_pid
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                _pool = CrawlerPool(
+                    workers_count=get_workers_count(),
+                    deadline=float(os.getenv(ct.get_crawler_deadline_env_variable_label(),
+                                             ct.get_default_crawler_deadline())),
+                    max_jobs_per_worker=int(os.getenv(ct.get_crawler_max_jobs_per_worker_env_variable_label(),
+                                                      ct.get_default_crawler_max_jobs_per_worker()))
+                )
+                _pool_pid = os.getpid()
+    return _pool
+
+
+def shutdown():
+    """
+    Kill the idle crawler worker processes created by the current process, if any.
+    """
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.shutdown()
+        _pool = None
+        _pool_pid = None
+
+
+atexit.register(shutdown)
@@ -1,7 +1,16 @@
 import logging
+import os
 from typing import Optional
 
-from newspaper import Article, ArticleException
+import requests
+from newspaper import Article, ArticleException, Config
+from newspaper.article import ArticleDownloadState
+
+from entities.data.CrawledArticleData import CrawledArticleData
+from services import constants_service as ct
+from services import http_cache as hc
+from services import http_fetcher as hf
+from services.http_cache import CachedPage
 import gc
 
 
@@ -9,18 +18,88 @@ import gc
 gc.enable()
 
 
+class TextOnlyArticle(Article):
+    """
+    Article only extracting what the checker consumes (title and text): no image discovery, scoring or download,
+    and the HTML and DOM trees are released as soon as the title and text are extracted.
+    """
+
+    def fetch_images(self):
+        """
+        Skip the image discovery, the meta image scoring and the top image download.
+        """
+
+    def release_resources(self):
+        """
+        Release the HTML and the DOM trees of the parsed article (the title and text are kept).
+        """
+        super().release_resources()
+        self.html = ''
+        self.article_html = ''
+        self.doc = None
+        self.clean_doc = None
+        self.top_node = None
+        self.clean_top_node = None
+
+
+def get_extraction_profile() -> str:
+    """
+    Return the newspaper extraction profile, read from its environment variable if set, otherwise its default value:
+    "text" only extracts the title and the text, "full" runs the whole default newspaper extraction.
+    :return: the extraction profile
+    """
+    return os.getenv(ct.get_extraction_profile_env_variable_label(), ct.get_default_extraction_profile())
+
+
+def get_text_only_config() -> Config:
+    """
+    Return the newspaper configuration of the text only extraction profile.
+    :return: a newspaper configuration without image fetching, article HTML or meta refresh following
+    """
+    config = Config()
+    config.fetch_images = False
+    config.keep_article_html = False
+    config.follow_meta_refresh = False
+    return config
+
+
+def create_article(url: str, profile: Optional[str] = None) -> Article:
+    """
+    Return a new Article object of the provided URL, extracted with the provided extraction profile.
+    :param url: article URL
+    :param profile: extraction profile, "text" or "full" (the configured one if None)
+    :return: the new Article object
+    """
+    if (profile or get_extraction_profile()) == 'full':
+        return Article(url)
+    return TextOnlyArticle(url, config=get_text_only_config())
+
+
 def get_article_by_url(url: str) -> Optional[Article]:
     """
     Return the parsed Article object from the provided URL if the provided URL is valid and if the article
-    was correctly parsed, otherwise return None.
+    was correctly parsed, otherwise return None. The page is fetched by the shared time and size bounded fetcher
+    and only parsed by newspaper. A page already in the HTTP cache is revalidated instead of downloaded again,
+    and is not parsed again if its content did not change.
     :param url: The provided article URL.
     :return: the parsed Article object from the provided URL if the provided URL is valid and if the article
     was correctly parsed, otherwise return None.
     """
     try:
-        article = Article(url)
-        article.download()
+        cache = hc.get_cache()
+        cached_page = cache.get(url) if cache is not None else None
+        page = hf.fetch(url, cached_page.get_validators() if cached_page is not None else None)
+        if cached_page is not None \
+                and (page.status_code == 304 or hc.get_content_hash(page.body) == cached_page.content_hash):
+            return _get_cached_article(url, cache.revalidate(cached_page, page))
+        article = create_article(url)
+        article.download(input_html=page.html)
         article.parse()
+        if cache is not None and article.is_parsed and page.status_code == 200:
+            cache.put(url, page, article.title, article.text)
+    except (hf.FetchError, requests.RequestException) as ex:
+        logging.exception('Could not fetch the article from url {}. Raised Exception : {}'.format(url, ex))
+        return None
     except ArticleException as ex:
         logging.exception('Invalid provided URL {}. Raised ArticleException : {}'.format(url, ex))
         return None
@@ -30,4 +109,32 @@ def get_article_by_url(url: str) -> Optional[Article]:
         return None
     if not article.is_parsed:
         return None
-    return article
\ No newline at end of file
+    return article
+
+
+def get_crawled_article_by_url(url: str) -> Optional[CrawledArticleData]:
+    """
+    Return the title and text of the article parsed from the provided URL (see get_article_by_url), otherwise None.
+    :param url: The provided article URL.
+    :return: the crawled article or None if the article could not be fetched or parsed
+    """
+    article = get_article_by_url(url)
+    if article is None:
+        return None
+    return CrawledArticleData(article.title, article.text)
+
+
+def _get_cached_article(url: str, cached_page: CachedPage) -> Article:
+    """
+    Return the Article object of the provided cached page, filled with the title and text parsed when the page was
+    cached instead of parsing the page again (its HTML is not kept).
+    :param url: article URL
+    :param cached_page: cached page of the article
+    :return: the parsed Article object
+    """
+    article = create_article(url)
+    article.download_state = ArticleDownloadState.SUCCESS
+    article.title = cached_page.title
+    article.text = cached_page.text
+    article.is_parsed = True
+    return article
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import os
+import threading
+import uuid
+from typing import Optional
+
+from services import constants_service as ct
+from services.http_fetcher import FetchedPage
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class CachedPage:
+
+    def __init__(self, url: str, etag: Optional[str], last_modified: Optional[str], content_hash: str, title: str,
+                 text: str):
+        """
+        Initialize a new CachedPage instance, a fetched article page recorded in the HTTP cache by its validators,
+        the hash of its body and the title and text newspaper parsed from it.
+        :param url: fetched article URL
+        :param etag: ETag header of the page response (None if not provided)
+        :param last_modified: Last-Modified header of the page response (None if not provided)
+        :param content_hash: hash of the page body
+        :param title: article title parsed from the page
+        :param text: article text parsed from the page
+        """
+        self.url = url
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
+        self.title = title
+        self.text = text
+
+    def get_validators(self) -> dict[str, str]:
+        """
+        Return the conditional request headers revalidating the cached page: the publisher answers 304 Not Modified
+        without any body if the page did not change.
+        :return: the If-None-Match and If-Modified-Since headers (only the ones whose validator is known)
+        """
+        validators = {}
+        if self.etag is not None:
+            validators['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            validators['If-Modified-Since'] = self.last_modified
+        return validators
+
+
+class HttpCache:
+
+    def __init__(self, directory: str, max_bytes: int):
+        """
+        Initialize a new HttpCache instance, a persistent cache of the fetched article pages shared by every process
+        using the same directory. Each page is stored in a descriptor file holding its validators, the hash of its
+        body and the title and text parsed from it (the body itself is not kept: a changed page is parsed again).
+        The least recently used pages are evicted once the cached files exceed the disk quota.
+        :param directory: directory of the cached files (created if needed)
+        :param max_bytes: disk quota of the cached files, in bytes
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.eviction_lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """
+        Return the cached page of the provided URL and mark it as the most recently used one, otherwise return None.
+        :param url: article URL
+        :return: the cached page or None
+        """
+        descriptor_path = self._get_path(url)
+        try:
+            with open(descriptor_path, 'r', encoding='utf-8') as f:
+                descriptor = json.load(f)
+            os.utime(descriptor_path)
+        except (OSError, ValueError):
+            return None  # Not cached, being evicted or corrupted
+        if descriptor.get('url') != url:
+            return None
+        return CachedPage(url, descriptor['etag'], descriptor['last_modified'], descriptor['content_hash'],
+                          descriptor['title'], descriptor['text'])
+
+    def put(self, url: str, page: FetchedPage, title: str, text: str) -> CachedPage:
+        """
+        Cache the provided fetched page of the provided URL and the article title and text parsed from it, then
+        evict the least recently used pages if the disk quota is exceeded.
+        :param url: article URL
+        :param page: fetched page (200 response)
+        :param title: article title parsed from the page
+        :param text: article text parsed from the page
+        :return: the cached page
+        """
+        cached_page = CachedPage(url, page.headers.get('ETag'), page.headers.get('Last-Modified'),
+                                 get_content_hash(page.body), title, text)
+        self._write(cached_page)
+        self.evict()
+        return cached_page
+
+    def revalidate(self, cached_page: CachedPage, page: FetchedPage) -> CachedPage:
+        """
+        Update the validators of the provided cached page from the provided response, which either is a 304 Not
+        Modified response or has the same body as the cached page (the parsed article is kept).
+        :param cached_page: cached page revalidated by the response
+        :param page: revalidation response
+        :return: the updated cached page
+        """
+        revalidated_page = CachedPage(cached_page.url, page.headers.get('ETag', cached_page.etag),
+                                      page.headers.get('Last-Modified', cached_page.last_modified),
+                                      cached_page.content_hash, cached_page.title, cached_page.text)
+        self._write(revalidated_page)
+        return revalidated_page
+
+    def evict(self):
+        """
+        Remove the least recently used cached pages until the cached files fit in the disk quota.
+        """
+        with self.eviction_lock:
+            pages = []  # (last use time, descriptor path, size) of each cached page
+            total_size = 0
+            for entry in os.scandir(self.directory):
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                pages.append((stat.st_mtime, entry.path, stat.st_size))
+                total_size += stat.st_size
+            for _, descriptor_path, size in sorted(pages):
+                if total_size <= self.max_bytes:
+                    break
+                try:
+                    os.remove(descriptor_path)
+                except OSError:
+                    pass
+                total_size -= size
+
+    def _write(self, cached_page: CachedPage):
+        """
+        Write the descriptor file of the provided cached page atomically (replaced, never partially written).
+        :param cached_page: cached page to write
+        """
+        descriptor = {'url': cached_page.url, 'etag': cached_page.etag, 'last_modified': cached_page.last_modified,
+                      'content_hash': cached_page.content_hash, 'title': cached_page.title, 'text': cached_page.text}
+        _replace_file(self._get_path(cached_page.url), json.dumps(descriptor).encode('utf-8'))
+
+    def _get_path(self, url: str) -> str:
+        """
+        Return the path of the descriptor file of the provided URL.
+        :param url: article URL
+        :return: the descriptor file path
+        """
+        return os.path.join(self.directory, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
+
+
+def get_content_hash(body: bytes) -> str:
+    """
+    Return the hash of the provided page body, which changes whenever the page content changes.
+    :param body: page body
+    :return: the hexadecimal body hash
+    """
+    return hashlib.sha256(body).hexdigest()
+
+
+def _replace_file(path: str, content: bytes):
+    """
+    Write the provided content in a temporary file, then atomically replace the file of the provided path with it.
+    :param path: path of the replaced file
+    :param content: file content
+    """
+    tmp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+# HTTP cache of the process, created on its first use (None if disabled).
+_cache: Optional[HttpCache] = None
+
+_cache_created = False
+
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> Optional[HttpCache]:
+    """
+    Return the HTTP cache of the process, created from the HTTP cache settings on the first call, or None if the
+    HTTP cache is disabled (disk quota of 0).
+    :return: the HTTP cache or None
+    """
+    global _cache, _cache_created
+    if not _cache_created:
+        with _cache_lock:
+            if not _cache_created:
+                max_bytes = int(os.getenv(ct.get_http_cache_max_bytes_env_variable_label(),
+                                          ct.get_default_http_cache_max_bytes()))
+                if max_bytes > 0:
+                    _cache = HttpCache(os.getenv(ct.get_http_cache_directory_env_variable_label(),
+                                                 ct.get_default_http_cache_directory()), max_bytes)
+                _cache_created = True
+    return _cache
@@ -0,0 +1,321 @@
+import os
+import socket
+import threading
+from typing import Mapping, Optional
+
+import requests
+from newspaper import Config
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from services import constants_service as ct
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+# Encoding assumed by requests when the response does not declare any (newspaper then looks for it in the HTML).
+_FAIL_ENCODING = 'ISO-8859-1'
+
+# Number of bytes read at once from a response body.
+_CHUNK_SIZE = 64 * 1024
+
+
+class FetchError(Exception):
+    """
+    Raised when an article cannot be fetched within the fetch limits (total timeout or maximum body size).
+    """
+
+
+class FetchedPage:
+
+    def __init__(self, url: str, status_code: int, headers: Mapping[str, str], body: bytes, html: str):
+        """
+        Initialize a new FetchedPage instance, the fetched response of an article URL.
+        :param url: final URL of the article (after the redirections)
+        :param status_code: HTTP status code of the response
+        :param headers: HTTP headers of the response (case-insensitive names)
+        :param body: raw response body
+        :param html: response body decoded like newspaper does it
+        """
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self.html = html
+
+
+class _Watch:
+
+    def __init__(self):
+        """
+        Initialize a new _Watch instance, which keeps the sockets used by a fetch (every redirection hop included)
+        to shut them down once the fetch deadline is reached.
+        """
+        self.sockets = []
+        self.expired = False
+        self.lock = threading.Lock()
+
+    def add(self, sock: socket.socket):
+        """
+        Watch the provided socket, shutting it down at once if the deadline is already reached.
+        :param sock: socket connected to a publisher
+        """
+        with self.lock:
+            self.sockets.append(sock)
+            if self.expired:
+                _shutdown(sock)
+
+    def expire(self):
+        """
+        Shut the watched sockets down, so that their pending reads (response headers or body) end at once.
+        """
+        with self.lock:
+            self.expired = True
+            for sock in self.sockets:
+                _shutdown(sock)
+
+
+# Watch of the fetch running in the current thread, if any.
+_watches = threading.local()
+
+
+def _watch_socket(sock: Optional[socket.socket]):
+    """
+    Watch the provided socket with the watch of the fetch running in the current thread, if any. The socket is kept
+    even once the connection drops it (a "Connection: close" or HTTP/1.0 response keeps reading from it).
+    :param sock: socket connected to a publisher
+    """
+    watch = getattr(_watches, 'watch', None)
+    if watch is not None and sock is not None:
+        watch.add(sock)
+
+
+def _shutdown(sock: socket.socket):
+    """
+    Shut the provided socket down, ignoring an already closed socket.
+    :param sock: socket to shut down
+    """
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+
+
+class _WatchedHTTPConnection(HTTPConnection):
+
+    def connect(self):
+        """
+        Connect to the publisher and watch the new socket.
+        """
+        super().connect()
+        _watch_socket(self.sock)
+
+
+class _WatchedHTTPSConnection(HTTPSConnection):
+
+    def connect(self):
+        """
+        Connect to the publisher and watch the new socket.
+        """
+        super().connect()
+        _watch_socket(self.sock)
+
+
+class _WatchedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _WatchedHTTPConnection
+
+    def _get_conn(self, timeout=None):
+        """
+        Return a connection of the pool, watching its socket if it is already connected.
+        :param timeout: number of seconds to wait for a free connection
+        :return: the connection
+        """
+        connection = super()._get_conn(timeout)
+        _watch_socket(connection.sock)
+        return connection
+
+
+class _WatchedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _WatchedHTTPSConnection
+
+    def _get_conn(self, timeout=None):
+        """
+        Return a connection of the pool, watching its socket if it is already connected.
+        :param timeout: number of seconds to wait for a free connection
+        :return: the connection
+        """
+        connection = super()._get_conn(timeout)
+        _watch_socket(connection.sock)
+        return connection
+
+
+class _WatchedHTTPAdapter(HTTPAdapter):
+
+    def init_poolmanager(self, *args, **kwargs):
+        """
+        Initialize the pool manager with connection pools whose sockets are watched by the running fetch.
+        """
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': _WatchedHTTPConnectionPool,
+                                                   'https': _WatchedHTTPSConnectionPool}
+
+
+class HttpFetcher:
+
+    def __init__(self, connect_timeout: float, read_timeout: float, total_timeout: float, max_body_bytes: int,
+                 pool_hosts: int, pool_size: int):
+        """
+        Initialize a new HttpFetcher instance, which downloads the article pages through a shared requests Session:
+        the connections to each publisher host are kept alive and reused by the next fetches (and by concurrent
+        threads), instead of a new connection per article. Every fetch is bounded in time and in size.
+        :param connect_timeout: number of seconds allowed to connect to a publisher
+        :param read_timeout: maximum number of seconds between two received bytes
+        :param total_timeout: maximum number of seconds spent to fetch a page (a slow publisher trickling its page
+        never holds the worker longer)
+        :param max_body_bytes: maximum size of a page body
+        :param pool_hosts: number of publisher hosts whose connections are kept alive
+        :param pool_size: number of connections kept alive per publisher host
+        """
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.total_timeout = total_timeout
+        self.max_body_bytes = max_body_bytes
+        self.session = requests.Session()
+        adapter = _WatchedHTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['User-Agent'] = Config().browser_user_agent  # Same user agent as newspaper
+
+    def fetch(self, url: str, headers: Optional[dict[str, str]] = None) -> FetchedPage:
+        """
+        Return the page of the provided URL, following the redirections.
+        :param url: provided URL
+        :param headers: additional request headers
+        :return: the fetched page
+        :raise FetchError: if the total timeout or the maximum body size is exceeded
+        :raise requests.RequestException: if the page cannot be fetched (connection error, connect or read timeout,
+        non 2XX response)
+        """
+        # A blocking read cannot be interrupted otherwise: the sockets of the fetch are shut down once the deadline
+        # is reached, whether it is connecting, waiting for the headers, following a redirection or reading the body
+        watch = _Watch()
+        watchdog = threading.Timer(self.total_timeout, watch.expire)
+        watchdog.daemon = True
+        _watches.watch = watch
+        watchdog.start()
+        try:
+            with self.session.get(url, headers=headers, stream=True, allow_redirects=True,
+                                  timeout=(self.connect_timeout, self.read_timeout)) as response:
+                response.raise_for_status()
+                content_length = response.headers.get('Content-Length')
+                if content_length is not None and content_length.isdigit() \
+                        and int(content_length) > self.max_body_bytes:
+                    raise FetchError(f'Body of {url} exceeds {self.max_body_bytes} bytes ({content_length} announced)')
+                body = self._read_body(url, response)
+                if watch.expired:  # A shut down socket also ends a body delimited by the connection close
+                    raise FetchError(f'Fetching {url} exceeded {self.total_timeout} seconds')
+                response._content = body  # Lets requests decode the body read by chunks
+                return FetchedPage(response.url, response.status_code, response.headers, body, _get_html(response))
+        except FetchError:
+            raise
+        except Exception as ex:
+            if watch.expired:
+                raise FetchError(f'Fetching {url} exceeded {self.total_timeout} seconds') from ex
+            raise
+        finally:
+            watchdog.cancel()
+            _watches.watch = None
+
+    def _read_body(self, url: str, response: requests.Response) -> bytes:
+        """
+        Return the body of the provided streamed response, read by chunks.
+        :param url: fetched URL
+        :param response: streamed response
+        :return: the response body
+        :raise FetchError: if the maximum body size is exceeded
+        """
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(_CHUNK_SIZE):
+            size += len(chunk)
+            if size > self.max_body_bytes:
+                raise FetchError(f'Body of {url} exceeds {self.max_body_bytes} bytes')
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    def close(self):
+        """
+        Close the kept alive connections.
+        """
+        self.session.close()
+
+
+def _get_html(response: requests.Response) -> str:
+    """
+    Return the body of the provided response decoded like newspaper does it: with the declared encoding if any,
+    otherwise with the encoding declared in the HTML if any.
+    :param response: response whose body was read
+    :return: the decoded HTML
+    """
+    if response.encoding != _FAIL_ENCODING:
+        return response.text or ''
+    html = response.content
+    if 'charset' not in response.headers.get('content-type', ''):
+        encodings = requests.utils.get_encodings_from_content(response.text)
+        if len(encodings) > 0:
+            response.encoding = encodings[0]
+            html = response.text
+    return html or ''
+
+
+# Fetcher of the current process, created on its first fetch (a Session and its sockets must not be shared with
+# the forked gunicorn workers).
+_fetcher: Optional[HttpFetcher] = None
+
+# Id of the process which created the fetcher.
+_fetcher_pid: Optional[int] = None
+
+_fetcher_lock = threading.Lock()
+
+
+def get_fetcher() -> HttpFetcher:
+    """
+    Return the fetcher of the current process, creating it from the fetch settings if needed.
+    :return: the fetcher of the current process
+    """
+    global _fetcher, _fetcher_pid
+    if _fetcher is None or _fetcher_pid != os.getpid():
+        with _fetcher_lock:
+            if _fetcher is None or _fetcher_pid != os.getpid():
+                _fetcher = HttpFetcher(
+                    connect_timeout=float(os.getenv(ct.get_fetch_connect_timeout_env_variable_label(),
+                                                    ct.get_default_fetch_connect_timeout())),
+                    read_timeout=float(os.getenv(ct.get_fetch_read_timeout_env_variable_label(),
+                                                 ct.get_default_fetch_read_timeout())),
+                    total_timeout=float(os.getenv(ct.get_fetch_total_timeout_env_variable_label(),
+                                                  ct.get_default_fetch_total_timeout())),
+                    max_body_bytes=int(os.getenv(ct.get_fetch_max_body_bytes_env_variable_label(),
+                                                 ct.get_default_fetch_max_body_bytes())),
+                    pool_hosts=int(os.getenv(ct.get_fetch_pool_hosts_env_variable_label(),
+                                             ct.get_default_fetch_pool_hosts())),
+                    pool_size=int(os.getenv(ct.get_fetch_pool_size_env_variable_label(),
+                                            ct.get_default_fetch_pool_size()))
+                )
+                _fetcher_pid = os.getpid()
+    return _fetcher
+
+
+def fetch(url: str, headers: Optional[dict[str, str]] = None) -> FetchedPage:
+    """
+    Return the page of the provided URL, fetched by the fetcher of the current process.
+    :param url: provided URL
+    :param headers: additional request headers
+    :return: the fetched page
+    :raise FetchError: if the total timeout or the maximum body size is exceeded
+    :raise requests.RequestException: if the page cannot be fetched
+    """
+    return get_fetcher().fetch(url, headers)
@@ -0,0 +1,158 @@
+import atexit
+import math
+import multiprocessing
+import os
+import threading
+import time
+from multiprocessing.pool import AsyncResult, Pool
+from typing import Optional
+
+from ai.prediction_model import PredictionModel
+from ai.topic_model import TopicModel
+from services import constants_service as ct
+from services import model_registry as mr
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+# Worker processes pool, created lazily by the first batch scored in the serving process. As the pickles are loaded
+# at import time, the workers are forked with the model already in memory and share its pages with their parent.
+# The pool is recycled whenever a new model version is swapped in, so that its workers are forked with the new model.
+# As the workers are forked from a process running other threads, the locks they may use (lemma caches, tagger) are
+# replaced by released ones in every forked process (see os.register_at_fork in cache_service and pos_tagger).
+_pool: Optional[Pool] = None
+
+# Identifier of the process which created the pool (a forked gunicorn worker must create its own pool).
+_pool_pid: Optional[int] = None
+
+_pool_lock = threading.Lock()
+
+
+def get_workers_count() -> int:
+    """
+    Return the number of inference worker processes, read from its environment variable if set,
+    otherwise its default value (0 disables the process pool and scores the sentences in the calling thread).
+    :return: the number of inference worker processes
+    """
+    return int(os.getenv(ct.get_inference_workers_env_variable_label(), ct.get_default_inference_workers()))
+
+
+def is_enabled() -> bool:
+    """
+    Return True if the sentences are scored by the inference worker processes, otherwise return False.
+    :return: True if the inference process pool is enabled
+    """
+    return get_workers_count() > 0
+
+
+def predict_many(model: PredictionModel, texts: list[str]) -> list[str]:
+    """
+    Return the truthfulness label of each provided text. If the inference process pool is enabled, the texts are
+    split in contiguous chunks scored in parallel by the worker processes, otherwise they are scored in the calling
+    thread. Several threads may submit their texts to the pool at the same time.
+    :param model: model used to score the texts
+    :param texts: provided texts to analyze
+    :return: the list of REAL or FAKE labels, in the same order as the provided texts
+    """
+    workers_count = get_workers_count()
+    min_chunk_size = ct.get_min_inference_chunk_size()
+    if workers_count <= 0 or len(texts) < 2 * min_chunk_size:
+        return model.predict_many(texts)  # Not worth the inter-process communication cost
+    chunk_size = max(min_chunk_size, math.ceil(len(texts) / workers_count))
+    chunks = [(model.get_version(), texts[i:i + chunk_size]) for i in range(0, len(texts), chunk_size)]
+    labels_chunks = _get_pool(workers_count).map(_predict_chunk, chunks)
+    # A chunk sent to workers forked with another model version (swapped in meanwhile) is scored in the calling thread
+    return [label for (_, chunk), labels in zip(chunks, labels_chunks)
+            for label in (labels if labels is not None else model.predict_many(chunk))]
+
+
+def _predict_chunk(version_and_texts: tuple[str, list[str]]) -> Optional[list[str]]:
+    """
+    Return the truthfulness label of each text of the provided chunk (run by the worker processes with the model
+    they were forked with, only the model version being sent to them).
+    :param version_and_texts: version of the model expected to score the texts and the chunk texts
+    :return: the list of REAL or FAKE labels of the chunk, or None if the worker model has another version
+    """
+    version, texts = version_and_texts
+    model = mr.registry.get_models().model
+    if model.get_version() != version:
+        return None
+    return model.predict_many(texts)
+
+
+def submit_topics(model_topic: TopicModel, words: list[str]) -> AsyncResult:
+    """
+    Submit the topic extraction of the provided word tokens to an inference worker process, so that it runs on
+    another core while the calling thread scores the truthfulness of the same document.
+    :param model_topic: topic model expected to extract the topics
+    :param words: word tokens of the text to analyze
+    :return: the pending result, holding the list of topics extracted and the extraction duration in milliseconds,
+    or None if the worker topic model has another version
+    """
+    return _get_pool(get_workers_count()).apply_async(_predict_topics, ((model_topic.get_version(), words),))
+
+
+def _predict_topics(version_and_words: tuple[str, list[str]]) -> Optional[tuple[list[str], float]]:
+    """
+    Return the topics extracted from the provided word tokens and the extraction duration (run by the worker
+    processes with the topic model they were forked with, only the model version being checked).
+    :param version_and_words: version of the topic model expected to extract the topics and the word tokens
+    :return: the list of topics extracted and the duration in milliseconds, or None if the worker topic model has
+    another version
+    """
+    version, words = version_and_words
+    model_topic = mr.registry.get_models().model_topic
+    if model_topic.get_version() != version:
+        return None
+    start = time.perf_counter()
+    topics = model_topic.predict_words(words)
+    return topics, round((time.perf_counter() - start) * 1000, 3)
+
+
+def _get_pool(workers_count: int) -> Pool:
+    """
+    Return the inference process pool of the current process, creating it if needed.
+    :param workers_count: number of worker processes of the pool
+    :return: the inference process pool
+    """
+    global _pool, _pool_pid
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                _pool = multiprocessing.get_context('fork').Pool(processes=workers_count)
+                _pool_pid = os.getpid()
+    return _pool
+
+
+def recycle():
+    """
+    Replace the inference worker processes created by the current process, if any: the next batch forks new
+    workers, while the current ones finish their pending chunks and exit.
+    """
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.close()
+            threading.Thread(target=_pool.join, name='inference-pool-recycle', daemon=True).start()
+        _pool = None
+        _pool_pid = None
+
+
+def shutdown():
+    """
+    Terminate the inference worker processes created by the current process, if any.
+    """
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.terminate()
+        _pool = None
+        _pool_pid = None
+
+
+atexit.register(shutdown)
+
+mr.registry.add_swap_listener(lambda models: recycle())
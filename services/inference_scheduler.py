@@ -0,0 +1,185 @@
+import os
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from ai.prediction_model import PredictionModel
+from services import constants_service as ct
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class InferenceRequest:
+
+    def __init__(self, predict_features: Callable[[list[str]], list[str]], features: list[str]):
+        """
+        Initialize a new InferenceRequest instance, the feature texts of one request waiting to be predicted.
+        :param predict_features: function predicting the labels of a list of feature texts
+        :param features: feature texts of the request
+        """
+        self.predict_features = predict_features
+        self.features = features
+        self.labels = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class InferenceScheduler:
+
+    def __init__(self, max_batch_size: int, max_wait_ms: float):
+        """
+        Initialize a new InferenceScheduler instance, which collects the feature texts submitted by concurrent
+        requests and predicts them in a single vectorize and predict call per batch, in a background thread.
+        To keep the latency low at low load, the scheduler only waits for other requests (up to max_wait_ms)
+        when its previous batch merged several requests, otherwise it predicts whatever is already queued at once.
+        :param max_batch_size: maximum number of feature texts per batch (a bigger request is predicted alone)
+        :param max_wait_ms: maximum number of milliseconds a batch waits for other requests under load
+        """
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.requests = queue.Queue()
+        self.carried_request = None  # Request which did not fit in the previous batch
+        self.last_batch_requests_count = 0
+        self.batch_sizes = deque(maxlen=100)  # Feature texts count of the last batches, for monitoring purposes
+        self.thread = threading.Thread(target=self._run, name='inference-scheduler', daemon=True)
+        self.thread.start()
+
+    def submit(self, predict_features: Callable[[list[str]], list[str]], features: list[str]) -> list[str]:
+        """
+        Return the labels of the provided feature texts once the batch containing them has been predicted.
+        :param predict_features: function predicting the labels of a list of feature texts (the requests
+        are only batched together with requests having the same function)
+        :param features: feature texts to predict
+        :return: the labels of the provided feature texts, in the same order
+        """
+        if len(features) == 0:
+            return []
+        request = InferenceRequest(predict_features, features)
+        self.requests.put(request)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.labels
+
+    def _run(self):
+        """
+        Collect and predict the batches of submitted requests, forever.
+        """
+        while True:
+            self._predict_batch(self._collect_batch())
+
+    def _collect_batch(self) -> list[InferenceRequest]:
+        """
+        Return the next batch of requests: the oldest waiting request followed by the compatible requests
+        submitted in the meantime, as long as the batch does not exceed the maximum batch size.
+        :return: the requests of the next batch
+        """
+        first_request = self.carried_request if self.carried_request is not None else self.requests.get()
+        self.carried_request = None
+        batch = [first_request]
+        batch_size = len(first_request.features)
+        deadline = time.monotonic() + self.max_wait if self.last_batch_requests_count > 1 else 0
+        while batch_size < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                request = self.requests.get(timeout=timeout) if timeout > 0 else self.requests.get_nowait()
+            except queue.Empty:
+                break
+            if request.predict_features != first_request.predict_features \
+                    or batch_size + len(request.features) > self.max_batch_size:
+                self.carried_request = request
+                break
+            batch.append(request)
+            batch_size += len(request.features)
+        self.last_batch_requests_count = len(batch)
+        return batch
+
+    def _predict_batch(self, batch: list[InferenceRequest]):
+        """
+        Predict the feature texts of every request of the provided batch in a single call and give each request
+        its own labels back (or the raised exception).
+        :param batch: requests to predict
+        """
+        features = [feature for request in batch for feature in request.features]
+        self.batch_sizes.append(len(features))
+        try:
+            labels = batch[0].predict_features(features)
+        except Exception as ex:
+            for request in batch:
+                request.error = ex
+                request.done.set()
+            return
+        start = 0
+        for request in batch:
+            request.labels = labels[start:start + len(request.features)]
+            start += len(request.features)
+            request.done.set()
+
+
+# Scheduler of the current process, created lazily (its thread would not survive a gunicorn worker fork).
+_scheduler: Optional[InferenceScheduler] = None
+
+# Identifier of the process which created the scheduler.
+_scheduler_pid: Optional[int] = None
+
+_scheduler_lock = threading.Lock()
+
+
+def get_max_batch_size() -> int:
+    """
+    Return the maximum number of sentences per micro-batch, read from its environment variable if set,
+    otherwise its default value (0 disables the micro-batching).
+    :return: the maximum number of sentences per micro-batch
+    """
+    return int(os.getenv(ct.get_inference_max_batch_size_env_variable_label(),
+                         ct.get_default_inference_max_batch_size()))
+
+
+def get_max_wait_ms() -> float:
+    """
+    Return the maximum number of milliseconds a micro-batch waits for other requests under load, read from
+    its environment variable if set, otherwise its default value.
+    :return: the maximum micro-batch waiting time in milliseconds
+    """
+    return float(os.getenv(ct.get_inference_max_wait_ms_env_variable_label(), ct.get_default_inference_max_wait_ms()))
+
+
+def is_enabled() -> bool:
+    """
+    Return True if the sentences of concurrent requests are micro-batched, otherwise return False.
+    :return: True if the micro-batching is enabled
+    """
+    return get_max_batch_size() > 0
+
+
+def predict_many(model: PredictionModel, texts: list[str]) -> list[str]:
+    """
+    Return the truthfulness label of each provided text. The texts are pre-processed in the calling thread, then,
+    if the micro-batching is enabled, predicted along with the texts of the other concurrent requests.
+    :param model: model used to score the texts
+    :param texts: provided texts to analyze
+    :return: the list of REAL or FAKE labels, in the same order as the provided texts
+    """
+    if not is_enabled():
+        return model.predict_many(texts)
+    features = model.get_clean_and_pos_tagged_texts(texts)
+    return _get_scheduler().submit(model.predict_features, features)
+
+
+def _get_scheduler() -> InferenceScheduler:
+    """
+    Return the inference scheduler of the current process, creating it if needed.
+    :return: the inference scheduler
+    """
+    global _scheduler, _scheduler_pid
+    if _scheduler is None or _scheduler_pid != os.getpid():
+        with _scheduler_lock:
+            if _scheduler is None or _scheduler_pid != os.getpid():
+                _scheduler = InferenceScheduler(get_max_batch_size(), get_max_wait_ms())
+                _scheduler_pid = os.getpid()
+    return _scheduler
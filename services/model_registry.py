@@ -0,0 +1,244 @@
+import os
+import threading
+import time
+from typing import Callable
+
+from ai import artifacts as ma
+from ai.prediction_model import PredictionModel, load_predictor
+from ai.topic_model import TopicModel, load_topic_model
+from services import constants_service as ct
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+# Pickled model files, loaded when their converted artifacts do not exist.
+_PICKLE_PATHS = ['ai/pickle/pipeline.pkl', 'ai/pickle/dictionary_LDA.pkl', 'ai/pickle/model_topic.pkl']
+
+
+class ModelBundle:
+
+    def __init__(self, model: PredictionModel, model_topic: TopicModel):
+        """
+        Initialize a new ModelBundle instance, the truthfulness and topic models served together. A request must
+        use a single bundle from start to end, so that its results and cache keys come from the same models.
+        :param model: model used to get the truthfulness label of a text
+        :param model_topic: model used to get the topics of a text
+        """
+        self.model = model
+        self.model_topic = model_topic
+
+    def get_version(self) -> str:
+        """
+        Return the version of the bundle, made of the version of both models.
+        :return: the bundle version
+        """
+        return f'{self.model.get_version()}+{self.model_topic.get_version()}'
+
+    def warm_up(self) -> dict[str, float]:
+        """
+        Run a representative text through both models, so that the first served request does not pay for their
+        first call costs (lazy NLTK resources, tagger, punkt and gensim first calls).
+        :return: the duration in milliseconds of each warm-up stage, in running order
+        """
+        text = ct.get_warm_up_text()
+        durations = {}
+        start = time.perf_counter()
+        sentences = self.model.get_sentences(text)
+        durations['sentence_segmentation'] = _get_milliseconds_since(start)
+        start = time.perf_counter()
+        features = self.model.get_clean_and_pos_tagged_texts(sentences)
+        durations['preprocessing_and_pos_tagging'] = _get_milliseconds_since(start)
+        start = time.perf_counter()
+        self.model.predict_features(features)
+        durations['truthfulness_prediction'] = _get_milliseconds_since(start)
+        start = time.perf_counter()
+        self.model_topic.predict(text)
+        durations['topic_prediction'] = _get_milliseconds_since(start)
+        return durations
+
+
+class ModelRegistry:
+
+    def __init__(self, models: ModelBundle):
+        """
+        Initialize a new ModelRegistry instance, holding the active model bundle. A new model version is loaded and
+        warmed up in the background, then swapped in atomically: requests keep the bundle they started with and
+        never see a partially loaded one.
+        :param models: initially active model bundle
+        """
+        self.models = models
+        self.signature = get_models_signature()
+        self.reload_lock = threading.Lock()
+        self.swap_listeners = []
+        self.watcher_pid = None
+        self.watcher_lock = threading.Lock()
+        # A lock held by another thread (a background reload) when gunicorn forks the workers would never be released
+        # in the forked worker, blocking its reloads forever
+        os.register_at_fork(after_in_child=self._reset_locks)
+
+    def _reset_locks(self):
+        """
+        Replace the locks of the registry by released ones, in a process just forked from the one using them.
+        """
+        self.reload_lock = threading.Lock()
+        self.watcher_lock = threading.Lock()
+
+    def get_models(self) -> ModelBundle:
+        """
+        Return the active model bundle.
+        :return: the active model bundle
+        """
+        return self.models
+
+    def get_version(self) -> str:
+        """
+        Return the version of the active model bundle.
+        :return: the active model bundle version
+        """
+        return self.models.get_version()
+
+    def add_swap_listener(self, listener: Callable[[ModelBundle], None]):
+        """
+        Register a function called with the new model bundle each time a new model version is swapped in.
+        :param listener: function called after each swap
+        """
+        self.swap_listeners.append(listener)
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Load the model files if they changed since the last load (or if forced), warm the loaded models up and
+        swap them in if their version differs from the active one. The active models keep serving the requests
+        meanwhile, and stay active if the loading fails.
+        :param force: whether the model files are loaded even if they did not change
+        :return: True if a new model version was swapped in, otherwise False
+        """
+        with self.reload_lock:
+            signature = get_models_signature()
+            if not force and signature == self.signature:
+                return False
+            models = load_models()
+            models.warm_up()
+            self.signature = signature
+            if models.get_version() == self.models.get_version():
+                return False
+            self.models = models
+        print('=> Model version swapped in: ', models.get_version())
+        for listener in self.swap_listeners:
+            listener(models)
+        return True
+
+    def reload_async(self) -> threading.Thread:
+        """
+        Reload the model files in a background thread (see the reload method), e.g. once told about a deployment.
+        :return: the started thread
+        """
+        thread = threading.Thread(target=self._reload_safely, kwargs={'force': True}, name='model-registry-reload',
+                                  daemon=True)
+        thread.start()
+        return thread
+
+    def start_watching(self, interval: float):
+        """
+        Start watching the model files of the current process in a background thread, reloading them whenever they
+        change. Does nothing if the current process already watches them or if the interval is not positive.
+        :param interval: number of seconds between two checks of the model files
+        """
+        if interval <= 0 or self.watcher_pid == os.getpid():
+            return
+        with self.watcher_lock:
+            if self.watcher_pid != os.getpid():
+                threading.Thread(target=self._watch, args=(interval,), name='model-registry-watcher',
+                                 daemon=True).start()
+                self.watcher_pid = os.getpid()
+
+    def _watch(self, interval: float):
+        """
+        Reload the changed model files, then wait for the provided interval, forever.
+        :param interval: number of seconds between two checks of the model files
+        """
+        while True:
+            self._reload_safely()
+            time.sleep(interval)
+
+    def _reload_safely(self, force: bool = False):
+        """
+        Reload the model files (see the reload method), logging the error instead of raising it if the loading fails.
+        :param force: whether the model files are loaded even if they did not change
+        """
+        try:
+            self.reload(force)
+        except Exception as ex:
+            print('=> Model reload failed: ', repr(ex))
+
+
+def _get_milliseconds_since(start: float) -> float:
+    """
+    Return the number of milliseconds elapsed since the provided time.
+    :param start: time returned by time.perf_counter
+    :return: the elapsed milliseconds (rounded to the microsecond)
+    """
+    return round((time.perf_counter() - start) * 1000, 3)
+
+
+def get_models_signature() -> tuple:
+    """
+    Return the signature of the model files (path, modification time and size of each pickle and of each
+    converted artifacts descriptor), which changes whenever a new model is deployed. As the converted artifacts
+    are only loaded if converted from the deployed pickles, a retrained pickle is served (unpickled) until converted.
+    :return: the model files signature
+    """
+    paths = _PICKLE_PATHS + [os.path.join(ma.get_pipeline_directory(), 'scorer.json'),
+                             os.path.join(ma.get_topic_model_directory(), 'topic.json')]
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+
+def load_models() -> ModelBundle:
+    """
+    Load a new model bundle from the model files (converted artifacts if they exist, otherwise pickles).
+    :return: the loaded model bundle
+    """
+    predictor, pipeline_version = load_predictor()
+    lda_model, dictionary, topic_model_version = load_topic_model()
+    return ModelBundle(PredictionModel(predictor=predictor, pipeline_version=pipeline_version),
+                       TopicModel(lda_model=lda_model, dictionary=dictionary, version=topic_model_version))
+
+
+def get_watch_interval() -> float:
+    """
+    Return the number of seconds between two checks of the model files, read from its environment variable if set,
+    otherwise its default value (0 disables the watching).
+    :return: the model watch interval in seconds
+    """
+    return float(os.getenv(ct.get_model_watch_interval_env_variable_label(), ct.get_default_model_watch_interval()))
+
+
+# Registry of the process, starting with the models loaded at import time (shared with the forked workers).
+registry = ModelRegistry(ModelBundle(PredictionModel(), TopicModel()))
+
+
+def get_models() -> ModelBundle:
+    """
+    Return the active model bundle, starting to watch the model files in the current process if not done yet
+    (the watcher thread is started lazily, as it would not survive a gunicorn worker fork).
+    :return: the active model bundle
+    """
+    registry.start_watching(get_watch_interval())
+    return registry.get_models()
+
+
+def get_version() -> str:
+    """
+    Return the version of the active model bundle.
+    :return: the active model bundle version
+    """
+    return registry.get_version()
@@ -33,6 +33,34 @@ def get_400_response(error_message: str) -> Response:
     return response
 
 
+def get_503_response(error_message: str, content=None) -> Response:
+    """
+    Return a 503 Service Unavailable Flask Response with the given error message and content.
+    :param error_message: the provided error message
+    :param content: response content. If None, a message-only response will be returned.
+    :return: a 503 Service Unavailable Flask Response with the given error message and content
+    """
+    response_dict = _get_message_only_response_dict(error_message)
+    if content is not None:
+        response_dict[ct.get_response_content_key()] = content
+    response = make_response(jsonify(response_dict))
+    response.status_code = 503
+    return response
+
+
+def add_server_timing(response: Response, durations: dict[str, float]) -> Response:
+    """
+    Add the duration of each stage of the request to the provided Flask Response, in a Server-Timing header
+    (displayed by the browser developer tools).
+    :param response: the provided Flask Response
+    :param durations: duration in milliseconds of each stage, by stage name
+    :return: the provided Flask Response
+    """
+    response.headers[ct.get_server_timing_header()] = ', '.join([f'{name};dur={duration}'
+                                                                 for name, duration in durations.items()])
+    return response
+
+
 def _get_content_response_dict(content) -> dict[str, any]:
     """
     Return a dictionary representing a 200 OK Flask Response with a message and some content.
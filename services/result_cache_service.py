@@ -0,0 +1,56 @@
+import os
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from entities.data.CheckerResultData import CheckerResultData
+from services import constants_service as ct
+from services import cache_service as cs
+from services.cache_service import LruCache
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+# Checker results of the recently checked articles, keyed by model version and canonicalized URL, so that checking
+# the same article again skips the download, the inference and the topic extraction until the entry expires.
+result_cache = cs.register_cache('result', LruCache(
+    max_entries=int(os.getenv(ct.get_result_cache_size_env_variable_label(), ct.get_default_result_cache_size())),
+    ttl=float(os.getenv(ct.get_result_cache_ttl_env_variable_label(), ct.get_default_result_cache_ttl()))
+))
+
+
+def get_result(model_version: str, url: str) -> Optional[CheckerResultData]:
+    """
+    Return the cached checker result of the provided URL if it was checked by the same model version
+    and has not expired yet, otherwise return None.
+    :param model_version: version of the model that must have computed the result
+    :param url: checked article URL
+    :return: the cached checker result or None
+    """
+    return result_cache.get((model_version, canonicalize_url(url)))
+
+
+def put_result(model_version: str, url: str, result: CheckerResultData):
+    """
+    Cache the checker result of the provided URL.
+    :param model_version: version of the model that computed the result
+    :param url: checked article URL
+    :param result: checker result to cache
+    """
+    result_cache.put((model_version, canonicalize_url(url)), result)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Return the canonical form of the provided URL, shared by every URL pointing to the same article:
+    lower case scheme and host, no fragment and no tracking query parameters (the other parameters keep their order).
+    :param url: provided URL
+    :return: the canonicalized URL
+    """
+    scheme, netloc, path, query, _ = urlsplit(url.strip())
+    tracking_parameters = ct.get_tracking_query_parameters()
+    query_parameters = [(key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+                        if key.lower() not in tracking_parameters and not key.lower().startswith('utm_')]
+    return urlunsplit((scheme.lower(), netloc.lower(), path or '/', urlencode(query_parameters), ''))
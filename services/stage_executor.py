@@ -0,0 +1,98 @@
+import atexit
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from services import constants_service as ct
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+# Threads running the independent stages of the requests of the current process, created on the first request of
+# the process (threads do not survive a gunicorn worker fork).
+_executor: Optional[ThreadPoolExecutor] = None
+
+# Id of the process which created the stage threads.
+_executor_pid: Optional[int] = None
+
+_executor_lock = threading.Lock()
+
+
+def get_workers_count() -> int:
+    """
+    Return the number of stage threads, read from its environment variable if set, otherwise its default value
+    (0 runs the stages one after the other in the calling thread).
+    :return: the number of stage threads
+    """
+    return int(os.getenv(ct.get_stage_workers_env_variable_label(), ct.get_default_stage_workers()))
+
+
+def run_stages(stages: dict[str, Callable[[], Any]]) -> tuple[dict[str, Any], dict[str, float]]:
+    """
+    Run the provided independent stages at the same time: the first one in the calling thread and the others in
+    the stage threads. The stages only overlap while one of them waits without holding the GIL (sentences scored by
+    the inference worker processes, NumPy and BLAS calls): most of the gensim inference and of the pre-processing
+    holds it, so without inference workers the duration of the stages stays close to their sum. The stages run one
+    after the other if the stage threads are disabled.
+    :param stages: functions to run, by stage name
+    :return: the result of each stage and its duration in milliseconds, by stage name
+    :raise Exception: the first error raised by a stage, once every stage has ended
+    """
+    names = list(stages.keys())
+    if get_workers_count() <= 0 or len(names) < 2:
+        timed_results = {name: _run_timed(stages[name]) for name in names}
+    else:
+        futures = {name: _get_executor().submit(_run_timed, stages[name]) for name in names[1:]}
+        try:
+            timed_results = {names[0]: _run_timed(stages[names[0]])}
+        finally:
+            for future in futures.values():
+                future.exception()  # Wait for every stage, even if the first one failed
+        timed_results.update({name: future.result() for name, future in futures.items()})
+    return {name: result for name, (result, _) in timed_results.items()}, \
+           {name: duration for name, (_, duration) in timed_results.items()}
+
+
+def _run_timed(stage: Callable[[], Any]) -> tuple[Any, float]:
+    """
+    Return the result of the provided stage and its duration.
+    :param stage: function to run
+    :return: the stage result and its duration in milliseconds (rounded to the microsecond)
+    """
+    start = time.perf_counter()
+    result = stage()
+    return result, round((time.perf_counter() - start) * 1000, 3)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Return the stage threads of the current process, creating them if needed.
+    :return: the stage thread pool
+    """
+    global _executor, _executor_pid
+    if _executor is None or _executor_pid != os.getpid():
+        with _executor_lock:
+            if _executor is None or _executor_pid != os.getpid():
+                _executor = ThreadPoolExecutor(max_workers=get_workers_count(), thread_name_prefix='checker-stage')
+                _executor_pid = os.getpid()
+    return _executor
+
+
+def shutdown():
+    """
+    Stop the stage threads created by the current process, if any, once their pending stages have ended.
+    """
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is not None and _executor_pid == os.getpid():
+            _executor.shutdown(wait=False)
+        _executor = None
+        _executor_pid = None
+
+
+atexit.register(shutdown)
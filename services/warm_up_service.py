@@ -0,0 +1,92 @@
+import threading
+import time
+
+from entities.models.BaseModel import ping_db
+from services import cache_service as cs
+from services import model_registry as mr
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+# Warm-up report of the current process. With gunicorn --preload, the warm-up runs once in the master process
+# before the workers are forked, so every worker starts warm and inherits this report.
+_report = {
+    'models_ready': False,
+    'database_ready': False,
+    'durations_ms': {},
+    'errors': {}
+}
+
+_report_lock = threading.Lock()
+
+
+def warm_up() -> dict:
+    """
+    Run representative inference through the active models and check the database connection, recording the
+    duration of each stage, so that the process only reports ready once it can serve requests at full speed.
+    :return: the warm-up report (see the get_report function)
+    """
+    try:
+        durations = mr.registry.get_models().warm_up()
+        with _report_lock:
+            _report['durations_ms'].update(durations)
+            _report['models_ready'] = True
+            _report['errors'].pop('models', None)
+    except Exception as ex:
+        with _report_lock:
+            _report['errors']['models'] = repr(ex)
+    _check_database()
+    report = get_report()
+    print('=> Warm-up report: ', report)
+    return report
+
+
+def _check_database():
+    """
+    Check the database connection and record the check duration, or the error if it cannot be reached.
+    """
+    start = time.perf_counter()
+    try:
+        ping_db()
+    except Exception as ex:
+        with _report_lock:
+            _report['database_ready'] = False
+            _report['errors']['database'] = repr(ex)
+        return
+    with _report_lock:
+        _report['durations_ms']['database_connection'] = round((time.perf_counter() - start) * 1000, 3)
+        _report['database_ready'] = True
+        _report['errors'].pop('database', None)
+
+
+def is_ready() -> bool:
+    """
+    Return True if the models are warmed up and the database was reached, otherwise return False. The database
+    connection is checked again while it could not be reached, so that the process becomes ready once it is up.
+    :return: True if the process is ready to serve requests
+    """
+    if _report['models_ready'] and not _report['database_ready']:
+        _check_database()
+    return _report['models_ready'] and _report['database_ready']
+
+
+def get_report() -> dict:
+    """
+    Return the warm-up report of the current process.
+    :return: a dictionary containing the readiness of the models and of the database, the duration in milliseconds
+    of each warm-up stage, the errors of the failed stages, the active model version and the statistics of each
+    cache (hits, misses, evictions and sizes)
+    """
+    with _report_lock:
+        return {
+            'ready': _report['models_ready'] and _report['database_ready'],
+            'models_ready': _report['models_ready'],
+            'database_ready': _report['database_ready'],
+            'durations_ms': dict(_report['durations_ms']),
+            'errors': dict(_report['errors']),
+            'model_version': mr.registry.get_version(),
+            'caches': cs.get_caches_stats()
+        }
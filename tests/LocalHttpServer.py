@@ -0,0 +1,84 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+# Article page served by the local HTTP server tests.
+ARTICLE_HTML = '<html><head><title>Local article title</title></head><body><article><h1>Local article title</h1>' \
+               + ''.join(['<p>Russian President Vladimir Putin says a list of officials published by the US has '
+                          'targeted all Russian people. The list names 210 top Russians as part of a sanctions '
+                          'law, and the US stressed those named were not subject to new sanctions.</p>'] * 8) \
+               + '</article></body></html>'
+
+
+def send_body(handler: BaseHTTPRequestHandler, body: bytes, status: int = 200,
+              headers: Optional[dict[str, str]] = None):
+    """
+    Send a complete response with the provided body from a local HTTP server route.
+    :param handler: request handler of the route
+    :param body: response body
+    :param status: response status code
+    :param headers: additional response headers
+    """
+    handler.send_response(status)
+    handler.send_header('Content-Type', 'text/html; charset=utf-8')
+    handler.send_header('Content-Length', str(len(body)))
+    for name, value in (headers or {}).items():
+        handler.send_header(name, value)
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+class LocalHttpServer:
+
+    def __init__(self, routes: dict[str, Callable[[BaseHTTPRequestHandler], None]]):
+        """
+        Initialize a new LocalHttpServer instance, an HTTP/1.1 server with keep-alive listening on a free local port,
+        standing in for the publishers in the tests. Use it as a context manager.
+        :param routes: function sending the response of each path
+        """
+        self.routes = routes
+        self.requests = []  # (path, request headers) of each received request
+        self.client_ports = set()  # Client port of each received request, one per opened connection
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server.requests.append((self.path, dict(self.headers)))
+                server.client_ports.add(self.client_address[1])
+                route = server.routes.get(self.path)
+                if route is None:
+                    send_body(self, b'Not found', status=404)
+                else:
+                    route(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.server.handle_error = lambda request, client_address: None  # Clients giving up are expected
+        self.thread = threading.Thread(target=self.server.serve_forever, name='local-http-server', daemon=True)
+
+    def get_url(self, path: str) -> str:
+        """
+        Return the URL of the provided path on the local server.
+        :param path: provided path
+        :return: the URL of the path
+        """
+        return f'http://127.0.0.1:{self.server.server_address[1]}{path}'
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.server.shutdown()
+        self.server.server_close()
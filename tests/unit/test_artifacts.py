@@ -0,0 +1,98 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+from gensim.corpora import Dictionary
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.tree import DecisionTreeClassifier
+
+from ai import artifacts as ma
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+@pytest.fixture(scope='module')
+def articles() -> list[str]:
+    return pd.read_csv('ai/dataset/articles.csv')['articles'].dropna().astype(str).tolist()[:200]
+
+
+class TestArtifacts:
+
+    def test_mapped_vocabulary_returns_indexes_of_known_terms_only(self, tmp_path):
+        """
+        Test if the memory-mapped vocabulary returns the index of each known term (repeated ones included)
+        in order, skips the unknown terms and gives the terms back from their indexes.
+        """
+        vocabulary = {'fake': 2, 'news': 0, 'café crème': 1}
+        ma.save_vocabulary(vocabulary, str(tmp_path), 'vocabulary')
+        mapped_vocabulary = ma.load_vocabulary(str(tmp_path), 'vocabulary')
+        actual_indexes = mapped_vocabulary.get_indexes(['news', 'unknown', 'café crème', 'news', 'fake'])
+        assert actual_indexes.tolist() == [0, 1, 0, 2]
+        assert isinstance(mapped_vocabulary.hashes, np.memmap)
+        assert [mapped_vocabulary[index] for index in range(len(mapped_vocabulary))] == ['news', 'café crème', 'fake']
+
+    def test_mapped_dictionary_bag_of_words_matches_gensim_dictionary(self, tmp_path, articles: list[str]):
+        """
+        Test if the bag of words of the memory-mapped dictionary is the same as the gensim Dictionary one.
+        """
+        documents = [article.lower().split() for article in articles]
+        dictionary = Dictionary(documents[:100])
+        ma.save_vocabulary(dictionary.token2id, str(tmp_path), 'dictionary')
+        mapped_dictionary = ma.load_vocabulary(str(tmp_path), 'dictionary')
+        for document in documents:
+            assert mapped_dictionary.doc2bow(document) == dictionary.doc2bow(document)
+
+    def test_converted_pipeline_predicts_like_pickled_pipeline(self, tmp_path, articles: list[str]):
+        """
+        Test if the scorer loaded from the converted pipeline artifacts predicts exactly the same classes as the
+        pipeline and keeps its version.
+        """
+        pipeline = Pipeline([
+            ('vect', CountVectorizer(ngram_range=(1, 3))),
+            ('tfidf', TfidfTransformer(norm='l2')),
+            ('clf', LogisticRegression(max_iter=200))
+        ])
+        pipeline.fit(articles, [index % 2 for index in range(len(articles))])
+        ma.save_pipeline(pipeline, 'version', str(tmp_path))
+        scorer, actual_version = ma.load_pipeline(str(tmp_path))
+        sentences = [sentence for article in articles for sentence in article.split('.')][:2000]
+        assert actual_version == 'version'
+        assert scorer.predict(sentences).tolist() == pipeline.predict(sentences).tolist()
+
+    def test_non_linear_pipeline_is_not_converted(self, tmp_path, articles: list[str]):
+        """
+        Test if converting a pipeline with a non-linear classifier raises a ValueError.
+        """
+        pipeline = Pipeline([('vect', CountVectorizer()), ('clf', DecisionTreeClassifier())])
+        pipeline.fit(articles, [index % 2 for index in range(len(articles))])
+        with pytest.raises(ValueError):
+            ma.save_pipeline(pipeline, 'version', str(tmp_path))
+        assert not ma.has_pipeline(str(tmp_path))
+
+    def test_converted_topic_model_predicts_like_pickled_topic_model(self, tmp_path, articles: list[str]):
+        """
+        Test if the converted topic model (memory-mapped topic-word matrix) gives the same topics and the same
+        document topic weights as the pickled one.
+        """
+        with open('ai/pickle/dictionary_LDA.pkl', 'rb') as f:
+            dictionary = pickle.load(f)
+        with open('ai/pickle/model_topic.pkl', 'rb') as f:
+            lda_model = pickle.load(f)
+        ma.save_topic_model(lda_model, dictionary, 'version', str(tmp_path))
+        mapped_lda_model, mapped_dictionary, actual_version = ma.load_topic_model(str(tmp_path))
+        assert actual_version == 'version'
+        assert isinstance(mapped_lda_model.expElogbeta, np.memmap)
+        assert mapped_lda_model.show_topics(num_topics=8, num_words=4) == lda_model.show_topics(num_topics=8,
+                                                                                                num_words=4)
+        for article in articles:
+            tokens = article.split()
+            expected_topics = lda_model[dictionary.doc2bow(tokens)]
+            actual_topics = mapped_lda_model[mapped_dictionary.doc2bow(tokens)]
+            assert [topic for topic, _ in actual_topics] == [topic for topic, _ in expected_topics]
+            assert np.allclose([weight for _, weight in actual_topics], [weight for _, weight in expected_topics])
@@ -0,0 +1,64 @@
+import os
+from unittest import mock
+
+from services import checker_service as chk
+from services import constants_service as ct
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class TestBatchInference:
+
+    # Attribute specified declaratively because constructors are forbidden when working with pytest.
+    valid_text = 'Russian President Vladimir Putin says a list of officials published by the US has targeted ' \
+                 'all Russian people. The list names 210 top Russians as part of a sanctions law. ' \
+                 'However, the US stressed those named were not subject to new sanctions. ' \
+                 'Mr Putin said the list was an unfriendly act.'
+
+    def test_batched_labels_match_sentence_by_sentence_labels(self):
+        """
+        Test if scoring all the sentences of a text in a single batch returns the same labels, in the same order,
+        as scoring each sentence one by one.
+        """
+        sentences = self.valid_text.split('.')
+        expected_labels = [chk.get_models().model.predict(sentence) for sentence in sentences]
+        actual_labels = chk._get_truthfulness_labels(sentences)
+        assert actual_labels == expected_labels
+
+    def test_batched_check_percentage_matches_sentence_by_sentence_percentage(self):
+        """
+        Test if the truthfulness percentage computed from batched labels equals the one computed
+        from sentence-by-sentence labels.
+        """
+        sentences = chk.analyze(self.valid_text).get_sentences()
+        labels = [chk._get_truthfulness_label(sentence) for sentence in sentences]
+        expected_percentage = (labels.count(ct.get_truthfulness_label()) / len(labels)).__round__(2)
+        actual_percentage = chk.check(self.valid_text)
+        assert actual_percentage == expected_percentage
+
+    def test_empty_batch_returns_empty_label_list(self):
+        """
+        Test if scoring an empty batch of sentences returns an empty list without calling the pipeline.
+        """
+        actual_labels = chk._get_truthfulness_labels([])
+        assert actual_labels == []
+
+    def test_legacy_sentence_split_keeps_empty_fragments(self):
+        """
+        Test if the legacy sentence split still splits by "." and keeps the empty fragments.
+        """
+        expected_sentences = self.valid_text.split('.')
+        with mock.patch.dict(os.environ, {ct.get_legacy_sentence_split_env_variable_label(): 'true'}):
+            actual_sentences = chk.analyze(self.valid_text).get_sentences()
+        assert actual_sentences == expected_sentences
+
+    def test_text_without_sentence_returns_zero_percentage(self):
+        """
+        Test if checking a text without any sentence worth scoring returns a 0 percentage.
+        """
+        expected_percentage = 0.0
+        actual_percentage = chk.check('... 42 !')
+        assert actual_percentage == expected_percentage
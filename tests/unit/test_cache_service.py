@@ -0,0 +1,80 @@
+from unittest import mock
+
+from services import cache_service as cs
+from services.cache_service import LruCache
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class TestLruCache:
+
+    def test_get_missing_key_returns_default_and_counts_miss(self):
+        """
+        Test if getting a non cached key returns the default value and is counted as a miss.
+        """
+        cache = LruCache(max_entries=2)
+        actual_value = cache.get('missing', 'default')
+        assert actual_value == 'default'
+        assert cache.get_stats()['misses'] == 1
+
+    def test_get_cached_key_returns_value_and_counts_hit(self):
+        """
+        Test if getting a cached key returns its value and is counted as a hit.
+        """
+        cache = LruCache(max_entries=2)
+        cache.put('key', 'value')
+        actual_value = cache.get('key')
+        assert actual_value == 'value'
+        assert cache.get_stats()['hits'] == 1
+
+    def test_put_in_full_cache_evicts_least_recently_used_entry(self):
+        """
+        Test if adding an entry to a full cache evicts the least recently used entry and counts the eviction.
+        """
+        cache = LruCache(max_entries=2)
+        cache.put('first', 1)
+        cache.put('second', 2)
+        cache.get('first')  # "second" becomes the least recently used entry
+        cache.put('third', 3)
+        assert cache.get('second') is None
+        assert cache.get('first') == 1
+        assert cache.get('third') == 3
+        assert cache.get_stats()['evictions'] == 1
+        assert cache.get_stats()['size'] == 2
+
+    def test_zero_size_cache_keeps_nothing(self):
+        """
+        Test if a cache with a maximum size of 0 never keeps any entry.
+        """
+        cache = LruCache(max_entries=0)
+        cache.put('key', 'value')
+        assert cache.get('key') is None
+        assert cache.get_stats()['size'] == 0
+
+    def test_put_beyond_memory_cap_evicts_least_recently_used_entries(self):
+        """
+        Test if the estimated memory size of the cached entries never exceeds the cache memory cap.
+        """
+        cache = LruCache(max_entries=100, max_bytes=30, sizeof=lambda key, value: 10)
+        for key in range(5):
+            cache.put(key, key)
+        assert cache.get_stats()['size'] == 3
+        assert cache.get_stats()['bytes'] == 30
+        assert cache.get_stats()['evictions'] == 2
+        assert cache.get(0) is None
+        assert cache.get(4) == 4
+
+    def test_registered_cache_statistics_are_reported(self):
+        """
+        Test if the statistics of a registered cache are reported under its name.
+        """
+        cache = LruCache(max_entries=2)
+        cache.get('missing')
+        with mock.patch.dict(cs._caches, clear=True):
+            cs.register_cache('test', cache)
+            actual_stats = cs.get_caches_stats()
+        assert actual_stats == {'test': cache.get_stats()}
+        assert actual_stats['test']['misses'] == 1
@@ -1,5 +1,6 @@
 from services import crawler_service as cwl
 from newspaper import Article
+from tests.LocalHttpServer import ARTICLE_HTML
 import gc
 
 
@@ -63,4 +64,22 @@ class TestCrawler:
         """
         invalid_url = 'x'
         actual_article = cwl.get_article_by_url(invalid_url)
-        assert actual_article is None
\ No newline at end of file
+        assert actual_article is None
+
+    def test_text_only_profile_extracts_same_title_and_text_and_releases_dom(self):
+        """
+        Test if the text only extraction profile extracts the same title and text as the full newspaper extraction,
+        without looking for images and without keeping the HTML and the DOM.
+        """
+        html = ARTICLE_HTML.replace('<article>', '<meta property="og:image" content="https://news.com/image.jpg">'
+                                                 '<article><img src="https://news.com/photo.jpg">')
+        articles = {}
+        for profile in ['full', 'text']:
+            articles[profile] = cwl.create_article('https://news.com/article', profile)
+            articles[profile].download(input_html=html)
+            articles[profile].config.fetch_images = False  # Never download the images of this test page
+            articles[profile].parse()
+        assert isinstance(articles['text'], cwl.TextOnlyArticle)
+        assert (articles['text'].title, articles['text'].text) == (articles['full'].title, articles['full'].text)
+        assert articles['full'].meta_img != '' and articles['text'].meta_img == ''
+        assert articles['text'].html == '' and articles['text'].clean_doc is None
@@ -0,0 +1,80 @@
+import os
+import time
+from unittest import mock
+
+import pytest
+
+from entities.data.CrawledArticleData import CrawledArticleData
+from services import crawler_pool as cwp
+from services import crawler_service as cwl
+from services import http_cache as hc
+from tests.LocalHttpServer import ARTICLE_HTML, LocalHttpServer, send_body
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+def _crawl_in_worker(url: str) -> CrawledArticleData:
+    """
+    Crawl nothing: hang on a "/hang" URL, otherwise return the worker process id as title and the URL as text.
+    :param url: article URL
+    :return: the worker process id and the URL
+    """
+    if url.endswith('/hang'):
+        time.sleep(30)
+    return CrawledArticleData(str(os.getpid()), url)
+
+
+def _crawl_without_cache(url: str) -> CrawledArticleData:
+    """
+    Crawl the article of the provided URL with the HTTP cache disabled.
+    :param url: article URL
+    :return: the crawled article
+    """
+    with mock.patch.object(hc, 'get_cache', return_value=None):
+        return cwl.get_crawled_article_by_url(url)
+
+
+@pytest.fixture
+def pool():
+    pool = cwp.CrawlerPool(workers_count=1, deadline=1, max_jobs_per_worker=2, crawl_article=_crawl_in_worker)
+    yield pool
+    pool.shutdown()
+
+
+class TestCrawlerPool:
+
+    def test_worker_process_returns_parsed_title_and_text(self, pool: cwp.CrawlerPool):
+        """
+        Test if a crawler worker process fetches and parses the article and only returns its title and text.
+        """
+        pool.crawl_article = _crawl_without_cache
+        routes = {'/article': lambda handler: send_body(handler, ARTICLE_HTML.encode('utf-8'))}
+        with LocalHttpServer(routes) as server:
+            article = pool.crawl(server.get_url('/article'))
+        assert isinstance(article, CrawledArticleData)
+        assert article.get_title() == 'Local article title'
+        assert 'Vladimir Putin' in article.get_text()
+
+    def test_worker_exceeding_deadline_is_killed_and_replaced(self, pool: cwp.CrawlerPool):
+        """
+        Test if a crawl exceeding its deadline returns None once the deadline is reached, and if the next crawl
+        runs in a new worker process.
+        """
+        first_pid = pool.crawl('https://news.com/first').get_title()
+        start = time.monotonic()
+        assert pool.crawl('https://news.com/hang') is None
+        assert time.monotonic() - start < 2
+        next_pid = pool.crawl('https://news.com/next').get_title()
+        assert next_pid != first_pid
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(first_pid), 0)  # The hanging worker process was killed
+
+    def test_worker_is_recycled_after_max_jobs(self, pool: cwp.CrawlerPool):
+        """
+        Test if a worker process is replaced once it crawled the maximum number of articles per worker.
+        """
+        pids = [pool.crawl(f'https://news.com/{index}').get_title() for index in range(3)]
+        assert pids[0] == pids[1] and pids[2] != pids[1]
@@ -0,0 +1,112 @@
+import os
+import time
+from unittest import mock
+
+import pytest
+from newspaper import Article
+
+from services import crawler_service as cwl
+from services import http_cache as hc
+from services.http_fetcher import FetchedPage
+from tests.LocalHttpServer import ARTICLE_HTML, LocalHttpServer, send_body
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+_ETAG = '"v1"'
+
+
+def _send_with_etag(handler):
+    if handler.headers.get('If-None-Match') == _ETAG:
+        handler.send_response(304)
+        handler.send_header('ETag', _ETAG)
+        handler.send_header('Content-Length', '0')
+        handler.end_headers()
+    else:
+        send_body(handler, ARTICLE_HTML.encode('utf-8'), headers={'ETag': _ETAG})
+
+
+def _send_latin_1_without_charset(handler):
+    body = ARTICLE_HTML.replace('Russian President', 'Président russe').encode('latin-1')
+    handler.send_response(200)
+    handler.send_header('Content-Type', 'text/html')
+    handler.send_header('Content-Length', str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    routes = {
+        '/etag': _send_with_etag,
+        '/no-validator': lambda handler: send_body(handler, ARTICLE_HTML.encode('utf-8')),
+        '/latin-1': _send_latin_1_without_charset
+    }
+    with LocalHttpServer(routes) as local_server:
+        yield local_server
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = hc.HttpCache(str(tmp_path), max_bytes=1024 * 1024)
+    with mock.patch.object(hc, 'get_cache', return_value=cache):
+        yield cache
+
+
+class TestHttpCache:
+
+    def test_not_modified_page_is_revalidated_and_not_parsed_again(self, server: LocalHttpServer,
+                                                                  cache: hc.HttpCache):
+        """
+        Test if fetching a cached page sends its ETag, and if the 304 Not Modified response reuses the cached
+        title and text without parsing the page again.
+        """
+        expected_article = cwl.get_article_by_url(server.get_url('/etag'))
+        with mock.patch.object(Article, 'parse') as parse:
+            actual_article = cwl.get_article_by_url(server.get_url('/etag'))
+        parse.assert_not_called()
+        assert server.requests[-1][1].get('If-None-Match') == _ETAG
+        assert (actual_article.title, actual_article.text) == (expected_article.title, expected_article.text)
+
+    def test_unchanged_content_is_not_parsed_again(self, server: LocalHttpServer, cache: hc.HttpCache):
+        """
+        Test if a page downloaded again without validators is not parsed again when its content did not change.
+        """
+        expected_article = cwl.get_article_by_url(server.get_url('/no-validator'))
+        with mock.patch.object(Article, 'parse') as parse:
+            actual_article = cwl.get_article_by_url(server.get_url('/no-validator'))
+        parse.assert_not_called()
+        assert 'If-None-Match' not in server.requests[-1][1]
+        assert actual_article.text == expected_article.text and actual_article.is_parsed
+
+    def test_page_without_declared_charset_is_cached(self, server: LocalHttpServer, cache: hc.HttpCache):
+        """
+        Test if a latin-1 page declaring no charset (left undecoded for newspaper) is cached as received and not
+        parsed again.
+        """
+        expected_article = cwl.get_article_by_url(server.get_url('/latin-1'))
+        with mock.patch.object(Article, 'parse') as parse:
+            actual_article = cwl.get_article_by_url(server.get_url('/latin-1'))
+        parse.assert_not_called()
+        assert expected_article is not None and 'russe' in expected_article.text
+        assert actual_article.text == expected_article.text
+        assert cache.get(server.get_url('/latin-1')).content_hash == \
+               hc.get_content_hash(ARTICLE_HTML.replace('Russian President', 'Président russe').encode('latin-1'))
+
+    def test_least_recently_used_pages_are_evicted_beyond_quota(self, tmp_path):
+        """
+        Test if the least recently used pages are evicted once the cached files exceed the disk quota.
+        """
+        cache = hc.HttpCache(str(tmp_path), max_bytes=6000)
+        text = 'x' * 1700
+        for index in range(3):
+            cache.put(f'https://news.com/{index}', FetchedPage(f'https://news.com/{index}', 200, {}, b'body', 'body'),
+                      'title', text)
+            time.sleep(0.01)
+        cache.get('https://news.com/0')  # The first page becomes the most recently used one
+        cache.put('https://news.com/3', FetchedPage('https://news.com/3', 200, {}, b'body', 'body'), 'title', text)
+        assert [cache.get(f'https://news.com/{index}') is not None for index in range(4)] == [True, False, True, True]
+        assert sum(entry.stat().st_size for entry in os.scandir(str(tmp_path))) <= 6000
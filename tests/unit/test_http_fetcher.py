@@ -0,0 +1,154 @@
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+from services import crawler_service as cwl
+from services import http_cache as hc
+from services import http_fetcher as hf
+from tests.LocalHttpServer import ARTICLE_HTML, LocalHttpServer, send_body
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+def _send_slow_headers(handler):
+    time.sleep(1)
+    send_body(handler, b'late')
+
+
+def _send_trickled_body(handler):
+    handler.send_response(200)
+    handler.send_header('Content-Type', 'text/html; charset=utf-8')
+    handler.send_header('Content-Length', '200')
+    handler.end_headers()
+    for _ in range(20):
+        handler.wfile.write(b'x' * 10)
+        handler.wfile.flush()
+        time.sleep(0.1)
+
+
+def _send_trickled_closed_body(handler):
+    handler.send_response(200)
+    handler.send_header('Content-Type', 'text/html; charset=utf-8')
+    handler.send_header('Connection', 'close')
+    handler.end_headers()
+    for _ in range(20):
+        handler.wfile.write(b'x' * 10)
+        handler.wfile.flush()
+        time.sleep(0.1)
+    handler.close_connection = True
+
+
+def _send_trickled_headers(handler):
+    handler.send_response(200)
+    for index in range(20):
+        handler.send_header(f'X-Header-{index}', 'x')
+        handler.flush_headers()
+        time.sleep(0.1)
+    handler.send_header('Content-Length', '0')
+    handler.end_headers()
+
+
+def _send_unannounced_large_body(handler):
+    handler.send_response(200)
+    handler.send_header('Content-Type', 'text/html; charset=utf-8')
+    handler.send_header('Connection', 'close')
+    handler.end_headers()
+    handler.wfile.write(b'x' * 4096)
+    handler.close_connection = True
+
+
+@pytest.fixture
+def server():
+    routes = {
+        '/article': lambda handler: send_body(handler, ARTICLE_HTML.encode('utf-8')),
+        '/redirect': lambda handler: send_body(handler, b'', status=302, headers={'Location': '/article'}),
+        '/large': lambda handler: send_body(handler, b'x' * 4096),
+        '/unannounced-large': _send_unannounced_large_body,
+        '/slow-headers': _send_slow_headers,
+        '/trickled': _send_trickled_body,
+        '/trickled-close': _send_trickled_closed_body,
+        '/trickled-headers': _send_trickled_headers,
+        '/redirect-trickled-headers': lambda handler: send_body(handler, b'', status=302,
+                                                                headers={'Location': '/trickled-headers'})
+    }
+    with LocalHttpServer(routes) as local_server:
+        yield local_server
+
+
+@pytest.fixture
+def fetcher():
+    fetcher = hf.HttpFetcher(connect_timeout=1, read_timeout=0.5, total_timeout=1, max_body_bytes=1024,
+                             pool_hosts=2, pool_size=2)
+    yield fetcher
+    fetcher.close()
+
+
+class TestHttpFetcher:
+
+    def test_connections_are_kept_alive_across_fetches(self, server: LocalHttpServer):
+        """
+        Test if successive fetches of the same host reuse a single connection and follow the redirections.
+        """
+        fetcher = hf.HttpFetcher(connect_timeout=1, read_timeout=1, total_timeout=2, max_body_bytes=1024 * 1024,
+                                 pool_hosts=2, pool_size=2)
+        pages = [fetcher.fetch(server.get_url('/article')) for _ in range(3)] + \
+                [fetcher.fetch(server.get_url('/redirect'))]
+        fetcher.close()
+        assert all(page.html == ARTICLE_HTML for page in pages)
+        assert pages[-1].url == server.get_url('/article')
+        assert len(server.client_ports) == 1
+
+    def test_read_timeout_is_enforced(self, server: LocalHttpServer, fetcher: hf.HttpFetcher):
+        """
+        Test if a publisher not answering within the read timeout raises a requests Timeout.
+        """
+        with pytest.raises(requests.Timeout):
+            fetcher.fetch(server.get_url('/slow-headers'))
+
+    def test_total_timeout_is_enforced(self, server: LocalHttpServer, fetcher: hf.HttpFetcher):
+        """
+        Test if a publisher trickling its body faster than the read timeout is stopped by the total timeout, whether
+        the connection is kept alive or closed after the response.
+        """
+        fetcher.max_body_bytes = 1024 * 1024
+        for path in ['/trickled', '/trickled-close']:
+            start = time.monotonic()
+            with pytest.raises(hf.FetchError):
+                fetcher.fetch(server.get_url(path))
+            assert time.monotonic() - start < 1.5
+
+    def test_total_timeout_covers_headers_and_redirections(self, server: LocalHttpServer, fetcher: hf.HttpFetcher):
+        """
+        Test if a publisher trickling its response headers, after a redirection or not, is stopped by the total
+        timeout.
+        """
+        for path in ['/trickled-headers', '/redirect-trickled-headers']:
+            start = time.monotonic()
+            with pytest.raises(hf.FetchError):
+                fetcher.fetch(server.get_url(path))
+            assert time.monotonic() - start < 1.5
+
+    def test_max_body_size_is_enforced(self, server: LocalHttpServer, fetcher: hf.HttpFetcher):
+        """
+        Test if a body larger than the maximum body size raises a FetchError, whether its size is announced or not.
+        """
+        with pytest.raises(hf.FetchError):
+            fetcher.fetch(server.get_url('/large'))
+        with pytest.raises(hf.FetchError):
+            fetcher.fetch(server.get_url('/unannounced-large'))
+
+    def test_crawler_parses_fetched_page_with_newspaper(self, server: LocalHttpServer):
+        """
+        Test if the crawler parses the fetched page with newspaper and returns None for a missing page.
+        """
+        with mock.patch.object(hc, 'get_cache', return_value=None):
+            article = cwl.get_article_by_url(server.get_url('/article'))
+            missing_article = cwl.get_article_by_url(server.get_url('/missing'))
+        assert article.title == 'Local article title'
+        assert 'Vladimir Putin' in article.text
+        assert missing_article is None
@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks import bench_import_time as bit
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+def get_serving_path_forbidden_modules() -> list[str]:
+    """
+    Return the modules which must never be imported by the serving path (only needed by the training notebooks
+    and helpers, or not used at all).
+    :return: the names of the forbidden modules
+    """
+    return ['matplotlib', 'seaborn', 'langdetect', 'termcolor']
+
+
+class TestImportBudget:
+
+    def test_dependency_import_times_are_not_counted_twice(self):
+        """
+        Test if the import time of a dependency imported by another dependency is counted in its importer only,
+        and if the application modules are not counted.
+        """
+        lines = ['import time:       100 |        100 |     numpy.core',
+                 'import time:       200 |        300 |   numpy',
+                 'import time:        50 |        350 | ai.linear_scorer',
+                 'import time:        40 |         40 |   numpy.random',
+                 'import time:        10 |         50 | services.cache_service',
+                 'import time:        30 |         30 | json']
+        import_times = [bit._parse_import_time_line(line) for line in lines]
+        assert import_times[0] == ('numpy.core', 2, 0.1, 0.1)
+        dependency_times = bit.get_dependency_import_times(import_times)
+        assert dependency_times.keys() == {'numpy', 'json'}
+        assert dependency_times['numpy'] == pytest.approx(0.34)
+        assert dependency_times['json'] == pytest.approx(0.03)
+
+    def test_serving_path_does_not_import_forbidden_modules(self):
+        """
+        Test if importing the serving path modules does not import the modules only needed by the training helpers.
+        """
+        code = f'import sys, {", ".join(bit.SERVING_MODULES)}; print(",".join(sys.modules))'
+        process = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+        assert process.returncode == 0, process.stderr[-2000:]
+        imported_modules = {name.split('.')[0] for name in process.stdout.strip().split('\n')[-1].split(',')}
+        assert imported_modules.isdisjoint(get_serving_path_forbidden_modules())
+
+    def test_serving_path_dependencies_fit_in_import_time_budget(self):
+        """
+        Test if the cumulative import time of the serving path dependencies fits in the import time budget.
+        """
+        dependency_times = bit.get_dependency_import_times(bit.get_import_times(bit.SERVING_MODULES))
+        assert sum(dependency_times.values()) <= bit.get_import_time_budget_ms(), dependency_times
@@ -0,0 +1,96 @@
+import os
+import threading
+from unittest import mock
+
+import pandas as pd
+
+from ai.prediction_model import PredictionModel
+from ai.text_preprocessor import CachedLemmatizer
+from services import checker_service as chk
+from services import constants_service as ct
+from services import inference_executor as ie
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+# Lemmatizer whose cache lock is held by another thread while the inference worker processes are forked.
+_lemmatizer = CachedLemmatizer(max_entries=10)
+
+
+def _get_cached_lemma(word: str) -> str:
+    """
+    Return the cached lemma of the provided word (None if not cached), waiting for the lemma cache lock.
+    :param word: provided word
+    :return: the cached lemma or None
+    """
+    return _lemmatizer.cache.get((word, 'n'))
+
+
+class TestInferenceExecutor:
+
+    def test_pool_labels_match_in_thread_labels(self):
+        """
+        Test if scoring the sentences of an article through the inference worker processes returns the same labels,
+        in the same order, as scoring them in the calling thread.
+        """
+        model = PredictionModel()
+        article = pd.read_csv('./ai/dataset/articles.csv')['articles'][0]
+        sentences = article.split('.')
+        expected_labels = model.predict_many(sentences)
+        with mock.patch.dict(os.environ, {ct.get_inference_workers_env_variable_label(): '2'}):
+            actual_labels = ie.predict_many(model, sentences)
+        ie.shutdown()
+        assert actual_labels == expected_labels
+
+    def test_topics_are_extracted_by_worker_process_during_scoring(self):
+        """
+        Test if the topics of a checked document are extracted by an inference worker process, returning the same
+        topics as the calling thread along with the duration of both stages.
+        """
+        models = chk.get_models()
+        document = chk.analyze(pd.read_csv('./ai/dataset/articles.csv')['articles'][0], models)
+        expected_topics = chk.check_document_topic(document, models)
+        with mock.patch.dict(os.environ, {ct.get_inference_workers_env_variable_label(): '2'}), \
+                mock.patch.object(chk, 'check_document_topic') as check_document_topic:
+            _, actual_topics, durations = chk.check_document_and_topic(document, models)
+        ie.shutdown()
+        check_document_topic.assert_not_called()
+        assert actual_topics == expected_topics
+        assert list(durations.keys()) == ['truthfulness', 'topics']
+
+    def test_disabled_pool_scores_in_calling_thread(self):
+        """
+        Test if no worker process is created when the inference process pool is disabled.
+        """
+        model = PredictionModel()
+        with mock.patch.dict(os.environ, {ct.get_inference_workers_env_variable_label(): '0'}), \
+                mock.patch.object(ie, '_get_pool') as get_pool:
+            ie.predict_many(model, ['first sentence'] * 64)
+        get_pool.assert_not_called()
+
+    def test_worker_forked_while_lemma_cache_lock_is_held_does_not_hang(self):
+        """
+        Test if an inference worker process forked while another thread holds the lemma cache lock can still use
+        the lemma cache.
+        """
+        locked = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            with _lemmatizer.cache.lock:
+                locked.set()
+                release.wait(10)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        locked.wait(5)
+        try:
+            result = ie._get_pool(1).apply_async(_get_cached_lemma, ('word',)).get(timeout=5)
+        finally:
+            release.set()
+            holder.join()
+            ie.shutdown()
+        assert result is None
@@ -0,0 +1,95 @@
+import threading
+import time
+
+import pytest
+
+from services.inference_scheduler import InferenceScheduler
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class _StubModel:
+
+    def __init__(self, delay: float = 0.0):
+        """
+        Initialize a new _StubModel instance, recording the size of each predicted batch.
+        :param delay: number of seconds each prediction takes
+        """
+        self.delay = delay
+        self.batch_sizes = []
+
+    def predict_features(self, features: list[str]) -> list[str]:
+        """
+        Return the provided features upper-cased, as stub labels.
+        :param features: provided feature texts
+        :return: the stub labels
+        """
+        self.batch_sizes.append(len(features))
+        time.sleep(self.delay)
+        return [feature.upper() for feature in features]
+
+
+class TestInferenceScheduler:
+
+    def test_submit_returns_own_labels_to_each_concurrent_request(self):
+        """
+        Test if each concurrent request gets its own labels back, in the order of its own features.
+        """
+        scheduler = InferenceScheduler(max_batch_size=64, max_wait_ms=20)
+        model = _StubModel(delay=0.01)
+        results = {}
+
+        def submit(request_id: int):
+            features = [f'request{request_id}-sentence{i}' for i in range(request_id + 1)]
+            results[request_id] = (features, scheduler.submit(model.predict_features, features))
+
+        threads = [threading.Thread(target=submit, args=(request_id,)) for request_id in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for features, labels in results.values():
+            assert labels == [feature.upper() for feature in features]
+        assert len(model.batch_sizes) < 10  # Some requests were predicted together
+        assert max(model.batch_sizes) <= 64
+
+    def test_batches_never_exceed_max_batch_size(self):
+        """
+        Test if concurrent requests are never merged into a batch bigger than the maximum batch size.
+        """
+        scheduler = InferenceScheduler(max_batch_size=5, max_wait_ms=20)
+        model = _StubModel(delay=0.01)
+        threads = [threading.Thread(target=scheduler.submit, args=(model.predict_features, ['sentence'] * 2))
+                   for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sum(model.batch_sizes) == 20
+        assert max(model.batch_sizes) <= 5
+
+    def test_single_request_is_not_delayed_at_low_load(self):
+        """
+        Test if a single request is predicted without waiting for the maximum waiting time.
+        """
+        scheduler = InferenceScheduler(max_batch_size=64, max_wait_ms=1000)
+        model = _StubModel()
+        start = time.monotonic()
+        labels = scheduler.submit(model.predict_features, ['sentence'])
+        assert labels == ['SENTENCE']
+        assert time.monotonic() - start < 0.5
+
+    def test_prediction_error_is_raised_in_the_submitting_request(self):
+        """
+        Test if an exception raised while predicting a batch is raised back in the submitting request.
+        """
+        scheduler = InferenceScheduler(max_batch_size=64, max_wait_ms=0)
+
+        def failing_predict_features(features: list[str]) -> list[str]:
+            raise ValueError('prediction failed')
+
+        with pytest.raises(ValueError, match='prediction failed'):
+            scheduler.submit(failing_predict_features, ['sentence'])
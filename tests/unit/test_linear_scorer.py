@@ -0,0 +1,70 @@
+import pandas as pd
+import pytest
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import Pipeline
+from sklearn.svm import LinearSVC, SVC
+from sklearn.tree import DecisionTreeClassifier
+
+from ai.linear_scorer import compile_pipeline
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class TestLinearScorer:
+
+    # Attributes specified declaratively because constructors are forbidden when working with pytest.
+    articles = pd.read_csv('ai/dataset/articles.csv')['articles'].dropna().astype(str).tolist()[:200]
+    labels = [index % 2 for index in range(len(articles))]
+    sentences = [sentence for article in articles for sentence in article.split('.')][:2000]
+
+    def test_compiled_pipeline_predicts_like_training_pipeline(self):
+        """
+        Test if the scorer compiled from a pipeline shaped like the training one (n-grams counts, TF-IDF
+        and logistic regression) predicts exactly the same classes as the pipeline.
+        """
+        pipeline = Pipeline([
+            ('vect', CountVectorizer(ngram_range=(1, 3))),
+            ('tfidf', TfidfTransformer(norm='l2')),
+            ('clf', LogisticRegression(max_iter=200))
+        ])
+        pipeline.fit(self.articles, self.labels)
+        scorer = compile_pipeline(pipeline)
+        assert scorer is not None
+        assert scorer.predict(self.sentences).tolist() == pipeline.predict(self.sentences).tolist()
+
+    def test_compiled_pipeline_decision_function_matches_pipeline(self):
+        """
+        Test if the scores of a compiled TfidfVectorizer and linear SVM pipeline (sublinear and binary term
+        frequencies) match the pipeline decision function.
+        """
+        pipeline = Pipeline([('tfidf', TfidfVectorizer(sublinear_tf=True, binary=True)), ('clf', LinearSVC())])
+        pipeline.fit(self.articles, self.labels)
+        scorer = compile_pipeline(pipeline)
+        expected_scores = pipeline.decision_function(self.sentences[:200])
+        for sentence, expected_score in zip(self.sentences[:200], expected_scores):
+            assert scorer.decision_function(sentence) == pytest.approx(expected_score)
+
+    def test_text_without_known_terms_is_scored_with_intercept(self):
+        """
+        Test if an empty text or a text made of unknown terms only is scored like the pipeline (intercept only).
+        """
+        pipeline = Pipeline([('vect', CountVectorizer()), ('tfidf', TfidfTransformer()), ('clf', LogisticRegression())])
+        pipeline.fit(self.articles, self.labels)
+        scorer = compile_pipeline(pipeline)
+        texts = ['', 'zzzqqq xxyyzz']
+        assert scorer.predict(texts).tolist() == pipeline.predict(texts).tolist()
+
+    def test_non_linear_pipeline_is_not_compiled(self):
+        """
+        Test if a pipeline with a non-linear classifier (decision tree, naive Bayes or kernel SVM) is not compiled
+        (the sklearn pipeline must be used).
+        """
+        for classifier in [DecisionTreeClassifier(), MultinomialNB(), SVC(kernel='rbf')]:
+            pipeline = Pipeline([('vect', CountVectorizer()), ('clf', classifier)])
+            pipeline.fit(self.articles, self.labels)
+            assert compile_pipeline(pipeline) is None
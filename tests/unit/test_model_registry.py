@@ -0,0 +1,134 @@
+import os
+import threading
+from unittest import mock
+
+import pytest
+
+from services import model_registry as mr
+from services.model_registry import ModelBundle, ModelRegistry
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class _StubModel:
+
+    def __init__(self, version: str):
+        self.version = version
+        self.warmed_up = False
+
+    def get_version(self) -> str:
+        return self.version
+
+    def get_sentences(self, text: str) -> list[str]:
+        return [text]
+
+    def get_clean_and_pos_tagged_texts(self, texts: list[str]) -> list[str]:
+        return texts
+
+    def predict_features(self, features: list[str]) -> list[str]:
+        self.warmed_up = True
+        return ['REAL'] * len(features)
+
+    def predict(self, text: str) -> list[str]:
+        self.warmed_up = True
+        return ['Topic']
+
+
+def _get_bundle(version: str) -> ModelBundle:
+    return ModelBundle(_StubModel(version), _StubModel(version))
+
+
+class TestModelRegistry:
+
+    def test_unchanged_model_files_are_not_reloaded(self):
+        """
+        Test if the model files are not loaded again while they do not change.
+        """
+        registry = ModelRegistry(_get_bundle('v1'))
+        with mock.patch.object(mr, 'load_models') as load_models:
+            swapped = registry.reload()
+        assert not swapped
+        load_models.assert_not_called()
+
+    def test_new_version_is_warmed_up_and_swapped_in(self):
+        """
+        Test if a new model version is warmed up before being swapped in, and if the swap listeners are
+        called with it.
+        """
+        active_models = _get_bundle('v1')
+        new_models = _get_bundle('v2')
+        registry = ModelRegistry(active_models)
+        swapped_models = []
+        registry.add_swap_listener(swapped_models.append)
+        with mock.patch.object(mr, 'load_models', return_value=new_models):
+            swapped = registry.reload(force=True)
+        assert swapped
+        assert registry.get_models() is new_models
+        assert registry.get_version() == 'v2+v2'
+        assert new_models.model.warmed_up and new_models.model_topic.warmed_up
+        assert swapped_models == [new_models]
+
+    def test_same_version_is_not_swapped_in(self):
+        """
+        Test if reloading model files having the same version keeps the active models.
+        """
+        active_models = _get_bundle('v1')
+        registry = ModelRegistry(active_models)
+        with mock.patch.object(mr, 'load_models', return_value=_get_bundle('v1')):
+            swapped = registry.reload(force=True)
+        assert not swapped
+        assert registry.get_models() is active_models
+
+    def test_failed_loading_keeps_active_models(self):
+        """
+        Test if the active models keep serving when the new model files cannot be loaded.
+        """
+        active_models = _get_bundle('v1')
+        registry = ModelRegistry(active_models)
+        with mock.patch.object(mr, 'load_models', side_effect=EOFError('truncated pickle')):
+            with pytest.raises(EOFError):
+                registry.reload(force=True)
+            registry.reload_async().join()
+        assert registry.get_models() is active_models
+
+    def test_readers_only_see_complete_bundles_during_swaps(self):
+        """
+        Test if concurrent readers always get a complete bundle (both models of the same version) while new
+        versions are swapped in.
+        """
+        registry = ModelRegistry(_get_bundle('v0'))
+        seen_versions = set()
+        stop = threading.Event()
+
+        def read():
+            while not stop.is_set():
+                models = registry.get_models()
+                seen_versions.add((models.model.get_version(), models.model_topic.get_version()))
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for version in range(1, 20):
+            with mock.patch.object(mr, 'load_models', return_value=_get_bundle(f'v{version}')):
+                registry.reload(force=True)
+        stop.set()
+        for reader in readers:
+            reader.join()
+        assert all(model_version == topic_version for model_version, topic_version in seen_versions)
+
+    def test_locks_held_at_fork_are_released_in_child(self):
+        """
+        Test if the registry locks held when the process forks (a reload running during a gunicorn --preload fork)
+        can be acquired in the forked process.
+        """
+        registry = ModelRegistry(_get_bundle('v1'))
+        with registry.reload_lock:
+            pid = os.fork()
+            if pid == 0:
+                os._exit(0 if registry.reload_lock.acquire(timeout=1) and registry.watcher_lock.acquire(timeout=1)
+                         else 1)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
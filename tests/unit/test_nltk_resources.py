@@ -0,0 +1,62 @@
+import os
+import zipfile
+from unittest import mock
+
+import nltk
+import pytest
+
+from ai import nltk_resources as nr
+from services import constants_service as ct
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+def _install(data_directory: str, resource_paths: list[str]):
+    """
+    Create the directories of the provided NLTK resources, as installed by the NLTK downloader.
+    :param data_directory: NLTK data directory
+    :param resource_paths: paths of the installed resources, relative to the NLTK data directory
+    """
+    for resource_path in resource_paths:
+        os.makedirs(os.path.join(data_directory, resource_path))
+
+
+class TestNltkResources:
+
+    def test_missing_packages_are_reported_exactly(self, tmp_path):
+        """
+        Test if only the required packages absent from the local NLTK data directory are reported as missing,
+        without any download.
+        """
+        _install(str(tmp_path), ['corpora/stopwords', 'tokenizers/punkt', 'taggers/averaged_perceptron_tagger'])
+        with mock.patch.dict(os.environ, {ct.get_nltk_data_directory_env_variable_label(): str(tmp_path)}), \
+                mock.patch.object(nltk.data, 'path', []), \
+                mock.patch.object(nr, '_verified', False), \
+                mock.patch.object(nltk, 'download') as download:
+            with pytest.raises(nr.MissingNltkResourcesError) as error:
+                nr.ensure_resources()
+        assert error.value.missing_packages == ['wordnet', 'omw-1.4']
+        assert 'wordnet, omw-1.4' in str(error.value)
+        download.assert_not_called()
+
+    def test_installed_packages_are_verified_once(self, tmp_path):
+        """
+        Test if the resources are verified once only when every required package is installed, zipped
+        packages included.
+        """
+        _install(str(tmp_path), ['corpora/stopwords', 'corpora/omw-1.4', 'tokenizers/punkt',
+                                 'taggers/averaged_perceptron_tagger'])
+        with zipfile.ZipFile(os.path.join(str(tmp_path), 'corpora', 'wordnet.zip'), 'w') as wordnet_zip:
+            wordnet_zip.writestr('wordnet/', '')
+        with mock.patch.dict(os.environ, {ct.get_nltk_data_directory_env_variable_label(): str(tmp_path)}), \
+                mock.patch.object(nltk.data, 'path', []), \
+                mock.patch.object(nr, '_verified', False), \
+                mock.patch.object(nltk, 'download') as download:
+            nr.ensure_resources()
+            with mock.patch.object(nr, 'get_missing_packages') as get_missing_packages:
+                nr.ensure_resources()
+        get_missing_packages.assert_not_called()
+        download.assert_not_called()
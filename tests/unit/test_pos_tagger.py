@@ -0,0 +1,39 @@
+import nltk
+
+from ai import pos_tagger
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class TestPosTagger:
+
+    # Attribute specified declaratively because constructors are forbidden when working with pytest.
+    valid_token_lists = [
+        ['russian', 'president', 'vladimir', 'putin', 'say', 'list', 'official'],
+        ['list', 'name', 'top', 'russians', 'part', 'sanction', 'law'],
+        [],
+    ]
+
+    def test_get_tagger_returns_same_instance(self):
+        """
+        Test if the process-wide tagger is loaded only once and then reused.
+        """
+        assert pos_tagger.get_tagger() is pos_tagger.get_tagger()
+
+    def test_tag_matches_nltk_pos_tag(self):
+        """
+        Test if tagging tokens with the process-wide tagger returns the same tags as nltk.pos_tag.
+        """
+        for tokens in self.valid_token_lists:
+            assert pos_tagger.tag(tokens) == nltk.pos_tag(tokens)
+
+    def test_tag_many_matches_tag(self):
+        """
+        Test if tagging token lists in bulk returns the same tags as tagging each token list separately.
+        """
+        expected_tagged_lists = [pos_tagger.tag(tokens) for tokens in self.valid_token_lists]
+        actual_tagged_lists = pos_tagger.tag_many(self.valid_token_lists)
+        assert actual_tagged_lists == expected_tagged_lists
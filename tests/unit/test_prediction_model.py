@@ -0,0 +1,154 @@
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import nltk
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+
+from ai import artifacts as ma
+from ai import prediction_model as pm
+from ai import python_helper as ph
+from ai.prediction_model import PredictionModel
+from ai.topic_model import TopicModel
+from services import constants_service as ct
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class TestPredictionModel:
+
+    # Attributes specified declaratively because constructors are forbidden when working with pytest.
+    valid_texts = [
+        'Russian President Vladimir Putin says a list of officials published by the US has targeted all Russians',
+        'The list names top Russians as part of a sanctions law aimed at punishing Moscow',
+        'However, the US stressed those named were not subject to new sanctions',
+        'Mr Putin said the list was an unfriendly act that complicated ties',
+    ]
+
+    def test_predict_returns_truthfulness_label(self):
+        """
+        Test if predicting a text returns one of the truthfulness labels.
+        """
+        expected_truthfulness_labels = [ct.get_truthfulness_label(), ct.get_wrongness_label()]
+        actual_truthfulness_label = PredictionModel().predict(self.valid_texts[0])
+        assert actual_truthfulness_label in expected_truthfulness_labels
+
+    def test_predict_does_not_mutate_model_state(self):
+        """
+        Test if predicting texts leaves the model instance state untouched.
+        """
+        model = PredictionModel()
+        expected_state = dict(vars(model))
+        model.predict(self.valid_texts[0])
+        model.predict_many(self.valid_texts)
+        assert vars(model) == expected_state
+
+    def test_predict_many_matches_predict(self):
+        """
+        Test if predicting a list of texts returns the same labels as predicting each text separately.
+        """
+        model = PredictionModel()
+        expected_labels = [model.predict(text) for text in self.valid_texts]
+        actual_labels = model.predict_many(self.valid_texts)
+        assert actual_labels == expected_labels
+
+    def test_artifacts_converted_from_another_pickle_are_not_loaded(self, tmp_path):
+        """
+        Test if the pipeline artifacts are only loaded if converted from the deployed pickle, the pickle being loaded
+        otherwise (e.g. retrained pipeline deployed without converting it again).
+        """
+        pipeline = Pipeline([('vect', CountVectorizer()), ('tfidf', TfidfTransformer()), ('clf', LogisticRegression())])
+        pipeline.fit(self.valid_texts, [0, 1, 0, 1])
+        pickle_path, pipeline_directory = str(tmp_path / 'pipeline.pkl'), str(tmp_path / 'pipeline')
+        with open(pickle_path, 'wb') as f:
+            f.write(pickle.dumps(pipeline))
+        with open(pickle_path, 'rb') as f:
+            expected_version = ma.get_pickle_version(f.read())
+        ma.save_pipeline(pipeline, 'outdated', pipeline_directory)
+        predictor, actual_version = pm.load_predictor(pickle_path, pipeline_directory)
+        assert actual_version == expected_version and not isinstance(predictor.coef, np.memmap)
+        ma.save_pipeline(pipeline, expected_version, pipeline_directory)
+        predictor, actual_version = pm.load_predictor(pickle_path, pipeline_directory)
+        assert actual_version == expected_version and isinstance(predictor.coef, np.memmap)
+
+    def test_exact_compatibility_features_match_double_tagging_pass(self):
+        """
+        Test if the exact compatibility mode builds the same features as pre-processing the text and then
+        tokenizing and position tagging the pre-processed text a second time.
+        """
+        model = PredictionModel(exact_compatibility=True)
+        preprocessed_text = pm.preprocessor.preprocess(self.valid_texts[0])
+        pos_text = nltk.pos_tag(nltk.word_tokenize(preprocessed_text))
+        expected_features = preprocessed_text + ' ' + ' '.join([pos + '-' + word for word, pos in pos_text])
+        actual_features = model.get_clean_and_pos_tagged_text(self.valid_texts[0])
+        assert actual_features == expected_features
+
+    def test_single_tagging_pass_features_reuse_preprocessing_tags(self):
+        """
+        Test if the single tagging pass mode prefixes each lemma with the tag computed during pre-processing.
+        """
+        model = PredictionModel(exact_compatibility=False)
+        lemma_tags = pm.preprocessor.tag(self.valid_texts[0])
+        expected_features = ' '.join([lemma for lemma, _ in lemma_tags]) + ' ' \
+            + ' '.join([pos + '-' + lemma for lemma, pos in lemma_tags])
+        actual_features = model.get_clean_and_pos_tagged_text(self.valid_texts[0])
+        assert actual_features == expected_features
+
+    def test_single_tagging_pass_features_match_training_helper(self):
+        """
+        Test if the single tagging pass mode builds the same features as the training helper building the features
+        of a pipeline retrained for it.
+        """
+        model = PredictionModel(exact_compatibility=False)
+        for text in self.valid_texts:
+            assert model.get_clean_and_pos_tagged_text(text) == ' '.join(ph.preprocess_and_pos_tag(text))
+
+    def test_exact_compatibility_is_set_by_environment_variable(self):
+        """
+        Test if the exact compatibility mode is enabled by default and disabled by its environment variable.
+        """
+        with mock.patch.dict(os.environ, {ct.get_exact_pos_tagging_env_variable_label(): 'false'}):
+            assert not PredictionModel().exact_compatibility
+        with mock.patch.dict(os.environ):
+            os.environ.pop(ct.get_exact_pos_tagging_env_variable_label(), None)
+            assert PredictionModel().exact_compatibility
+
+    def test_single_tagging_pass_does_not_tokenize_preprocessed_text(self):
+        """
+        Test if the single tagging pass mode never tokenizes nor tags the pre-processed text a second time.
+        """
+        model = PredictionModel(exact_compatibility=False)
+        with mock.patch.object(model, 'pos_tag_words_many') as pos_tag_words_many:
+            model.get_clean_and_pos_tagged_text(self.valid_texts[0])
+        pos_tag_words_many.assert_not_called()
+
+    def test_concurrent_predictions_match_sequential_predictions(self):
+        """
+        Test if a single model instance shared by concurrent threads returns the same labels
+        as sequential predictions.
+        """
+        model = PredictionModel()
+        texts = self.valid_texts * 8
+        expected_labels = [model.predict(text) for text in texts]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            actual_labels = list(executor.map(model.predict, texts))
+        assert actual_labels == expected_labels
+
+    def test_concurrent_topic_predictions_match_sequential_predictions(self):
+        """
+        Test if a single topic model instance shared by concurrent threads returns the same topics
+        as sequential predictions.
+        """
+        model_topic = TopicModel()
+        texts = self.valid_texts * 8
+        expected_topics = [model_topic.predict(text) for text in texts]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            actual_topics = list(executor.map(model_topic.predict, texts))
+        assert actual_topics == expected_topics
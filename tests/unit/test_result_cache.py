@@ -0,0 +1,72 @@
+from unittest import mock
+
+from entities.data.CheckerResultData import CheckerResultData
+from services import result_cache_service as rc
+from services.cache_service import LruCache
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class TestResultCache:
+
+    # Attributes specified declaratively because constructors are forbidden when working with pytest.
+    valid_url = 'https://www.example.com/news/article?id=42'
+    valid_result = CheckerResultData('valid_title', 0.75, ['Topic'])
+
+    def test_canonicalize_url_lowers_scheme_and_host_only(self):
+        """
+        Test if canonicalizing an URL lowers its scheme and host but keeps its path case.
+        """
+        expected_url = 'https://www.example.com/News/Article'
+        actual_url = rc.canonicalize_url('HTTPS://WWW.Example.COM/News/Article')
+        assert actual_url == expected_url
+
+    def test_canonicalize_url_removes_tracking_parameters_and_fragment(self):
+        """
+        Test if canonicalizing an URL removes its fragment and its tracking query parameters
+        but keeps the other query parameters in their original order.
+        """
+        expected_url = 'https://example.com/news?b=2&a=1'
+        actual_url = rc.canonicalize_url('https://example.com/news?utm_source=x&b=2&fbclid=y&a=1&UTM_Medium=z#top')
+        assert actual_url == expected_url
+
+    def test_canonicalize_url_adds_root_path(self):
+        """
+        Test if canonicalizing an URL without path gives the same URL as with the root path.
+        """
+        assert rc.canonicalize_url('https://example.com') == rc.canonicalize_url('https://example.com/')
+
+    def test_get_result_of_tracked_url_variant_returns_cached_result(self):
+        """
+        Test if a result cached for an URL is returned for the same URL with tracking parameters and a fragment.
+        """
+        rc.result_cache.clear()
+        rc.put_result('v1', self.valid_url, self.valid_result)
+        actual_result = rc.get_result('v1', 'HTTPS://www.example.com/news/article?id=42&utm_campaign=rss#comments')
+        assert actual_result is self.valid_result
+
+    def test_get_result_of_other_model_version_returns_none(self):
+        """
+        Test if a result cached by another model version is never returned.
+        """
+        rc.result_cache.clear()
+        rc.put_result('v1', self.valid_url, self.valid_result)
+        actual_result = rc.get_result('v2', self.valid_url)
+        assert actual_result is None
+
+    def test_get_expired_entry_returns_none(self):
+        """
+        Test if a cached entry is not returned anymore once its TTL has elapsed and is counted as an expiration.
+        """
+        cache = LruCache(max_entries=10, ttl=60)
+        with mock.patch('services.cache_service.time.monotonic', return_value=1000):
+            cache.put('key', 'value')
+        with mock.patch('services.cache_service.time.monotonic', return_value=1059):
+            assert cache.get('key') == 'value'
+        with mock.patch('services.cache_service.time.monotonic', return_value=1060):
+            assert cache.get('key') is None
+        assert cache.get_stats()['expirations'] == 1
+        assert cache.get_stats()['size'] == 0
@@ -0,0 +1,74 @@
+import os
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from services import constants_service as ct
+from services import stage_executor as se
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+def _sleep_and_return(value: str, seconds: float = 0.2):
+    """
+    Sleep, then return the provided value and the name of the thread running the stage.
+    :param value: value returned by the stage
+    :param seconds: number of seconds to sleep
+    :return: the provided value and the name of the current thread
+    """
+    time.sleep(seconds)
+    return value, threading.current_thread().name
+
+
+class TestStageExecutor:
+
+    def test_stages_run_at_the_same_time(self):
+        """
+        Test if the stages run at the same time (the first one in the calling thread) and if their results and
+        durations are returned by stage name.
+        """
+        second_started = threading.Event()
+
+        def second():
+            second_started.set()
+            return _sleep_and_return('b')
+
+        with mock.patch.dict(os.environ, {ct.get_stage_workers_env_variable_label(): '1'}):
+            results, durations = se.run_stages({'first': lambda: (second_started.wait(5),) + _sleep_and_return('a'),
+                                                'second': second})
+        assert results['first'] == (True, 'a', threading.current_thread().name)
+        assert results['second'][0] == 'b' and results['second'][1] != threading.current_thread().name
+        assert list(durations.keys()) == ['first', 'second']
+        assert all(duration >= 200 for duration in durations.values())
+
+    def test_stages_run_one_after_the_other_when_disabled(self):
+        """
+        Test if the stages run one after the other in the calling thread when the stage threads are disabled.
+        """
+        with mock.patch.dict(os.environ, {ct.get_stage_workers_env_variable_label(): '0'}):
+            results, _ = se.run_stages({'first': lambda: _sleep_and_return('a', 0.05),
+                                        'second': lambda: _sleep_and_return('b', 0.05)})
+        assert [thread_name for _, thread_name in results.values()] == [threading.current_thread().name] * 2
+
+    def test_stage_error_is_raised_once_every_stage_ended(self):
+        """
+        Test if an error raised by a stage is raised by run_stages, after the other stages have ended.
+        """
+        ended = threading.Event()
+
+        def fail():
+            raise ValueError('stage failed')
+
+        def slow():
+            time.sleep(0.1)
+            ended.set()
+
+        with mock.patch.dict(os.environ, {ct.get_stage_workers_env_variable_label(): '2'}):
+            with pytest.raises(ValueError):
+                se.run_stages({'first': fail, 'second': slow})
+        assert ended.is_set()
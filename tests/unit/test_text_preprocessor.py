@@ -0,0 +1,113 @@
+import string
+
+import pandas as pd
+from nltk import pos_tag, word_tokenize
+from nltk.corpus import stopwords
+from nltk.stem import WordNetLemmatizer
+
+from ai import prediction_model as pm
+from ai.text_preprocessor import CachedLemmatizer, get_wordnet_pos
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+def _legacy_preprocess(text: str) -> str:
+    """
+    Return the provided text pre-processed the way the training notebook (and the first PredictionModel versions)
+    did it, used as reference for the pre-processing engine output.
+    :param text: provided text to pre-process
+    :return: the pre-processed text
+    """
+    text = str(text).lower()  # lowercase the text
+    text = [t for t in text.split(' ') if len(t) > 1]  # remove the words counting just one letter
+    text = [word for word in text if not any(c.isdigit() for c in word)]  # remove the words that contain numbers
+    text = [word.strip(string.punctuation) for word in text]  # tokenize the text and remove puncutation
+    stop = stopwords.words('english')  # remove all stop words
+    text = [x for x in text if x not in stop]
+    text = [t for t in text if len(t) > 0]  # remove tokens that are empty
+    pos_tags = pos_tag(text)  # pos tag the text
+    text = [WordNetLemmatizer().lemmatize(t[0], get_wordnet_pos(t[1])) for t in pos_tags]
+    return ' '.join(text)  # join all
+
+
+class TestTextPreprocessor:
+
+    def test_preprocess_matches_legacy_preprocess_on_articles_dataset(self):
+        """
+        Test if the pre-processing engine returns byte-identical texts to the legacy pre-processing
+        on every article of the articles dataset.
+        """
+        df = pd.read_csv('./ai/dataset/articles.csv')
+        for article in df['articles']:
+            expected_text = _legacy_preprocess(article)
+            actual_text = pm.preprocessor.preprocess(article)
+            assert actual_text.encode('utf-8') == expected_text.encode('utf-8')
+
+    def test_preprocess_removes_short_numeric_and_stop_words(self):
+        """
+        Test if the pre-processing engine removes one letter words, words containing numbers,
+        stop words and surrounding punctuation.
+        """
+        expected_text = 'cat'
+        actual_text = pm.preprocessor.preprocess('A "cat", 42 the b4 !')
+        assert actual_text == expected_text
+
+    def test_preprocess_of_empty_text_returns_empty_text(self):
+        """
+        Test if pre-processing an empty text returns an empty text.
+        """
+        expected_text = ''
+        actual_text = pm.preprocessor.preprocess('')
+        assert actual_text == expected_text
+
+    def test_lemma_cache_reports_hits_for_repeated_tokens(self):
+        """
+        Test if lemmatizing the same (token, position) twice hits the lemma cache and returns the same lemma.
+        """
+        lemmatizer = CachedLemmatizer(max_entries=10)
+        expected_lemma = WordNetLemmatizer().lemmatize('sanctions', 'n')
+        first_lemma = lemmatizer.lemmatize('sanctions', 'n')
+        second_lemma = lemmatizer.lemmatize('sanctions', 'n')
+        assert first_lemma == second_lemma == expected_lemma
+        assert lemmatizer.get_stats()['misses'] == 1
+        assert lemmatizer.get_stats()['hits'] == 1
+
+    def test_lemma_cache_evicts_beyond_its_size(self):
+        """
+        Test if the lemma cache never keeps more lemmas than its configured size and counts its evictions.
+        """
+        lemmatizer = CachedLemmatizer(max_entries=2)
+        for word in ['officials', 'sanctions', 'laws']:
+            lemmatizer.lemmatize(word, 'n')
+        assert lemmatizer.get_stats()['size'] == 2
+        assert lemmatizer.get_stats()['evictions'] == 1
+
+    def test_segment_does_not_split_abbreviations_and_decimals(self):
+        """
+        Test if segmenting a text keeps abbreviations and decimal numbers inside their sentence.
+        """
+        expected_sentences = ['The U.S. economy grew by 2.5 percent last year.', 'Markets rallied.']
+        actual_sentences = pm.preprocessor.segment('The U.S. economy grew by 2.5 percent last year. Markets rallied.')
+        assert actual_sentences == expected_sentences
+
+    def test_segment_drops_fragments_without_tokens(self):
+        """
+        Test if segmenting a text drops the fragments having no token left once pre-processed.
+        """
+        expected_sentences = ['Markets rallied.']
+        actual_sentences = pm.preprocessor.segment('It is. Markets rallied. And so it was.')
+        assert actual_sentences == expected_sentences
+
+    def test_analyzed_document_shares_segmentation_with_both_models(self):
+        """
+        Test if the analyzed document gives the same sentences as the segmentation and the same word tokens as
+        nltk.word_tokenize, from a single sentence segmentation.
+        """
+        text = 'The U.S. economy grew by 2.5 percent last year. It is. Markets rallied, didn\'t they?'
+        document = pm.preprocessor.analyze(text)
+        assert document.get_text() == text
+        assert document.get_sentences() == pm.preprocessor.segment(text)
+        assert document.get_words() == word_tokenize(text)
@@ -0,0 +1,104 @@
+import pickle
+from unittest import mock
+
+from gensim.corpora import Dictionary
+from gensim.models import LdaModel
+import numpy as np
+import pytest
+
+from ai import artifacts as ma
+from ai import prediction_model as pm
+from ai import topic_model as tm
+
+from ai.topic_model import TopicModel, get_main_topic, get_topic_label
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+@pytest.fixture(scope='module')
+def model_topic() -> TopicModel:
+    return TopicModel()
+
+
+class TestTopicModel:
+
+    def test_topic_labels_are_cleaned_most_relevant_words(self, model_topic: TopicModel):
+        """
+        Test if the label of each topic is its cleaned most relevant word.
+        """
+        assert get_topic_label('0.022*"us" + 0.011*"government" + 0.011*"uk"') == 'Us'
+        topics = model_topic.lda_model.show_topics(num_topics=model_topic.num_topics, num_words=1, formatted=False)
+        assert model_topic.topic_labels == {topic_id: words[0][0].capitalize() for topic_id, words in topics}
+
+    def test_every_topic_of_larger_model_has_label(self):
+        """
+        Test if every topic of a (reloaded) LDA model with more topics than the default one gets a label, so that any
+        main topic can be predicted.
+        """
+        texts = [['police', 'government', 'uk'], ['election', 'president', 'vote'], ['market', 'bank', 'economy'],
+                 ['football', 'match', 'goal'], ['virus', 'health', 'hospital'], ['climate', 'energy', 'carbon']]
+        dictionary = Dictionary(texts)
+        lda_model = LdaModel([dictionary.doc2bow(text) for text in texts], id2word=dictionary, num_topics=12,
+                             random_state=0)
+        model_topic = TopicModel(lda_model=lda_model, dictionary=dictionary, version='larger')
+        assert set(model_topic.topic_labels) == set(range(12))
+        with mock.patch('ai.topic_model.get_main_topic', return_value=11):
+            assert model_topic.predict_words(['bank', 'market']) == [model_topic.topic_labels[11]]
+
+    def test_artifacts_converted_from_other_pickles_are_not_loaded(self, tmp_path):
+        """
+        Test if the topic model artifacts are only loaded if converted from the deployed pickles, the pickles being
+        loaded otherwise (e.g. retrained topic model deployed without converting it again).
+        """
+        texts = [['police', 'government', 'uk'], ['election', 'president', 'vote'], ['market', 'bank', 'economy']]
+        dictionary = Dictionary(texts)
+        lda_model = LdaModel([dictionary.doc2bow(text) for text in texts], id2word=dictionary, num_topics=2,
+                             random_state=0)
+        dictionary_bytes, lda_model_bytes = pickle.dumps(dictionary), pickle.dumps(lda_model)
+        dictionary_path, lda_model_path = str(tmp_path / 'dictionary.pkl'), str(tmp_path / 'lda_model.pkl')
+        with open(dictionary_path, 'wb') as f:
+            f.write(dictionary_bytes)
+        with open(lda_model_path, 'wb') as f:
+            f.write(lda_model_bytes)
+        expected_version = ma.get_pickle_version(dictionary_bytes + lda_model_bytes)
+        topic_model_directory = str(tmp_path / 'topic')
+        ma.save_topic_model(lda_model, dictionary, 'outdated', topic_model_directory)
+        _, actual_dictionary, actual_version = tm.load_topic_model(dictionary_path, lda_model_path,
+                                                                   topic_model_directory)
+        assert actual_version == expected_version and isinstance(actual_dictionary, Dictionary)
+        ma.save_topic_model(lda_model, dictionary, expected_version, topic_model_directory)
+        _, actual_dictionary, actual_version = tm.load_topic_model(dictionary_path, lda_model_path,
+                                                                   topic_model_directory)
+        assert actual_version == expected_version and isinstance(actual_dictionary, ma.MappedVocabulary)
+
+    def test_topic_labels_are_not_computed_by_predictions(self, model_topic: TopicModel):
+        """
+        Test if predicting the topic of a text only looks its label up, without formatting the model topics again.
+        """
+        with mock.patch.object(model_topic.lda_model, 'show_topics') as show_topics:
+            actual_topics = model_topic.predict('The government of the UK answered the questions of the police.')
+        show_topics.assert_not_called()
+        assert len(actual_topics) == 1 and actual_topics[0] in model_topic.topic_labels.values()
+
+    def test_main_topic_has_highest_rounded_weight(self):
+        """
+        Test if the main topic is the one with the highest weight rounded to 2 decimals, the first one winning ties.
+        """
+        assert get_main_topic([(0, 0.1), (3, 0.52), (5, 0.38)]) == 3
+        assert get_main_topic([(1, 0.451), (4, 0.454), (6, 0.095)]) == 1
+        assert get_main_topic([(2, 1.0)]) == 2
+
+    def test_document_topics_match_text_topics(self, model_topic: TopicModel):
+        """
+        Test if the topics extracted from an analyzed document are the same as the ones extracted from its text.
+        """
+        text = 'Russian President Vladimir Putin says a list of officials published by the US has targeted ' \
+               'all Russian people. The list names 210 top Russians as part of a sanctions law.'
+        with mock.patch.object(model_topic.lda_model, 'random_state', np.random.RandomState(0)):
+            expected_topics = model_topic.predict(text)
+        with mock.patch.object(model_topic.lda_model, 'random_state', np.random.RandomState(0)):
+            actual_topics = model_topic.predict_document(pm.preprocessor.analyze(text))
+        assert actual_topics == expected_topics
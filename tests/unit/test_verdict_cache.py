@@ -0,0 +1,56 @@
+from unittest import mock
+
+from services import checker_service as chk
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class TestVerdictCache:
+
+    # Attribute specified declaratively because constructors are forbidden when working with pytest.
+    valid_sentences = [
+        'Image copyright PA/EPA Image caption Oligarch Roman Abramovich and PM Dmitry Medvedev are on the list',
+        'Russian President Vladimir Putin says a list of officials has targeted all Russian people',
+        'image copyright  PA/EPA Image caption Oligarch Roman Abramovich and PM Dmitry Medvedev are on the list ',
+    ]
+
+    def test_normalized_variants_share_the_same_key(self):
+        """
+        Test if two sentences only differing by their case and spaces share the same cache key.
+        """
+        first_key = chk._get_verdict_cache_key('v1', self.valid_sentences[0])
+        second_key = chk._get_verdict_cache_key('v1', self.valid_sentences[2])
+        assert first_key == second_key
+
+    def test_model_version_is_part_of_the_key(self):
+        """
+        Test if the same sentence gets different cache keys for different model versions.
+        """
+        first_key = chk._get_verdict_cache_key('v1', self.valid_sentences[0])
+        second_key = chk._get_verdict_cache_key('v2', self.valid_sentences[0])
+        assert first_key != second_key
+
+    def test_cached_labels_match_uncached_labels(self):
+        """
+        Test if the labels returned through the verdict cache equal the labels predicted without any cache.
+        """
+        chk.verdict_cache.clear()
+        expected_labels = chk.get_models().model.predict_many(self.valid_sentences)
+        first_labels = chk._get_truthfulness_labels(self.valid_sentences)
+        second_labels = chk._get_truthfulness_labels(self.valid_sentences)
+        assert first_labels == second_labels == expected_labels
+
+    def test_repeated_sentences_are_predicted_once(self):
+        """
+        Test if sentences already cached, or repeated in the same batch, are not sent to the model again.
+        """
+        chk.verdict_cache.clear()
+        with mock.patch.object(chk.get_models().model, 'predict_many', wraps=chk.get_models().model.predict_many) as predict_many:
+            chk._get_truthfulness_labels(self.valid_sentences)
+            chk._get_truthfulness_labels(self.valid_sentences)
+        assert predict_many.call_count == 2
+        assert len(predict_many.call_args_list[0].args[0]) == 2  # Third sentence normalizes to the first one
+        assert len(predict_many.call_args_list[1].args[0]) == 0
@@ -0,0 +1,70 @@
+from unittest import mock
+
+from services import model_registry as mr
+from services import warm_up_service as ws
+import gc
+
+
+# Enable automatic garbage collection
+gc.enable()
+
+
+class _StubModels:
+
+    def warm_up(self) -> dict[str, float]:
+        return {'sentence_segmentation': 1.0, 'topic_prediction': 2.0}
+
+    def get_version(self) -> str:
+        return 'v1'
+
+
+def _get_initial_report() -> dict:
+    return {'models_ready': False, 'database_ready': False, 'durations_ms': {}, 'errors': {}}
+
+
+class TestWarmUp:
+
+    def test_warm_up_reports_ready_with_stage_durations(self):
+        """
+        Test if the process is ready once the models are warmed up and the database reached, and if the report
+        contains the duration of every stage.
+        """
+        with mock.patch.dict(ws._report, _get_initial_report()), \
+                mock.patch.object(mr.registry, 'models', _StubModels()), \
+                mock.patch.object(ws, 'ping_db'):
+            assert not ws.is_ready()
+            report = ws.warm_up()
+            assert ws.is_ready()
+        assert report['ready']
+        assert report['model_version'] == 'v1'
+        assert list(report['durations_ms']) == ['sentence_segmentation', 'topic_prediction', 'database_connection']
+        assert all('hits' in stats and 'misses' in stats for stats in report['caches'].values())
+
+    def test_unreachable_database_is_not_ready_until_reached(self):
+        """
+        Test if the process is not ready while the database cannot be reached, and becomes ready once it can.
+        """
+        with mock.patch.dict(ws._report, _get_initial_report()), \
+                mock.patch.object(mr.registry, 'models', _StubModels()):
+            with mock.patch.object(ws, 'ping_db', side_effect=ConnectionError('refused')):
+                report = ws.warm_up()
+                assert not ws.is_ready()
+            assert report['models_ready'] and not report['database_ready']
+            assert 'database' in report['errors']
+            with mock.patch.object(ws, 'ping_db'):
+                assert ws.is_ready()
+            assert ws.get_report()['errors'] == {}
+
+    def test_failed_models_warm_up_is_not_ready(self):
+        """
+        Test if the process is not ready when the models cannot be warmed up.
+        """
+        failing_models = mock.Mock()
+        failing_models.warm_up.side_effect = LookupError('punkt not found')
+        with mock.patch.dict(ws._report, _get_initial_report()), \
+                mock.patch.object(mr.registry, 'models', failing_models), \
+                mock.patch.object(ws, 'ping_db'):
+            report = ws.warm_up()
+            assert not ws.is_ready()
+        assert not report['ready']
+        assert 'models' in report['errors']